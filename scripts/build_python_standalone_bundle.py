@@ -234,6 +234,11 @@ def install_application(python_bin, site_packages, wheelhouse):
     run(command)
 
 
+def compile_site_packages(python_bin, site_packages):
+    """Precompile bundled modules so cron-launched commands skip bytecode compilation."""
+    run([str(python_bin), "-m", "compileall", "-q", "-j", "0", str(site_packages)])
+
+
 def write_launcher(dist_root):
     """Write the relocatable landingzones launcher."""
     launcher = dist_root / "landingzones"
@@ -327,6 +332,7 @@ def main(argv=None):
 
     ensure_pip(bundle_python)
     install_application(bundle_python, dist_root / "site-packages", args.wheelhouse)
+    compile_site_packages(bundle_python, dist_root / "site-packages")
     write_launcher(dist_root)
     write_readme(dist_root)
     archive_path = create_tarball(dist_root)
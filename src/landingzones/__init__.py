@@ -16,4 +16,42 @@ __all__ = [
     'cli',
     'generate_cron_files',
     'check_deployment_readiness',
+    'YamlLoader',
+    'load_yaml_file',
+    'parse_yaml_file',
 ]
+
+# Submodules and helpers are resolved on first attribute access (PEP 562) so
+# `import landingzones` stays cheap for short-lived cron and CLI invocations.
+_LAZY_SUBMODULES = frozenset([
+    'config',
+    'cli',
+    'generate_cron_files',
+    'check_deployment_readiness',
+])
+_LAZY_ATTRIBUTES = {
+    'YamlLoader': '_yaml_cache',
+    'load_yaml_file': '_yaml_cache',
+    'parse_yaml_file': '_yaml_cache',
+}
+
+
+def __getattr__(name):
+    import importlib
+
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module('{0}.{1}'.format(__name__, name))
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(
+            '{0}.{1}'.format(__name__, _LAZY_ATTRIBUTES[name])
+        )
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(
+        "module {0!r} has no attribute {1!r}".format(__name__, name)
+    )
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
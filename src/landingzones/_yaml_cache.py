@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Caches for parsed YAML config files.
+
+Cron-driven commands re-read the same config on every run. When a YAML file
+has not changed since it was last parsed, the JSON sidecar written next to it
+is loaded instead, which is much cheaper than a YAML parse. Any problem with
+the sidecar (missing, stale, unreadable, unwritable) falls back to parsing the
+YAML file directly.
+
+Within one process, ``parse_yaml_file`` additionally keeps recently parsed
+documents in memory so repeated config loads are a dictionary lookup.
+"""
+
+from collections import OrderedDict
+import copy
+import hashlib
+import json
+import os
+import re
+import tempfile
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+    YamlLoader = None
+else:
+    # Prefer the libyaml-backed loader; fall back to the pure-Python loader
+    # when PyYAML was built without libyaml. Both produce identical output.
+    YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+from landingzones import __version__
+
+# A document made only of blank and comment lines, which YAML loads as None
+BLANK_DOCUMENT_PATTERN = re.compile(rb'(?:[ \t\r]*(?:#[^\n]*)?\n)*[ \t\r]*(?:#[^\n]*)?')
+
+
+def sidecar_path(path):
+    """Return the versioned JSON sidecar path for a YAML file."""
+    return '{0}.{1}.json'.format(path, __version__)
+
+
+def _read_sidecar(cache_path, source_stat):
+    try:
+        with open(cache_path, 'r') as f:
+            payload = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict):
+        return None
+    if payload.get('source_mtime_ns') != source_stat.st_mtime_ns:
+        return None
+    if payload.get('source_size') != source_stat.st_size:
+        return None
+    return payload
+
+
+def _write_sidecar(cache_path, source_stat, data):
+    payload = {
+        'source_mtime_ns': source_stat.st_mtime_ns,
+        'source_size': source_stat.st_size,
+        'data': data,
+    }
+    directory = os.path.dirname(cache_path) or '.'
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            prefix='.{0}.'.format(os.path.basename(cache_path)),
+            dir=directory,
+        )
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def _json_round_trips(data):
+    """Return True when data survives JSON encoding unchanged."""
+    try:
+        return json.loads(json.dumps(data)) == data
+    except (TypeError, ValueError):
+        return False
+
+
+def load_yaml_file(path):
+    """Load a YAML file, using a JSON sidecar when it is still current.
+
+    The sidecar records the YAML file's mtime and size, so any edit to the
+    YAML invalidates it. Documents that JSON cannot represent faithfully
+    (dates, non-string keys) are never cached.
+    """
+    return _load_yaml_file(path, os.stat(path))
+
+
+def _load_yaml_file(path, source_stat):
+    cache_path = sidecar_path(path)
+    payload = _read_sidecar(cache_path, source_stat)
+    if payload is not None:
+        return payload.get('data')
+
+    # Bytes let libyaml decode the file itself instead of reading an
+    # already-decoded text stream.
+    with open(path, 'rb') as f:
+        content = f.read()
+    if BLANK_DOCUMENT_PATTERN.fullmatch(content):
+        # Nothing to parse, and cheaper to re-check than to cache.
+        return None
+    data = yaml.load(content, Loader=YamlLoader)
+    if _json_round_trips(data):
+        _write_sidecar(cache_path, source_stat, data)
+    return data
+
+
+class ParserCache:
+    """Bounded in-process cache of parsed YAML documents.
+
+    Files are keyed by ``(path, st_mtime_ns, st_size)`` so an edited file is
+    re-read; strings are keyed by a BLAKE2b digest of their content. Callers
+    receive deep copies, so mutating a result never leaks into the cache.
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+
+    def _lookup(self, key, parse):
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return copy.deepcopy(self._entries[key])
+        data = parse()
+        self._entries[key] = data
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return copy.deepcopy(data)
+
+    def parse_file(self, path):
+        """Parse a YAML file, reusing the result while the file is unchanged."""
+        path = os.path.abspath(path)
+        source_stat = os.stat(path)
+        key = ('file', path, source_stat.st_mtime_ns, source_stat.st_size)
+        return self._lookup(key, lambda: _load_yaml_file(path, source_stat))
+
+    def parse_string(self, content):
+        """Parse YAML text, reusing the result for identical content."""
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        if BLANK_DOCUMENT_PATTERN.fullmatch(content):
+            return None
+        key = ('text', hashlib.blake2b(content, digest_size=16).digest())
+        return self._lookup(key, lambda: yaml.load(content, Loader=YamlLoader))
+
+    def clear(self):
+        """Drop all cached documents."""
+        self._entries.clear()
+
+
+parser_cache = ParserCache()
+
+
+def parse_yaml_file(path):
+    """Parse a YAML file through the shared process-wide parser cache."""
+    return parser_cache.parse_file(path)
@@ -10,10 +10,16 @@ Checks all prerequisites before deploying cron files:
 - Required tools are available
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+import functools
+from io import StringIO
 import os
 import sys
 import subprocess
 import shutil
+import stat
+import threading
 import argparse
 
 from landingzones.config import config
@@ -30,19 +36,26 @@ from landingzones.readiness_ops import (
     check_local_directory,
     check_log_directory,
     check_remote_directory,
+    check_remote_host_all,
     check_required_tools,
     check_ssh_connection,
     deploy_cron_files,
+    expand_path,
     generate_cron_files,
     get_current_system,
     get_current_user,
+    inspect_local_directories,
     inspect_local_directory,
     inspect_remote_directory,
+    is_local_endpoint,
+    load_identity_transfers,
     normalize_directory_path,
     parse_remote_destination,
     print_header,
     print_status,
     setup_crontab_directory,
+    ssh_multiplex,
+    ssh_preflight_error,
 )
 from landingzones.transfer_loading import (
     filter_transfers_by_system_user,
@@ -51,6 +64,9 @@ from landingzones.transfer_loading import (
     resolve_runtime_ids,
 )
 
+# Upper bound on transfers checked concurrently; checks are I/O-bound (ssh).
+READINESS_CHECK_WORKERS = 16
+
 
 def get_test_flock_path():
     """Prefer a real flock binary, but allow a no-op lock command for local tests."""
@@ -74,7 +90,7 @@ def expand_local_filesystem_path(path):
     """Expand shell-style local path shortcuts before Python filesystem use."""
     if not path:
         return path
-    return os.path.expandvars(os.path.expanduser(str(path)))
+    return expand_path(path)
 
 
 def get_repo_root():
@@ -84,22 +100,28 @@ def get_repo_root():
     )
 
 
+def _visible_dir_entries(path):
+    """Return non-hidden ``os.DirEntry`` objects, or [] for a non-directory."""
+    try:
+        with os.scandir(path) as entries:
+            return [entry for entry in entries if not entry.name.startswith('.')]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
 def list_visible_entries(path):
     """List non-hidden entries under a directory."""
-    if not os.path.isdir(path):
-        return []
-    return sorted(
-        name for name in os.listdir(path)
-        if not name.startswith('.')
-    )
+    return sorted(entry.name for entry in _visible_dir_entries(path))
 
 
 def list_visible_directories(path):
     """List non-hidden directories under a directory."""
-    return [
-        name for name in list_visible_entries(path)
-        if os.path.isdir(os.path.join(path, name))
-    ]
+    # DirEntry.is_dir() uses the type from the directory listing, so
+    # subdirectories need no stat of their own.
+    return sorted(
+        entry.name for entry in _visible_dir_entries(path)
+        if entry.is_dir()
+    )
 
 
 def print_shared_main_lock_warnings(transfers_df):
@@ -447,11 +469,13 @@ def inspect_endpoint_staging_state(endpoint):
             return state
         return 'inaccessible'
 
-    if os.path.islink(staging_path):
-        return 'non-directory'
-    if not os.path.exists(staging_path):
+    # One lstat answers link, existence and type, which the remote branch
+    # needs three shell tests for.
+    try:
+        staging_stat = os.lstat(staging_path)
+    except (OSError, ValueError):
         return 'absent'
-    if not os.path.isdir(staging_path):
+    if not stat.S_ISDIR(staging_stat.st_mode):
         return 'non-directory'
     try:
         with os.scandir(staging_path) as entries:
@@ -851,6 +875,7 @@ def generate_test_scripts(transfers_df, scripts_dir, crontab_dir, validation_scr
     gcf.write_validation_scripts(validation_scripts_dir, transfers_df)
 
     grouped = transfers_df.groupby('system_user')
+    default_frequency = config.default_cron_frequency
     for system_user, group_df in grouped:
         for _, transfer in group_df.iterrows():
             script_path = os.path.join(scripts_dir, transfer['script_name'])
@@ -859,13 +884,13 @@ def generate_test_scripts(transfers_df, scripts_dir, crontab_dir, validation_scr
                 handle.write(gcf.add_owner_marker(script_content))
             os.chmod(script_path, 0o755)
 
-        cron_path = os.path.join(crontab_dir, gcf.cron_file_name(system_user))
-        with open(cron_path, 'w') as handle:
-            handle.write(
-                gcf.add_owner_marker(
-                    gcf.generate_cron_file(system_user, group_df, scripts_dir)
-                )
-            )
+        gcf.write_cron_file(
+            os.path.join(crontab_dir, gcf.cron_file_name(system_user)),
+            system_user,
+            group_df,
+            scripts_dir,
+            default_frequency=default_frequency,
+        )
 
     return transfers_df
 
@@ -1211,7 +1236,6 @@ def run_cron_deployment_prompt(
     """Offer an interactive cron deployment for the current system/user."""
     print_runtime_filter_status(runtime_ids, runtime_filter_source)
 
-    transfers_df = None
     if runtime_ids:
         try:
             transfers_df = load_runtime_transfers(
@@ -1225,6 +1249,8 @@ def run_cron_deployment_prompt(
                 "Cannot read filtered transfers: {0}".format(exc),
             )
             return False
+    else:
+        transfers_df = load_identity_transfers()
 
     current_system = get_current_system(
         transfers_df=transfers_df,
@@ -1416,8 +1442,9 @@ def run_test_with_data(
                 runtime_ids=runtime_ids,
             )
         else:
-            current_system = get_current_system()
-            current_user = get_current_user()
+            identity_df = load_identity_transfers()
+            current_system = get_current_system(transfers_df=identity_df)
+            current_user = get_current_user(transfers_df=identity_df)
         transfers_df = filter_transfers_by_system_user(
             all_transfers_df,
             current_system,
@@ -1586,6 +1613,361 @@ def run_test_with_data(
     finally:
         _restore_config_state(snapshot)
 
+
+def normalize_transfer_port(value):
+    """Return a usable port string, or None for empty/NaN port values."""
+    port = str(value) if value is not None else ''
+    return port if port and port != 'nan' and port.strip() else None
+
+
+def remote_endpoint_keys(transfer_rows):
+    """Return the unique ``(user, host, port)`` remote endpoints, in order."""
+    keys = []
+    for transfer in transfer_rows:
+        for endpoint_column, port_column in (
+            ('source', 'source_port'),
+            ('destination', 'destination_port'),
+        ):
+            user, host, path = parse_remote_destination(transfer[endpoint_column])
+            if not host:
+                continue
+            key = (user, host, normalize_transfer_port(transfer.get(port_column, '')))
+            if is_local_endpoint(*key, path=path):
+                continue
+            if key not in keys:
+                keys.append(key)
+    return keys
+
+
+def prefetch_local_directories(transfer_rows):
+    """Inspect every local endpoint of a check pass in one batch.
+
+    Returns the ``local_directories`` dict consumed by ``_check_transfer``,
+    keyed by ``(path, check_writable)``. Each unique path is stat'ed once,
+    and the stats run concurrently.
+    """
+    paths_by_mode = {False: {}, True: {}}
+    for transfer in transfer_rows:
+        for endpoint_column, port_column, check_writable in (
+            ('source', 'source_port', False),
+            ('destination', 'destination_port', True),
+        ):
+            user, host, path = parse_remote_destination(transfer[endpoint_column])
+            port = normalize_transfer_port(transfer.get(port_column, ''))
+            if host and not is_local_endpoint(user, host, port, path=path):
+                continue
+            paths_by_mode[check_writable][path] = None
+
+    local_directories = {}
+    for check_writable, unique_paths in paths_by_mode.items():
+        paths = list(unique_paths)
+        results = inspect_local_directories(
+            paths,
+            check_writable=check_writable,
+            workers=READINESS_CHECK_WORKERS,
+        )
+        for path, info in zip(paths, results):
+            local_directories[(path, check_writable)] = info
+    return local_directories
+
+
+def _open_remote_session(key, stack, stack_lock):
+    """Start an ssh master for one endpoint and check connectivity over it.
+
+    A host that refuses TCP fails here, before a master could spend the full
+    ssh connect timeout on it. A started master is registered on ``stack``
+    as soon as it exists, so it is closed even if another endpoint fails.
+    """
+    user, host, port = key
+    preflight_error = ssh_preflight_error(user, host, port)
+    if preflight_error:
+        return {
+            'control_path': None,
+            'ssh_ok': False,
+            'ssh_msg': preflight_error,
+        }
+    manager = ssh_multiplex(user, host, port)
+    control_path = manager.__enter__()
+    with stack_lock:
+        stack.push(manager.__exit__)
+    ssh_ok, ssh_msg = check_ssh_connection(user, host, port, control_path=control_path)
+    return {
+        'control_path': control_path,
+        'ssh_ok': ssh_ok,
+        'ssh_msg': ssh_msg,
+    }
+
+
+def open_remote_sessions(stack, transfer_rows):
+    """Check each unique remote endpoint once and keep its master open.
+
+    The masters are registered on ``stack`` and closed when it exits. Returns
+    a dict keyed by ``(user, host, port)`` for ``_check_transfer``.
+    """
+    keys = remote_endpoint_keys(transfer_rows)
+    sessions = {}
+    if not keys:
+        return sessions
+    workers = min(READINESS_CHECK_WORKERS, len(keys))
+    open_session = functools.partial(
+        _open_remote_session,
+        stack=stack,
+        stack_lock=threading.Lock(),
+    )
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for key, session in zip(keys, executor.map(open_session, keys)):
+            sessions[key] = session
+    return sessions
+
+
+def _check_remote_endpoint(user, host, path, port, check_writable, sessions):
+    """Return ``(ssh_ok, ssh_msg, directory_info)`` for one remote endpoint.
+
+    A shared session from ``open_remote_sessions`` reuses its connectivity
+    result and control socket; without one, ssh and the directory are
+    checked in a single round trip.
+    """
+    session = (sessions or {}).get((user, host, port))
+    if session is None:
+        return check_remote_host_all(
+            user,
+            host,
+            path,
+            port=port,
+            check_writable=check_writable,
+        )
+    if not session['ssh_ok']:
+        return False, session['ssh_msg'], None
+    info = inspect_remote_directory(
+        user,
+        host,
+        path,
+        port=port,
+        check_writable=check_writable,
+        control_path=session['control_path'],
+    )
+    return True, session['ssh_msg'], info
+
+
+def _inspect_local_endpoint(path, check_writable, local_directories):
+    """Return local directory status, reusing results from this check pass.
+
+    Nothing is created until every transfer has been checked, so within one
+    pass each ``(path, check_writable)`` pair only needs to be stat'ed once.
+    """
+    if local_directories is None:
+        return inspect_local_directory(path, check_writable=check_writable)
+    key = (path, check_writable)
+    info = local_directories.get(key)
+    if info is None:
+        info = inspect_local_directory(path, check_writable=check_writable)
+        local_directories[key] = info
+    return info
+
+
+def _check_transfer(transfer, sessions=None, local_directories=None):
+    """Run the readiness checks for one transfer without printing.
+
+    Returns a dict with the transfer header, the ordered status events to
+    print, the overall result, and any missing directories found. Keeping
+    output out of this function lets transfers be checked concurrently.
+    ``local_directories`` is a dict shared across one check pass.
+    """
+    events = []
+    missing_directories = []
+    transfer_ok = True
+
+    def record(check_name, status, details=None):
+        events.append(('status', check_name, status, details))
+
+    # Check source directory
+    source_user, source_host, source_path = parse_remote_destination(
+        transfer['source']
+    )
+    source_port = normalize_transfer_port(transfer.get('source_port', ''))
+    if source_host and is_local_endpoint(
+        source_user, source_host, source_port, path=source_path
+    ):
+        # user@localhost style endpoints need no ssh round trip
+        source_host = None
+
+    if source_host:
+        ssh_ok, ssh_msg, remote_source_info = _check_remote_endpoint(
+            source_user,
+            source_host,
+            source_path,
+            source_port,
+            False,
+            sessions,
+        )
+        record(
+            "SSH connection to source {0}".format(source_host),
+            "OK" if ssh_ok else "ERROR",
+            ssh_msg,
+        )
+        if ssh_ok:
+            record(
+                "Source directory",
+                "OK" if remote_source_info['ok'] else "ERROR",
+                remote_source_info['message'],
+            )
+            if not remote_source_info['ok']:
+                transfer_ok = False
+                if remote_source_info['missing']:
+                    add_missing_directory(
+                        missing_directories,
+                        {
+                            'scope': 'remote',
+                            'user': source_user,
+                            'host': source_host,
+                            'port': source_port,
+                            'path': remote_source_info['path'],
+                        },
+                    )
+        else:
+            transfer_ok = False
+    else:
+        local_source_info = _inspect_local_endpoint(
+            source_path,
+            False,
+            local_directories,
+        )
+        record(
+            "Source directory",
+            "OK" if local_source_info['ok'] else "ERROR",
+            local_source_info['message'],
+        )
+        if not local_source_info['ok']:
+            transfer_ok = False
+            if local_source_info['missing']:
+                add_missing_directory(
+                    missing_directories,
+                    {
+                        'scope': 'local',
+                        'path': local_source_info['path'],
+                    },
+                )
+
+    # Check destination
+    user, host, dest_path = parse_remote_destination(transfer['destination'])
+    port = normalize_transfer_port(transfer.get('destination_port', ''))
+    if host and is_local_endpoint(user, host, port, path=dest_path):
+        host = None
+
+    if host:
+        # Remote destination
+        remote_label = build_ssh_target(user, host)
+        events.append((
+            'text',
+            "\n  Remote destination: {0}:{1}".format(
+                remote_label,
+                normalize_directory_path(dest_path),
+            ),
+        ))
+        if port:
+            events.append(('text', "  Using port: {0}".format(port)))
+
+        ssh_ok, ssh_msg, remote_dest_info = _check_remote_endpoint(
+            user,
+            host,
+            dest_path,
+            port,
+            True,
+            sessions,
+        )
+        record(
+            "SSH connection to {0}".format(host),
+            "OK" if ssh_ok else "ERROR",
+            ssh_msg,
+        )
+
+        if ssh_ok:
+            record(
+                "Remote destination directory",
+                "OK" if remote_dest_info['ok'] else "ERROR",
+                remote_dest_info['message'],
+            )
+            if not remote_dest_info['ok']:
+                transfer_ok = False
+                if remote_dest_info['missing']:
+                    add_missing_directory(
+                        missing_directories,
+                        {
+                            'scope': 'remote',
+                            'user': user,
+                            'host': host,
+                            'port': port,
+                            'path': remote_dest_info['path'],
+                        },
+                    )
+        else:
+            transfer_ok = False
+    else:
+        # Local destination
+        local_dest_info = _inspect_local_endpoint(
+            dest_path,
+            True,
+            local_directories,
+        )
+        record(
+            "Destination directory",
+            "OK" if local_dest_info['ok'] else "ERROR",
+            local_dest_info['message'],
+        )
+        if not local_dest_info['ok']:
+            transfer_ok = False
+            if local_dest_info['missing']:
+                add_missing_directory(
+                    missing_directories,
+                    {
+                        'scope': 'local',
+                        'path': local_dest_info['path'],
+                    },
+                )
+
+    # Check log file directory
+    log_file = transfer.get('log_file', '')
+    if log_file and log_file != 'nan':
+        log_ok, log_msg = check_log_directory(log_file)
+        record("Log directory", "OK" if log_ok else "ERROR", log_msg)
+        if not log_ok:
+            transfer_ok = False
+
+    # Check flock file directory
+    flock_file = transfer.get('flock_file', '')
+    if flock_file and flock_file != 'nan':
+        flock_ok, flock_msg = check_log_directory(flock_file)
+        record("Flock directory", "OK" if flock_ok else "ERROR", flock_msg)
+        if not flock_ok:
+            transfer_ok = False
+
+    return {
+        'title': "Transfer: {0} → {1}".format(
+            normalize_endpoint_display(transfer['source']),
+            normalize_endpoint_display(transfer['destination']),
+        ),
+        'events': events,
+        'ok': transfer_ok,
+        'missing_directories': missing_directories,
+    }
+
+
+def print_transfer_check(result):
+    """Print the recorded readiness events for one transfer."""
+    # Render into a buffer and write once, so each transfer's block costs a
+    # single write to the terminal or pipe.
+    buffer = StringIO()
+    print_header(result['title'], out=buffer)
+    for event in result['events']:
+        if event[0] == 'status':
+            print_status(*event[1:], out=buffer)
+        else:
+            print(event[1], file=buffer)
+    print(file=buffer)  # Blank line between transfers
+    sys.stdout.write(buffer.getvalue())
+    sys.stdout.flush()
+
+
 def main(argv=None):
     """Main verification function."""
     # Parse command line arguments
@@ -1743,178 +2125,26 @@ def main(argv=None):
     all_transfers_ok = True
     missing_directories = []
     
-    for _, transfer in system_transfers.iterrows():
-        print_header(
-            "Transfer: {0} → {1}".format(
-                normalize_endpoint_display(transfer['source']),
-                normalize_endpoint_display(transfer['destination']),
-            )
-        )
-        
-        transfer_ok = True
-        
-        # Check source directory
-        source_user, source_host, source_path = parse_remote_destination(
-            transfer['source']
+    transfer_rows = [transfer for _, transfer in system_transfers.iterrows()]
+    workers = min(READINESS_CHECK_WORKERS, len(transfer_rows))
+    with ExitStack() as ssh_sessions:
+        # Many transfers usually share one remote server; connect to each
+        # (user, host, port) once and run every directory probe over it.
+        sessions = open_remote_sessions(ssh_sessions, transfer_rows)
+        check_transfer = functools.partial(
+            _check_transfer,
+            sessions=sessions,
+            local_directories=prefetch_local_directories(transfer_rows),
         )
-        source_port = transfer.get('source_port', '')
-        source_port = str(source_port) if source_port is not None else ''
-        source_port = (
-            source_port if source_port and source_port != 'nan' and source_port.strip()
-            else None
-        )
-
-        if source_host:
-            ssh_ok, ssh_msg = check_ssh_connection(source_user, source_host, source_port)
-            print_status(
-                "SSH connection to source {0}".format(source_host),
-                "OK" if ssh_ok else "ERROR",
-                ssh_msg,
-            )
-            if ssh_ok:
-                remote_source_info = inspect_remote_directory(
-                    source_user,
-                    source_host,
-                    source_path,
-                    port=source_port,
-                    check_writable=False,
-                )
-                print_status(
-                    "Source directory",
-                    "OK" if remote_source_info['ok'] else "ERROR",
-                    remote_source_info['message'],
-                )
-                if not remote_source_info['ok']:
-                    transfer_ok = False
-                    if remote_source_info['missing']:
-                        add_missing_directory(
-                            missing_directories,
-                            {
-                                'scope': 'remote',
-                                'user': source_user,
-                                'host': source_host,
-                                'port': source_port,
-                                'path': remote_source_info['path'],
-                            },
-                        )
-            else:
-                transfer_ok = False
-        else:
-            local_source_info = inspect_local_directory(
-                transfer['source'],
-                check_writable=False,
-            )
-            print_status(
-                "Source directory",
-                "OK" if local_source_info['ok'] else "ERROR",
-                local_source_info['message'],
-            )
-            if not local_source_info['ok']:
-                transfer_ok = False
-                if local_source_info['missing']:
-                    add_missing_directory(
-                        missing_directories,
-                        {
-                            'scope': 'local',
-                            'path': local_source_info['path'],
-                        },
-                    )
-        
-        # Check destination
-        user, host, dest_path = parse_remote_destination(transfer['destination'])
-        port = transfer.get('destination_port', '')
-        
-        # Convert port to string and handle NaN values safely
-        port = str(port) if port is not None else ''
-        port = port if port and port != 'nan' and port.strip() else None
-        
-        if host:
-            # Remote destination
-            remote_label = build_ssh_target(user, host)
-            print(
-                "\n  Remote destination: {0}:{1}".format(
-                    remote_label,
-                    normalize_directory_path(dest_path),
-                )
-            )
-            if port:
-                print("  Using port: {0}".format(port))
-            
-            # Check SSH connection
-            ssh_ok, ssh_msg = check_ssh_connection(user, host, port)
-            print_status("SSH connection to {0}".format(host), "OK" if ssh_ok else "ERROR", ssh_msg)
-            
-            if ssh_ok:
-                remote_dest_info = inspect_remote_directory(
-                    user,
-                    host,
-                    dest_path,
-                    port=port,
-                    check_writable=True,
-                )
-                print_status(
-                    "Remote destination directory",
-                    "OK" if remote_dest_info['ok'] else "ERROR",
-                    remote_dest_info['message'],
-                )
-                if not remote_dest_info['ok']:
-                    transfer_ok = False
-                    if remote_dest_info['missing']:
-                        add_missing_directory(
-                            missing_directories,
-                            {
-                                'scope': 'remote',
-                                'user': user,
-                                'host': host,
-                                'port': port,
-                                'path': remote_dest_info['path'],
-                            },
-                        )
-            else:
-                transfer_ok = False
-        else:
-            # Local destination
-            local_dest_info = inspect_local_directory(
-                dest_path,
-                check_writable=True,
-            )
-            print_status(
-                "Destination directory",
-                "OK" if local_dest_info['ok'] else "ERROR",
-                local_dest_info['message'],
-            )
-            if not local_dest_info['ok']:
-                transfer_ok = False
-                if local_dest_info['missing']:
-                    add_missing_directory(
-                        missing_directories,
-                        {
-                            'scope': 'local',
-                            'path': local_dest_info['path'],
-                        },
-                    )
-        
-        # Check log file directory
-        log_file = transfer.get('log_file', '')
-        if log_file and log_file != 'nan':
-            log_ok, log_msg = check_log_directory(log_file)
-            print_status("Log directory", "OK" if log_ok else "ERROR", log_msg)
-            if not log_ok:
-                transfer_ok = False
-        
-        # Check flock file directory
-        flock_file = transfer.get('flock_file', '')
-        if flock_file and flock_file != 'nan':
-            flock_ok, flock_msg = check_log_directory(flock_file)
-            print_status("Flock directory", "OK" if flock_ok else "ERROR",
-                         flock_msg)
-            if not flock_ok:
-                transfer_ok = False
-        
-        if not transfer_ok:
-            all_transfers_ok = False
-        
-        print()  # Blank line between transfers
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # map() yields in input order, so output stays grouped per
+            # transfer while later transfers are already being checked.
+            for result in executor.map(check_transfer, transfer_rows):
+                print_transfer_check(result)
+                for entry in result['missing_directories']:
+                    add_missing_directory(missing_directories, entry)
+                if not result['ok']:
+                    all_transfers_ok = False
 
     if missing_directories:
         print_header("Missing Directories")
@@ -11,10 +11,24 @@ from landingzones import __version__
 from landingzones.config import config
 from landingzones import check_deployment_readiness as cdr
 from landingzones import generate_cron_files as gcf
-from landingzones import plot_transfer_status as pts
 from landingzones import validate_separation as vsep
 
 
+def load_report_module():
+    """Import the pandas-backed report module only when a report is requested."""
+    from landingzones import plot_transfer_status
+
+    return plot_transfer_status
+
+
+def __getattr__(name):
+    if name == 'pts':
+        return load_report_module()
+    raise AttributeError(
+        "module {0!r} has no attribute {1!r}".format(__name__, name)
+    )
+
+
 def append_option(argv, flag, value):
     """Append a CLI flag/value pair when the value is present."""
     if value is None:
@@ -436,6 +450,7 @@ def handle_validate_chain(args, extra_args):
     append_option(report_argv, '--title', args.title)
     for tag in args.tag:
         append_option(report_argv, '--tag', tag)
+    pts = load_report_module()
     rc = normalize_exit_code(pts.main(report_argv))
     if rc == getattr(pts, 'REPORT_SKIPPED_EXIT_CODE', 2):
         print("Validation chain completed; report generation was skipped.")
@@ -462,6 +477,7 @@ def handle_report_transfers(args, extra_args):
     append_option(argv, '--title', args.title)
     for tag in args.tag:
         append_option(argv, '--tag', tag)
+    pts = load_report_module()
     return normalize_exit_code(pts.main(argv))
 
 
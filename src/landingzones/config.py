@@ -44,16 +44,16 @@ Example config.yaml:
       status_lock_file: Landing_Zone_notifications.lock
 """
 
+from collections import ChainMap
+import functools
 import os
-try:
-    import yaml
-    YAML_AVAILABLE = True
-except ImportError:
-    YAML_AVAILABLE = False
+import re
 
 
 # Default config file names to search for
 CONFIG_FILE_NAMES = ['config.yaml', 'config.yml', 'landingzones.yaml', 'landingzones.yml']
+# Hashed lookup for directory entries; CONFIG_FILE_NAMES keeps the priority
+_CONFIG_FILE_NAME_SET = frozenset(CONFIG_FILE_NAMES)
 
 # Subdirectories to search for config files
 CONFIG_SEARCH_DIRS = ['.', 'config']
@@ -63,6 +63,10 @@ DEFAULT_RIT_MANAGED_FOLDER_STRUCTURE = {
     'log': 'log',
     'flock': 'flock',
 }
+# Cron schedule for transfers that set no frequency of their own
+DEFAULT_CRON_FREQUENCY = '*/15 * * * *'
+# $NAME and ${NAME} references, the forms os.path.expandvars substitutes.
+ENV_REFERENCE_PATTERN = re.compile(r'\$(\w+|\{[^}]*\})')
 DEFAULT_NOTIFICATIONS = {
     'endpoint': '',
     'token_env': '',
@@ -74,11 +78,42 @@ DEFAULT_NOTIFICATIONS = {
 }
 
 
+def expand_path(path):
+    """Expand ``~`` and ``$VAR`` in a path, memoized per path and environment.
+
+    The cache key includes ``$HOME`` and the current value of every variable
+    the path references, so environment changes are still honoured.
+    """
+    path = str(path)
+    if '$' not in path and not path.startswith('~'):
+        # Nothing to expand: skip the cache key and both expansion scans.
+        return path
+    env_values = ()
+    if '$' in path:
+        env_values = tuple(
+            os.environ.get(name.strip('{}'))
+            for name in ENV_REFERENCE_PATTERN.findall(path)
+        )
+    return _expand_path_cached(path, os.environ.get('HOME'), env_values)
+
+
+@functools.lru_cache(maxsize=256)
+def _expand_path_cached(path, home, env_values):
+    # Only paths reaching here need expansion, but usually just one kind.
+    if path.startswith('~'):
+        path = os.path.expanduser(path)
+    if env_values:
+        path = os.path.expandvars(path)
+    return path
+
+
 def _expand_path(path):
     """Expand environment variables and user home in path"""
-    if path:
-        return os.path.expandvars(os.path.expanduser(path))
-    return path
+    if not path:
+        return path
+    if isinstance(path, str):
+        return expand_path(path)
+    return os.path.expandvars(os.path.expanduser(path))
 
 
 def _expand_path_mapping(values):
@@ -136,27 +171,65 @@ def _load_yaml_config(config_file=None):
     Returns:
         dict: Configuration values from YAML, or empty dict if not found.
     """
-    if not YAML_AVAILABLE:
-        return {}
-    
     if config_file:
         # Explicit config file specified
         config_path = _expand_path(config_file)
-        if os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                return yaml.safe_load(f) or {}
-        return {}
+        # The parser stats the file anyway; a missing file shows up there
+        # instead of costing a separate exists() probe.
+        try:
+            return _parse_config_file(config_path)
+        except (FileNotFoundError, NotADirectoryError):
+            return {}
     
-    # Search for default config file names in CWD and config/ subdirectory
-    cwd = os.getcwd()
+    config_path = _find_default_config_file(os.getcwd())
+    if config_path is None:
+        return {}
+    try:
+        return _parse_config_file(config_path)
+    except (FileNotFoundError, NotADirectoryError):
+        # The remembered file has gone; look again once.
+        _find_default_config_file.cache_clear()
+        config_path = _find_default_config_file(os.getcwd())
+        if config_path is None:
+            return {}
+        return _parse_config_file(config_path)
+
+
+@functools.lru_cache(maxsize=8)
+def _find_default_config_file(cwd):
+    """Return the default config file below cwd, or None.
+
+    Memoized per process: the CLI is short-lived and its config file does
+    not appear while it runs. Call ``_find_default_config_file.cache_clear()``
+    after creating a config file in an already searched directory.
+    """
+    # Search for default config file names in CWD and config/ subdirectory.
+    # One directory read per search dir replaces a stat per candidate name.
     for search_dir in CONFIG_SEARCH_DIRS:
+        directory = os.path.join(cwd, search_dir)
+        try:
+            with os.scandir(directory) as entries:
+                found = {
+                    entry.name for entry in entries
+                    if entry.name in _CONFIG_FILE_NAME_SET and entry.is_file()
+                }
+        except OSError:
+            continue
+        if not found:
+            continue
         for name in CONFIG_FILE_NAMES:
-            config_path = os.path.join(cwd, search_dir, name)
-            if os.path.exists(config_path):
-                with open(config_path, 'r') as f:
-                    return yaml.safe_load(f) or {}
-    
-    return {}
+            if name in found:
+                return os.path.join(directory, name)
+    return None
+
+
+def _parse_config_file(config_path):
+    """Parse a found config file; PyYAML is only imported at this point."""
+    from landingzones import _yaml_cache
+
+    if _yaml_cache.yaml is None:
+        return {}
+    return _yaml_cache.parse_yaml_file(config_path) or {}
 
 
 class Config:
@@ -192,11 +265,32 @@ class Config:
     """
     
     def __init__(self):
-        self._yaml_config = {}
         self._runtime_config = {}
-        self._config_file = None
-        # Auto-load config.yaml if present
-        self._load_yaml()
+        # config.yaml (or LZ_CONFIG_FILE) is found and parsed on first use,
+        # so importing the module or loading an explicit file does no
+        # default-file discovery up front.
+        self._yaml_values = None
+        self._config_file_value = None
+
+    @property
+    def _yaml_config(self):
+        if self._yaml_values is None:
+            self._load_yaml()
+        return self._yaml_values
+
+    @_yaml_config.setter
+    def _yaml_config(self, value):
+        self._yaml_values = value
+
+    @property
+    def _config_file(self):
+        if self._yaml_values is None:
+            self._load_yaml()
+        return self._config_file_value
+
+    @_config_file.setter
+    def _config_file(self, value):
+        self._config_file_value = value
     
     def _load_yaml(self, config_file=None):
         """Load YAML configuration file."""
@@ -205,7 +299,7 @@ class Config:
             config_file = os.environ.get('LZ_CONFIG_FILE')
         
         self._config_file = config_file
-        self._yaml_config = _load_yaml_config(config_file)
+        self._yaml_config = _load_yaml_config(config_file) or {}
     
     def load_config(self, config_file=None, **kwargs):
         """Load configuration from file and/or runtime arguments.
@@ -257,7 +351,11 @@ class Config:
         self._config_file = snapshot['config_file']
     
     def _get_value(self, key, env_var, default):
-        """Get configuration value with priority: runtime > env > yaml > default."""
+        """Get configuration value with priority: runtime > env > yaml > default.
+
+        ``default`` may be a callable, which is only invoked when no other
+        source provides the value.
+        """
         # 1. Runtime config (highest priority)
         if key in self._runtime_config:
             return _expand_path(self._runtime_config[key])
@@ -272,6 +370,8 @@ class Config:
             return _expand_path(self._yaml_config[key])
         
         # 4. Default value
+        if callable(default):
+            default = default()
         return _expand_path(default)
     
     @property
@@ -344,17 +444,19 @@ class Config:
     def crontab_dir(self):
         """Default crontab output directory"""
         # Special case: crontab_dir defaults to output_dir/crontab.d
-        default = os.path.join(self.output_dir, 'crontab.d')
-        return self._get_value('crontab_dir', 'LZ_CRONTAB_DIR', default)
+        return self._get_value(
+            'crontab_dir',
+            'LZ_CRONTAB_DIR',
+            lambda: os.path.join(self.output_dir, 'crontab.d'),
+        )
 
     @property
     def validation_scripts_dir(self):
         """Default output directory for generated validation wrapper scripts."""
-        default = os.path.join(self.output_dir, 'validation_scripts')
         return self._get_value(
             'validation_scripts_dir',
             'LZ_VALIDATION_SCRIPTS_DIR',
-            default,
+            lambda: os.path.join(self.output_dir, 'validation_scripts'),
         )
 
     @property
@@ -470,8 +572,12 @@ class Config:
 
     @property
     def path_variables(self):
-        """Configured ${VAR} placeholder values used in transfers.tsv paths."""
-        values = dict(os.environ)
+        """Configured ${VAR} placeholder values used in transfers.tsv paths.
+
+        Config values take priority over the environment, which is consulted
+        live through the returned mapping rather than copied per access.
+        """
+        values = {}
 
         yaml_value = self._yaml_config.get('path_variables')
         if yaml_value is not None:
@@ -483,12 +589,13 @@ class Config:
             for key, value in runtime_value.items():
                 values[str(key)] = _expand_path(value)
 
-        return values
+        return ChainMap(values, os.environ)
 
     def get_rit_managed_location(self, system):
         """Return the rit_managed base location for a system."""
-        if system in self.rit_managed_locations:
-            return self.rit_managed_locations[system]
+        locations = self.rit_managed_locations
+        if system in locations:
+            return locations[system]
         return self.output_dir
 
     def get_flock_path(self, system):
@@ -528,7 +635,9 @@ class Config:
             - 0 * * * *     (every hour)
             - 0 0 * * *     (daily at midnight)
         """
-        return self._get_value('default_cron_frequency', 'LZ_CRON_FREQUENCY', '*/15 * * * *')
+        return self._get_value(
+            'default_cron_frequency', 'LZ_CRON_FREQUENCY', DEFAULT_CRON_FREQUENCY
+        )
     
     def to_dict(self):
         """Return all configuration values as a dictionary."""
@@ -550,7 +659,7 @@ class Config:
             'rit_managed_locations': self.rit_managed_locations,
             'flock_paths': self.flock_paths,
             'notifications': self.notifications,
-            'path_variables': self.path_variables,
+            'path_variables': dict(self.path_variables),
             'rit_managed_folder_structure': self.rit_managed_folder_structure,
             'default_cron_frequency': self.default_cron_frequency,
         }
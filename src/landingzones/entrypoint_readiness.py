@@ -180,8 +180,8 @@ def read_readiness_state(path):
 def write_readiness_state(path, state):
     """Write durable readiness state through an atomic rename."""
     directory = os.path.dirname(path)
-    if directory and not os.path.isdir(directory):
-        os.makedirs(directory)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
     tmp_path = "{0}.tmp".format(path)
     with open(tmp_path, "w") as handle:
         json.dump(state, handle, sort_keys=True)
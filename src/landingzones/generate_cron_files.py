@@ -10,6 +10,7 @@ import os
 import sys
 import argparse
 import csv
+import functools
 import re
 import shlex
 
@@ -27,12 +28,31 @@ VALIDATION_TEMPLATE_NAME = 'lz_run_validation.sh'
 OWNER_MARKER_PREFIX = '# landingzones-owner:'
 RUNTIME_FILTER_METADATA = 'runtime_ids.txt'
 PATH_VARIABLE_PATTERN = re.compile(r'\$\{([A-Za-z_][A-Za-z0-9_]*)\}')
+# Stripped TSV text meaning "no value"; 'nan' is how spreadsheet and
+# pandas exports write an empty cell.
+MISSING_TSV_VALUES = frozenset(('', 'nan'))
+# Spreadsheet exports can turn port 22 into "22.0".
+PORT_FLOAT_SUFFIX = '.0'
 DEFAULT_READINESS_POLICY = 'direct'
 DEFAULT_READINESS_STABLE_OBSERVATIONS = '1'
 DEFAULT_READINESS_QUIET_SECONDS = '0'
 DEFAULT_READINESS_FINGERPRINT_MODE = 'path_size_mtime'
 VALID_READINESS_POLICIES = ('direct', 'stable_snapshot')
 VALID_READINESS_FINGERPRINT_MODES = ('path_size_mtime',)
+# Options every transfer rsync starts with, before ports and TSV extras.
+RSYNC_BASE_OPTIONS = '-av --remove-source-files'
+# Full rsync option string; {0} ssh port option, {1} extra TSV options.
+RSYNC_OPTIONS_TEMPLATE = RSYNC_BASE_OPTIONS + '{0}{1}'
+# Header written at the top of every generated cron file; {0} system, {1} user.
+CRON_HEADER_TEMPLATE = """# Update from github landingzones DO NOT manually adjust
+# Generated cron file for {0} system, user {1}
+# put me in $HOME/crontab.d/Landing_Zone.cron
+# Activate cron with:
+# `cat $HOME/crontab.d/*.cron | crontab -`
+# All .cron files should be found or linked at `$HOME/crontab.d`
+SHELL=/bin/sh
+PATH=/usr/bin:/bin
+"""
 
 
 def normalize_bool_text(value):
@@ -199,11 +219,35 @@ def validate_runtime_ids(rows):
         )
 
 
+def read_tsv_rows(handle):
+    """Return ``(rows, columns)`` for a TSV stream, with every value cleaned.
+
+    Rows are built straight from ``csv.reader`` instead of through
+    ``csv.DictReader``, which would allocate a second dict per row. As with
+    DictReader, blank lines are skipped, short rows are padded with empty
+    values and extra trailing values are dropped.
+    """
+    reader = csv.reader(handle, delimiter='\t')
+    # Every row dict shares these key objects; interning them lets lookups
+    # with literal keys such as transfer['source'] match by identity.
+    columns = [sys.intern(column) for column in next(reader, [])]
+    width = len(columns)
+    rows = []
+    for values in reader:
+        if not values:
+            continue
+        if len(values) < width:
+            values.extend([''] * (width - len(values)))
+        rows.append(dict(zip(columns, map(clean_tsv_value, values))))
+    return rows, list(columns)
+
+
 def parse_transfers_file(filename, require_runtime_files=True, runtime_ids=None, systems=None):
     """Parse the transfers.tsv file and return normalized transfer records.
 
     Args:
-        filename: Path to a transfers.tsv file.
+        filename: Path to a transfers.tsv file, or an open text stream such
+            as ``io.StringIO`` holding its content.
         require_runtime_files: When True, keep generator/runtime validation that
             requires fields such as log_file. When False, parse only the shared
             transfer metadata needed for reporting/analysis.
@@ -212,29 +256,30 @@ def parse_transfers_file(filename, require_runtime_files=True, runtime_ids=None,
         systems: Optional exact system values to include before endpoint
             expansion.
     """
-    with open(filename, 'r', newline='') as handle:
-        reader = csv.DictReader(handle, delimiter='\t')
-        columns = list(reader.fieldnames or [])
-        rows = [
-            {
-                column: clean_tsv_value(row.get(column, ''))
-                for column in columns
-            }
-            for row in reader
-        ]
+    if hasattr(filename, 'read'):
+        # In-memory content is parsed as is; the caller owns the stream.
+        rows, columns = read_tsv_rows(filename)
+    else:
+        with open(filename, 'r', newline='') as handle:
+            rows, columns = read_tsv_rows(handle)
+
+    # Legacy files name the column 'user'; normalize it once so consumers
+    # can read 'users' directly.
+    if 'user' in columns and 'users' not in columns:
+        columns[columns.index('user')] = 'users'
+        for row in rows:
+            row['users'] = row.pop('user')
 
+    # Every value was cleaned once on read; comment and enabled filtering
+    # share one pass over that text.
+    filter_enabled = 'enabled' in columns
     rows = [
         row for row in rows
-        if not clean_tsv_value(row.get('runtime_id', '')).startswith('#')
-        and not clean_tsv_value(row.get('system', '')).startswith('#')
+        if not row.get('runtime_id', '').startswith('#')
+        and not row.get('system', '').startswith('#')
+        and (not filter_enabled or row['enabled'].upper() == 'TRUE')
     ]
 
-    if 'enabled' in columns:
-        rows = [
-            row for row in rows
-            if clean_tsv_value(row.get('enabled', '')).upper() == 'TRUE'
-        ]
-
     if 'identifiers' not in columns:
         columns.insert(0, 'identifiers')
         for index, row in enumerate(rows, start=1):
@@ -293,13 +338,13 @@ def parse_transfers_file(filename, require_runtime_files=True, runtime_ids=None,
         'readiness_quiet_seconds',
         'readiness_fingerprint_mode',
     )
-    for column in text_columns:
-        if column not in columns:
-            columns.append(column)
-        for row in rows:
-            row[column] = clean_tsv_value(row.get(column, ''))
+    missing_text_columns = [column for column in text_columns if column not in columns]
+    columns.extend(missing_text_columns)
+    path_variables = config.path_variables
 
     for row in rows:
+        for column in missing_text_columns:
+            row[column] = ''
         row['readiness_policy'] = normalize_readiness_policy(
             row.get('readiness_policy', ''),
             row.get('identifiers', ''),
@@ -323,7 +368,7 @@ def parse_transfers_file(filename, require_runtime_files=True, runtime_ids=None,
         for field_name in ('source', 'destination'):
             row[field_name] = expand_transfer_endpoint(
                 row.get(field_name, ''),
-                config.path_variables,
+                path_variables,
                 row.get('identifiers', ''),
                 field_name,
             )
@@ -338,7 +383,9 @@ def parse_transfers_file(filename, require_runtime_files=True, runtime_ids=None,
             if bool_column not in columns:
                 columns.append(bool_column)
             row[bool_column] = normalize_bool_text(row.get(bool_column, 'FALSE'))
-        row['destination_port'] = re.sub(r'\.0$', '', row.get('destination_port', ''))
+        destination_port = row.get('destination_port', '')
+        if destination_port.endswith(PORT_FLOAT_SUFFIX):
+            row['destination_port'] = destination_port[:-len(PORT_FLOAT_SUFFIX)]
 
     if 'system_user' not in columns:
         columns.append('system_user')
@@ -373,7 +420,9 @@ def parse_transfers_file(filename, require_runtime_files=True, runtime_ids=None,
     if 'script_name' not in columns:
         columns.append('script_name')
 
-    df = TransferTable(rows, columns=columns)
+    # The rows were built by this function, so the table can own them
+    # without a per-row copy.
+    df = TransferTable.from_records(rows, columns=columns)
     validate_transfer_endpoints(df)
     validate_flow_metadata(df)
     validate_readiness_settings(df)
@@ -434,10 +483,13 @@ def filter_transfers_by_runtime_ids(transfers_df, runtime_ids):
     return filtered
 
 
+@functools.lru_cache(maxsize=1024)
 def normalize_source_path(source):
     """Normalize a source path for comparison.
     
     Strips trailing wildcards and slashes to get the base directory.
+    Endpoint keys, overlap checks and source probes normalize the same
+    few roots many times per run, so results are memoized.
     """
     path = source.strip()
     # Remove trailing wildcard patterns
@@ -450,10 +502,25 @@ def normalize_source_path(source):
     return path
 
 
+@functools.lru_cache(maxsize=1024)
+def source_find_target(source):
+    """Return the directory the empty-directory cleanup should run find on.
+
+    A trailing wildcard is stripped so find targets the parent directory;
+    a literal '*' would not expand inside the quoted command.
+    """
+    if source.endswith('/*'):
+        return source[:-2]
+    if source.endswith('*'):
+        # Generic fallback: remove trailing '*' and any trailing '/'
+        return source.rstrip('*').rstrip('/')
+    return source
+
+
 def normalize_io_nice(io_nice):
     """Normalize io_nice input to a shell command prefix or empty string."""
-    value = str(io_nice).strip() if io_nice is not None else ''
-    if not value or value == 'nan':
+    value = clean_tsv_value(io_nice)
+    if not value:
         return ''
     if value.startswith('ionice'):
         return value
@@ -467,8 +534,8 @@ def transfer_uses_portable_metadata(transfer):
 
 def sanitize_identifier(identifier):
     """Convert a transfer identifier into a safe shell script file name stem."""
-    value = str(identifier).strip() if identifier is not None else ''
-    if not value or value == 'nan':
+    value = clean_tsv_value(identifier)
+    if not value:
         return ''
     value = re.sub(r'[^A-Za-z0-9._-]+', '_', value)
     return value.strip('._-')
@@ -499,9 +566,10 @@ def add_owner_marker(content):
         return content
 
     marker = "{0} {1}\n".format(OWNER_MARKER_PREFIX, owner_id)
-    lines = content.splitlines(True)
-    if lines and lines[0].startswith('#!'):
-        return ''.join([lines[0], marker] + lines[1:])
+    if content.startswith('#!'):
+        # Keep the shebang first; only the first line needs splitting off.
+        shebang, newline, rest = content.partition('\n')
+        return ''.join([shebang, newline, marker, rest])
     return marker + content
 
 
@@ -541,13 +609,15 @@ def load_bundled_template(template_name):
 
 def list_visible_directories(path):
     """List visible subdirectories under a local path."""
-    if not os.path.isdir(path):
+    # One directory read; DirEntry.is_dir() needs no per-entry stat.
+    try:
+        with os.scandir(path) as entries:
+            return sorted(
+                entry.name for entry in entries
+                if not entry.name.startswith('.') and entry.is_dir()
+            )
+    except (FileNotFoundError, NotADirectoryError):
         return []
-    return sorted(
-        name for name in os.listdir(path)
-        if not name.startswith('.')
-        and os.path.isdir(os.path.join(path, name))
-    )
 
 
 def split_remote_path(path):
@@ -569,7 +639,7 @@ def unresolved_path_variables(value):
 def expand_path_variables(text, variables, identifier, field_name):
     """Expand ${VAR} placeholders using config-backed path variables."""
     value = str(text).strip() if text is not None else ''
-    if not value or value == 'nan':
+    if value in MISSING_TSV_VALUES:
         return value
 
     missing = []
@@ -630,7 +700,7 @@ def validate_transfer_endpoints(df):
         identifier = row.get('identifiers', '')
         for field_name in ('source', 'destination'):
             value = str(row.get(field_name, '')).strip()
-            if not value or value == 'nan':
+            if value in MISSING_TSV_VALUES:
                 continue
             if '@' in value and ':' not in value:
                 errors.append(
@@ -913,9 +983,10 @@ def get_common_status_lock_file(system):
     return config.resolve_managed_file_path(system, filename, 'flock')
 
 
-def get_notification_status_log_file(system):
+def get_notification_status_log_file(system, notification_config=None):
     """Return the shared per-system TSV notification delivery log path."""
-    notification_config = config.notifications
+    if notification_config is None:
+        notification_config = config.notifications
     configured_file = notification_config.get('status_file', '')
     if configured_file:
         return config.resolve_managed_file_path(system, configured_file, 'log')
@@ -924,9 +995,10 @@ def get_notification_status_log_file(system):
     return config.resolve_managed_file_path(system, filename, 'log')
 
 
-def get_notification_status_lock_file(system):
+def get_notification_status_lock_file(system, notification_config=None):
     """Return the shared per-system notification delivery log lock path."""
-    notification_config = config.notifications
+    if notification_config is None:
+        notification_config = config.notifications
     configured_file = notification_config.get('status_lock_file', '')
     if configured_file:
         return config.resolve_managed_file_path(system, configured_file, 'flock')
@@ -935,6 +1007,31 @@ def get_notification_status_lock_file(system):
     return config.resolve_managed_file_path(system, filename, 'flock')
 
 
+def overlapping_source_pairs(paths):
+    """Return sorted ``(i, j)`` index pairs, ``i < j``, where one path nests in the other.
+
+    A path nests in another when it starts with that path plus ``/``, which
+    is the same as the other's ``/``-separated components being a proper
+    prefix of its own. Sorting by components keeps every subtree contiguous,
+    so one pass with a stack of open ancestors finds all pairs without
+    comparing every path against every other.
+    """
+    split_paths = [path.split('/') for path in paths]
+    order = sorted(range(len(paths)), key=split_paths.__getitem__)
+    pairs = []
+    ancestors = []
+    for index in order:
+        parts = split_paths[index]
+        while ancestors and parts[:len(ancestors[-1][0])] != ancestors[-1][0]:
+            ancestors.pop()
+        for ancestor_parts, ancestor_index in ancestors:
+            # Identical paths are never reported against each other
+            if len(ancestor_parts) < len(parts):
+                pairs.append(tuple(sorted((ancestor_index, index))))
+        ancestors.append((parts, index))
+    return sorted(pairs)
+
+
 def check_overlapping_sources(df):
     """Check for overlapping source paths that could cause conflicts.
     
@@ -949,140 +1046,103 @@ def check_overlapping_sources(df):
     """
     warnings = []
     
-    # Group by system (overlaps only matter on the same system)
-    for system in df['system'].unique():
-        system_df = df[df['system'] == system]
-        sources = system_df['source'].tolist()
-        
-        # Normalize all source paths
-        normalized = [(src, normalize_source_path(src)) for src in sources]
-        
-        # Check each pair for overlaps
-        for i, (src1, norm1) in enumerate(normalized):
-            for j, (src2, norm2) in enumerate(normalized):
-                if i >= j:  # Skip self-comparison and duplicate pairs
-                    continue
-                
-                # Check if one path is a prefix of the other
-                if norm1.startswith(norm2 + '/') or norm2.startswith(norm1 + '/'):
-                    # Determine which is parent/child
-                    if len(norm1) < len(norm2):
-                        parent, child = src1, src2
-                    else:
-                        parent, child = src2, src1
-                    
-                    warnings.append(
-                        "System '{0}': Overlapping source paths detected!\n"
-                        "  Parent: {1}\n"
-                        "  Child:  {2}\n"
-                        "  Files in the child path may be transferred by both rules, "
-                        "causing conflicts.".format(system, parent, child)
-                    )
+    # Group by system (overlaps only matter on the same system); one pass
+    # over the rows instead of a column comparison mask per system.
+    sources_by_system = {}
+    for _, row in df.iterrows():
+        sources_by_system.setdefault(row['system'], []).append(row['source'])
+
+    for system, sources in sources_by_system.items():
+        normalized = [normalize_source_path(src) for src in sources]
+        for i, j in overlapping_source_pairs(normalized):
+            # Determine which is parent/child
+            if len(normalized[i]) < len(normalized[j]):
+                parent, child = sources[i], sources[j]
+            else:
+                parent, child = sources[j], sources[i]
+
+            warnings.append(
+                "System '{0}': Overlapping source paths detected!\n"
+                "  Parent: {1}\n"
+                "  Child:  {2}\n"
+                "  Files in the child path may be transferred by both rules, "
+                "causing conflicts.".format(system, parent, child)
+            )
     
     return warnings
 
 
 def generate_cron_header(system, user):
     """Generate header comments for cron file"""
-    header = """# Update from github landingzones DO NOT manually adjust
-# Generated cron file for {0} system, user {1}
-# put me in $HOME/crontab.d/Landing_Zone.cron
-# Activate cron with:
-# `cat $HOME/crontab.d/*.cron | crontab -`
-# All .cron files should be found or linked at `$HOME/crontab.d`
-SHELL=/bin/sh
-PATH=/usr/bin:/bin
-""".format(system, user)
-    return header
+    return CRON_HEADER_TEMPLATE.format(system, user)
+
+
+def command_field_text(value):
+    """Return an optional transfer field as text, mapping None and 'nan' to ''.
+
+    Rows from parse_transfers_file are already clean strings and pass
+    straight through; the checks only matter for hand-built transfers.
+    """
+    if value is None:
+        return ''
+    if not isinstance(value, str):
+        value = str(value)
+    return '' if value == 'nan' else value
+
+
+@functools.lru_cache(maxsize=256)
+def _rsync_options(source_port, destination_port, rsync_options):
+    # A source port wins over a destination port; only one -e is passed.
+    port_option = ''
+    for port in (source_port, destination_port):
+        if port.isdigit():
+            port_option = " -e 'ssh -p {0}'".format(port)
+            break
+    extra_options = " {0}".format(rsync_options) if rsync_options else ''
+    return RSYNC_OPTIONS_TEMPLATE.format(port_option, extra_options)
+
+
+def build_rsync_options(source_port, destination_port, rsync_options):
+    """Return the rsync option string for a transfer's ports and TSV options.
+
+    Transfers share a handful of port/option combinations, so the assembled
+    string is memoized on the cleaned values.
+    """
+    extra_options = command_field_text(rsync_options).strip()
+    return _rsync_options(
+        command_field_text(source_port).strip(),
+        command_field_text(destination_port).strip(),
+        '' if extra_options == 'nan' else extra_options,
+    )
+
 
 def build_transfer_commands(transfer):
     """Build the shell commands and log paths for a transfer."""
     source = transfer['source']
     destination = transfer['destination']
-    rsync_options = transfer.get('rsync_options', '')
-    log_file = transfer.get('log_file', '')
-    destination_port = transfer.get('destination_port', '')
-    source_port = transfer.get('source_port', '')
-    flock_file = transfer.get('flock_file', '')
-    frequency = transfer.get('frequency', '')
-    io_nice = transfer.get('io_nice', '')
+    rsync_options = command_field_text(transfer.get('rsync_options', ''))
+    log_file = command_field_text(transfer.get('log_file', ''))
+    destination_port = command_field_text(transfer.get('destination_port', ''))
+    source_port = command_field_text(transfer.get('source_port', ''))
+    flock_file = command_field_text(transfer.get('flock_file', ''))
+    io_nice = command_field_text(transfer.get('io_nice', ''))
     identifier = transfer.get('identifiers', 'transfer')
     
-    # Ensure all values are strings and handle potential NaN values
-    rsync_options = str(rsync_options) if rsync_options is not None else ''
-    log_file = str(log_file) if log_file is not None else ''
-    destination_port = (str(destination_port)
-                        if destination_port is not None else '')
-    source_port = (str(source_port)
-                   if source_port is not None else '')
-    flock_file = str(flock_file) if flock_file is not None else ''
-    frequency = str(frequency) if frequency is not None else ''
-    io_nice = str(io_nice) if io_nice is not None else ''
-    
-    # Clean up any 'nan' strings that might have come from NaN values
-    if rsync_options == 'nan':
-        rsync_options = ''
-    if log_file == 'nan':
-        log_file = ''
-    if destination_port == 'nan':
-        destination_port = ''
-    if source_port == 'nan':
-        source_port = ''
-    if flock_file == 'nan':
-        flock_file = ''
-    if frequency == 'nan':
-        frequency = ''
-    if io_nice == 'nan':
-        io_nice = ''
-    
-    # Base rsync options
-    base_options = "-av --remove-source-files"
     staging_paths = build_staging_paths(destination, identifier)
-    
-    # Build SSH options for ports (both source and destination may need ports)
-    ssh_ports = []
-    if source_port and source_port.strip().isdigit():
-        ssh_ports.append("-e 'ssh -p {0}'".format(source_port.strip()))
-    elif destination_port and destination_port.strip().isdigit():
-        # If only destination port is specified, use it
-        ssh_ports.append("-e 'ssh -p {0}'".format(destination_port.strip()))
-    
-    # Add SSH port option if specified
-    if ssh_ports:
-        port_option = ssh_ports[0]
-        base_options = "{0} {1}".format(base_options, port_option)
-    
-    # Combine with additional options if provided
-    if rsync_options:
-        rsync_options_clean = rsync_options.strip()
-        if rsync_options_clean:
-            options = "{0} {1}".format(base_options, rsync_options_clean)
-        else:
-            options = base_options
-    else:
-        options = base_options
-    
+
     io_nice_cmd = normalize_io_nice(io_nice)
-    if io_nice_cmd:
-        rsync_cmd = "{0} rsync {1} {2} {3}".format(
-            io_nice_cmd, options, source, staging_paths['staged_destination'])
-    else:
-        rsync_cmd = "rsync {0} {1} {2}".format(
-            options, source, staging_paths['staged_destination']
-        )
+    rsync_cmd = "{0}rsync {1} {2} {3}".format(
+        "{0} ".format(io_nice_cmd) if io_nice_cmd else '',
+        build_rsync_options(source_port, destination_port, rsync_options),
+        source,
+        staging_paths['staged_destination'],
+    )
 
-    # For find, strip a trailing wildcard so 'find' targets the parent dir
-    # This avoids passing a literal '*' to find (which won't expand inside -c quotes)
-    find_target = source
-    if source.endswith('/*'):
-        find_target = source[:-2]
-    elif source.endswith('*'):
-        # Generic fallback: remove trailing '*' and any trailing '/'
-        find_target = source.rstrip('*').rstrip('/')
+    find_target = source_find_target(source)
     source_remote, source_path = split_remote_path(find_target)
     find_path = source_path if source_remote else find_target
     find_inner_cmd = "find {0} -mindepth 1 -type d -empty -delete".format(
-        shell_path(find_path) if source_remote else shell_path(find_path)
+        shell_path(find_path)
     )
     if source_remote:
         find_cmd = build_remote_shell_command(
@@ -1113,9 +1173,17 @@ def build_transfer_commands(transfer):
     flock_command = config.get_flock_path(transfer['system'])
     common_status_log_file = get_common_status_log_file(transfer['system'])
     common_status_lock_file = get_common_status_lock_file(transfer['system'])
+    # config.notifications merges defaults, YAML and runtime values on every
+    # access; resolve it once and share it with the status-file helpers.
     notification_config = config.notifications
-    notification_status_log_file = get_notification_status_log_file(transfer['system'])
-    notification_status_lock_file = get_notification_status_lock_file(transfer['system'])
+    notification_status_log_file = get_notification_status_log_file(
+        transfer['system'],
+        notification_config,
+    )
+    notification_status_lock_file = get_notification_status_lock_file(
+        transfer['system'],
+        notification_config,
+    )
 
     return {
         'prepare_cmd': prepare_cmd,
@@ -1144,22 +1212,9 @@ def build_transfer_command(transfer):
     commands = build_transfer_commands(transfer)
     log_file = commands['log_file']
     log_redirect = " >> {0} 2>&1".format(log_file) if log_file else ''
-    if log_redirect:
-        return "{0}{1} && {2}{3} && {4}{5} && {6}{7}".format(
-            commands['prepare_cmd'],
-            log_redirect,
-            commands['rsync_cmd'],
-            log_redirect,
-            commands['promote_cmd'],
-            log_redirect,
-            commands['find_cmd'],
-            log_redirect,
-        )
-    return "{0} && {1} && {2} && {3}".format(
-        commands['prepare_cmd'],
-        commands['rsync_cmd'],
-        commands['promote_cmd'],
-        commands['find_cmd'],
+    return " && ".join(
+        commands[step] + log_redirect
+        for step in ('prepare_cmd', 'rsync_cmd', 'promote_cmd', 'find_cmd')
     )
 
 
@@ -1183,24 +1238,17 @@ def generate_iterative_script_content(transfer):
     )
     destination_root = destination_path.rstrip('/') or destination_path
 
-    base_options = "-av --remove-source-files"
     source_port = str(transfer.get('source_port', '') or '').strip()
     destination_port = str(transfer.get('destination_port', '') or '').strip()
-    if source_port.isdigit():
-        base_options = "{0} -e 'ssh -p {1}'".format(base_options, source_port)
-    elif destination_port.isdigit():
-        base_options = "{0} -e 'ssh -p {1}'".format(base_options, destination_port)
-
-    rsync_options = str(transfer.get('rsync_options', '') or '').strip()
-    if rsync_options and rsync_options != 'nan':
-        base_options = "{0} {1}".format(base_options, rsync_options)
-
+    options = build_rsync_options(
+        source_port,
+        destination_port,
+        transfer.get('rsync_options', ''),
+    )
     io_nice_cmd = normalize_io_nice(transfer.get('io_nice', ''))
-    rsync_cmd = "rsync {0}".format(base_options)
-    dry_run_rsync_cmd = "rsync --dry-run {0}".format(base_options)
-    if io_nice_cmd:
-        rsync_cmd = "{0} {1}".format(io_nice_cmd, rsync_cmd)
-        dry_run_rsync_cmd = "{0} {1}".format(io_nice_cmd, dry_run_rsync_cmd)
+    io_nice_prefix = "{0} ".format(io_nice_cmd) if io_nice_cmd else ''
+    rsync_cmd = "{0}rsync {1}".format(io_nice_prefix, options)
+    dry_run_rsync_cmd = "{0}rsync --dry-run {1}".format(io_nice_prefix, options)
 
     if source_remote:
         remote_find_cmd = (
@@ -2384,15 +2432,31 @@ def generate_rsync_command(transfer):
     return build_transfer_command(transfer)
 
 
-def generate_cron_entry(transfer, script_path):
-    """Generate cron entry that executes a transfer shell script."""
-    frequency = transfer.get('frequency', '')
-    cron_schedule = str(frequency).strip() if frequency is not None else ''
-    if not cron_schedule or cron_schedule == 'nan':
-        cron_schedule = config.default_cron_frequency
+def generate_cron_entry(transfer, script_path, default_frequency=None):
+    """Generate cron entry that executes a transfer shell script.
+
+    Rows without a frequency use ``default_frequency``, falling back to
+    ``config.default_cron_frequency`` when the caller did not resolve it.
+    """
+    cron_schedule = cron_schedule_text(transfer.get('frequency', ''))
+    if not cron_schedule:
+        if default_frequency is None:
+            default_frequency = config.default_cron_frequency
+        cron_schedule = default_frequency
     return "{0} /bin/sh {1}".format(cron_schedule, script_path)
 
 
+@functools.lru_cache(maxsize=64)
+def cron_schedule_text(frequency):
+    """Return a row's cron schedule as stripped text, or '' when unset.
+
+    A catalog uses only a few distinct schedules, so each is cleaned once.
+    The configured default is applied by the caller and never cached.
+    """
+    cron_schedule = str(frequency).strip() if frequency is not None else ''
+    return '' if cron_schedule == 'nan' else cron_schedule
+
+
 def get_deployed_script_path(system, script_name):
     """Return the configured deployed script path for a system."""
     script_dir = config.get_rit_managed_path(system, 'sh_output')
@@ -2404,9 +2468,9 @@ def get_validation_fixture_container_candidates(source_path):
     candidates = []
     absolute_source = os.path.abspath(normalize_source_path(source_path))
     marker = "{0}tests{0}test_local{0}".format(os.sep)
-    if marker in absolute_source:
-        relative_tail = absolute_source.split(marker, 1)[1]
-        first_segment = relative_tail.split(os.sep, 1)[0]
+    _, found, relative_tail = absolute_source.partition(marker)
+    if found:
+        first_segment = relative_tail.partition(os.sep)[0]
         if first_segment:
             candidates.append(first_segment)
 
@@ -2484,7 +2548,7 @@ def build_validation_wrapper_specs(transfers_df):
     flow_groups = {}
     for transfer in definitions_from_dataframe(transfers_df):
         flow_group = transfer.flow_group.strip()
-        if not flow_group or flow_group == 'nan':
+        if flow_group in MISSING_TSV_VALUES:
             continue
         if not transfer.is_entry_point:
             continue
@@ -2606,8 +2670,7 @@ def validation_script_names(transfers_df=None):
 
 def write_validation_scripts(validation_scripts_dir, transfers_df=None):
     """Write shared helper shell scripts into the validation scripts directory."""
-    if not os.path.isdir(validation_scripts_dir):
-        os.makedirs(validation_scripts_dir)
+    os.makedirs(validation_scripts_dir, exist_ok=True)
     validation_script_path = os.path.join(validation_scripts_dir, validation_helper_name())
     with open(validation_script_path, 'w') as handle:
         handle.write(add_owner_marker(generate_validation_script_content()))
@@ -2657,8 +2720,8 @@ def write_runtime_filter_metadata(crontab_dir, runtime_ids):
     """Record the runtime_id values represented by generated artifacts."""
     metadata_path = runtime_filter_metadata_path(crontab_dir)
     metadata_dir = os.path.dirname(metadata_path)
-    if metadata_dir and not os.path.exists(metadata_dir):
-        os.makedirs(metadata_dir)
+    if metadata_dir:
+        os.makedirs(metadata_dir, exist_ok=True)
 
     values = []
     for runtime_id in runtime_ids:
@@ -2706,33 +2769,83 @@ def remove_stale_validation_scripts(validation_scripts_dir, transfers_df=None):
         os.remove(path)
 
 
-def generate_cron_file(runtime_id, transfers_df, scripts_dir):
-    """Generate complete cron file content from DataFrame subset"""
+def iter_cron_file_parts(runtime_id, transfers_df, scripts_dir, default_frequency=None):
+    """Yield cron file content for a DataFrame subset, header first"""
+    if default_frequency is None:
+        # Resolve once per file rather than once per transfer row.
+        default_frequency = config.default_cron_frequency
     # Get the first row to extract system and user info
     first_transfer = transfers_df.iloc[0]
     system = first_transfer['system']
-    user = first_transfer.get('users', first_transfer.get('user', ''))
+    # The users column is optional in transfers.tsv.
+    user = first_transfer.get('users', '')
     
-    content = generate_cron_header(system, user)
+    # Every row shares the file's system, so its deployed script directory
+    # is resolved once too.
+    script_dir = config.get_rit_managed_path(system, 'sh_output')
+    yield generate_cron_header(system, user)
     
     for i, (_, transfer) in enumerate(transfers_df.iterrows()):
         if i > 0:
-            content += "\n"
+            yield "\n"
         
         # Add comment describing the transfer
         source = transfer['source']
         dest = transfer['destination']
         identifier = transfer['identifiers']
-        content += "# [{0}] Transfer from {1} to {2}\n".format(identifier, source, dest)
+        yield "# [{0}] Transfer from {1} to {2}\n".format(identifier, source, dest)
         
-        script_path = get_deployed_script_path(system, transfer['script_name'])
-        content += generate_cron_entry(transfer, script_path) + "\n"
-    
-    return content
+        script_path = os.path.join(script_dir, transfer['script_name'])
+        yield generate_cron_entry(transfer, script_path, default_frequency) + "\n"
+
+
+def generate_cron_file(runtime_id, transfers_df, scripts_dir, default_frequency=None):
+    """Generate complete cron file content from DataFrame subset"""
+    return "".join(
+        iter_cron_file_parts(runtime_id, transfers_df, scripts_dir, default_frequency)
+    )
+
 
+def write_cron_file(output_path, runtime_id, transfers_df, scripts_dir, default_frequency=None):
+    """Stream a cron file with its owner marker to output_path.
 
-def main(argv=None):
-    """Main function to generate all cron files."""
+    Parts are written to a temporary file next to output_path as they are
+    generated, and renamed over it only once generation succeeds, so a
+    failure never leaves a truncated cron file for deployment to install.
+    """
+    parts = iter_cron_file_parts(runtime_id, transfers_df, scripts_dir, default_frequency)
+    tmp_path = "{0}.tmp".format(output_path)
+    try:
+        with open(tmp_path, 'w') as handle:
+            # The owner marker goes after the header's first line if it is a
+            # shebang, which add_owner_marker decides from the header alone.
+            handle.write(add_owner_marker(next(parts)))
+            handle.writelines(parts)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def unique_log_files(transfers_df):
+    """Return the non-blank log files of a transfer table in first-seen order"""
+    return list(dict.fromkeys(
+        log_file for log_file in transfers_df['log_file'].tolist()
+        if log_file and log_file.strip()
+    ))
+
+
+def main(argv=None, out=None):
+    """Main function to generate all cron files.
+
+    Progress and summary lines are written to ``out`` (default: stdout), so
+    callers can capture them without swapping ``sys.stdout``.
+    """
+    if out is None:
+        out = sys.stdout
     parser = argparse.ArgumentParser(
         description='Generate cron files from transfers.tsv configuration'
     )
@@ -2793,21 +2906,14 @@ def main(argv=None):
     validation_scripts_dir = config.validation_scripts_dir
     
     if not os.path.exists(transfers_file):
-        print("Error: {0} not found".format(transfers_file))
+        print("Error: {0} not found".format(transfers_file), file=out)
         return 1
     
-    # Create output directory if it doesn't exist
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-    
-    # Create log directory if it doesn't exist
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
-
-    if not os.path.exists(scripts_dir):
-        os.makedirs(scripts_dir)
-    if not os.path.exists(validation_scripts_dir):
-        os.makedirs(validation_scripts_dir)
+    # Create the output, log, and script directories if they don't exist
+    os.makedirs(output_dir, exist_ok=True)
+    os.makedirs(log_dir, exist_ok=True)
+    os.makedirs(scripts_dir, exist_ok=True)
+    os.makedirs(validation_scripts_dir, exist_ok=True)
     
     # Load transfers through the catalog seam used by build/runtime paths.
     try:
@@ -2818,43 +2924,43 @@ def main(argv=None):
             runtime_ids=config.runtime_ids,
         )
     except ValueError as exc:
-        print("Error: {0}".format(exc))
+        print("Error: {0}".format(exc), file=out)
         return 1
     
     if transfers_df.empty:
-        print("No transfers found in the file")
+        print("No transfers found in the file", file=out)
         return 1
     
     # Check for overlapping source paths
     overlap_warnings = check_overlapping_sources(transfers_df)
     if overlap_warnings:
-        print("\n\033[93m⚠ WARNING: Overlapping source paths detected!\033[0m")
-        print("=" * 60)
+        print("\n\033[93m⚠ WARNING: Overlapping source paths detected!\033[0m", file=out)
+        print("=" * 60, file=out)
         for warning in overlap_warnings:
-            print("\n" + warning)
-        print("\n" + "=" * 60)
-        print("Consider adjusting your transfers.tsv to avoid conflicts.")
-        print("Continuing with generation...\n")
+            print("\n" + warning, file=out)
+        print("\n" + "=" * 60, file=out)
+        print("Consider adjusting your transfers.tsv to avoid conflicts.", file=out)
+        print("Continuing with generation...\n", file=out)
 
     shared_file_pair_warnings = transfers_df.attrs.get('shared_file_pair_warnings', [])
     if shared_file_pair_warnings:
-        print("\n\033[93m⚠ WARNING: Shared log/flock pairs detected!\033[0m")
-        print("=" * 60)
+        print("\n\033[93m⚠ WARNING: Shared log/flock pairs detected!\033[0m", file=out)
+        print("=" * 60, file=out)
         for warning in shared_file_pair_warnings:
-            print("\n" + warning)
-        print("\n" + "=" * 60)
-        print("Review transfer definitions for accidental log/lock reuse.")
-        print("Continuing with generation...\n")
+            print("\n" + warning, file=out)
+        print("\n" + "=" * 60, file=out)
+        print("Review transfer definitions for accidental log/lock reuse.", file=out)
+        print("Continuing with generation...\n", file=out)
 
     shared_main_lock_warnings = transfers_df.attrs.get('shared_main_lock_warnings', [])
     if shared_main_lock_warnings:
-        print("\n\033[93m⚠ WARNING: Shared main transfer locks detected!\033[0m")
-        print("=" * 60)
+        print("\n\033[93m⚠ WARNING: Shared main transfer locks detected!\033[0m", file=out)
+        print("=" * 60, file=out)
         for warning in shared_main_lock_warnings:
-            print("\n" + warning)
-        print("\n" + "=" * 60)
-        print("Review whether shared top-level flock files are intentional serialization.")
-        print("Continuing with generation...\n")
+            print("\n" + warning, file=out)
+        print("\n" + "=" * 60, file=out)
+        print("Review whether shared top-level flock files are intentional serialization.", file=out)
+        print("Continuing with generation...\n", file=out)
     
     remove_stale_generated_scripts(
         scripts_dir,
@@ -2874,6 +2980,7 @@ def main(argv=None):
 
     # Group by runtime_id and generate cron files
     grouped = transfers_df.groupby('runtime_id')
+    default_frequency = config.default_cron_frequency
 
     for runtime_id, group_df in grouped:
         for _, transfer in group_df.iterrows():
@@ -2884,46 +2991,42 @@ def main(argv=None):
             os.chmod(script_path, 0o755)
 
         filename = cron_file_name(runtime_id)
-        content = generate_cron_file(runtime_id, group_df, scripts_dir)
-        
-        # Write the cron file
-        output_path = os.path.join(output_dir, filename)
-        with open(output_path, 'w') as file:
-            file.write(add_owner_marker(content))
+        write_cron_file(
+            os.path.join(output_dir, filename),
+            runtime_id,
+            group_df,
+            scripts_dir,
+            default_frequency=default_frequency,
+        )
         
-        # Get unique log files for this group
-        log_files = group_df['log_file'].dropna().unique()
-        # Filter out empty strings
-        log_files = [lf for lf in log_files if lf.strip()]
-        if len(log_files) > 0:
+        log_files = unique_log_files(group_df)
+        if log_files:
             log_info = " (logs to: {0})".format(', '.join(log_files))
         else:
             log_info = ""
         
         transfer_count = len(group_df)
         print("Generated {0} with {1} transfer(s)".format(
-            filename, transfer_count))
+            filename, transfer_count), file=out)
         if log_info:
-            print("  {0}".format(log_info.strip()))
+            print("  {0}".format(log_info.strip()), file=out)
     
     # Print summary statistics
-    print("\nSummary:")
-    print("Total transfers: {0}".format(len(transfers_df)))
+    print("\nSummary:", file=out)
+    print("Total transfers: {0}".format(len(transfers_df)), file=out)
     unique_combinations = transfers_df['runtime_id'].nunique()
-    print("Unique runtime IDs: {0}".format(unique_combinations))
+    print("Unique runtime IDs: {0}".format(unique_combinations), file=out)
     if 'system' in transfers_df.columns:
-        print("Systems: {0}".format(', '.join(transfers_df['system'].unique())))
+        print("Systems: {0}".format(', '.join(transfers_df['system'].unique())), file=out)
     if 'users' in transfers_df.columns:
-        print("Users: {0}".format(', '.join(transfers_df['users'].unique())))
-    print("Validation scripts: {0}".format(validation_scripts_dir))
+        print("Users: {0}".format(', '.join(transfers_df['users'].unique())), file=out)
+    print("Validation scripts: {0}".format(validation_scripts_dir), file=out)
     
     # Show log file information
     if 'log_file' in transfers_df.columns:
-        unique_logs = transfers_df['log_file'].dropna().unique()
-        # Filter out empty strings
-        unique_logs = [lf for lf in unique_logs if lf.strip()]
-        if len(unique_logs) > 0:
-            print("Log files: {0}".format(', '.join(unique_logs)))
+        unique_logs = unique_log_files(transfers_df)
+        if unique_logs:
+            print("Log files: {0}".format(', '.join(unique_logs)), file=out)
     
     return 0
 
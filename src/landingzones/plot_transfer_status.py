@@ -9,11 +9,6 @@ import re
 import socket
 import sys
 
-try:
-    import pandas as pd
-except ModuleNotFoundError:
-    pd = None
-
 from landingzones.config import config
 from landingzones import generate_cron_files as gcf
 from landingzones.transfer_loading import (
@@ -30,6 +25,34 @@ from landingzones.transfer_definitions import (
 )
 
 
+class _DeferredPandas:
+    """Stand-in for ``pd`` that imports pandas on first attribute access."""
+
+    def __getattr__(self, name):
+        module = load_pandas()
+        if module is None:
+            raise ModuleNotFoundError("No module named 'pandas'")
+        return getattr(module, name)
+
+
+# pandas is imported on first use, so `--help` and the skip paths do not pay
+# for it; load_pandas() swaps this placeholder for the real module.
+pd = _DeferredPandas()
+
+
+def load_pandas():
+    """Import pandas on first use; return None when it is not installed."""
+    global pd
+    if isinstance(pd, _DeferredPandas):
+        try:
+            import pandas
+        except ModuleNotFoundError:
+            pd = None
+        else:
+            pd = pandas
+    return pd
+
+
 WINDOW_SPECS = (
     ("1d", "Last day"),
     ("7d", "Last 7 days"),
@@ -45,16 +68,15 @@ def normalize_directory_suffix(value):
     if not text or text == "nan":
         return ""
     text = text.rstrip("/")
-    if ":" in text and "/" not in text.split(":", 1)[0]:
-        text = text.split(":", 1)[1].rstrip("/")
-    if "/" in text:
-        return text.rsplit("/", 1)[-1]
-    return text
+    remote, separator, remote_path = text.partition(":")
+    if separator and "/" not in remote:
+        text = remote_path.rstrip("/")
+    return text.rpartition("/")[2]
 
 
 def require_pandas():
     """Return False and print a clear message when report dependencies are missing."""
-    if pd is not None:
+    if load_pandas() is not None:
         return True
     print(
         "Report generation was skipped because pandas is not installed.\n"
@@ -303,17 +325,15 @@ def aggregate_runs(log_df, terminal_identifiers, anchor_time=None, warning_hours
 
     for run_group, run_rows in log_df.groupby("run_group", sort=False):
         rows = run_rows.sort_values("datetime").reset_index(drop=True)
-        initiated_rows = rows[rows["status"] == "initiated"].sort_values("datetime")
-        started_at = (
-            initiated_rows.iloc[0]["datetime"]
-            if not initiated_rows.empty
-            else rows.iloc[0]["datetime"]
-        )
-        latest_start = (
-            initiated_rows.iloc[-1]["datetime"]
-            if not initiated_rows.empty
-            else rows.iloc[0]["datetime"]
-        )
+        # rows is already in time order, so its initiated subset is too.
+        # Scalars are read with iat; chaining iloc[i][col] builds a Series
+        # for the whole row just to read one value.
+        initiated_times = rows.loc[rows["status"] == "initiated", "datetime"]
+        if initiated_times.empty:
+            started_at = latest_start = rows["datetime"].iat[0]
+        else:
+            started_at = initiated_times.iat[0]
+            latest_start = initiated_times.iat[-1]
         state, state_row, latest_row = _select_state_row(
             rows,
             terminal_identifiers,
@@ -321,11 +341,12 @@ def aggregate_runs(log_df, terminal_identifiers, anchor_time=None, warning_hours
             anchor,
             warning_hours,
         )
+        last_row = rows.iloc[-1]
         records.append(
             {
-                "run": rows.iloc[-1].get("run_name") or rows.iloc[-1]["directory_suffix"],
+                "run": last_row.get("run_name") or last_row["directory_suffix"],
                 "run_group": run_group,
-                "run_id": rows.iloc[-1].get("run_id", ""),
+                "run_id": last_row.get("run_id", ""),
                 "tags": normalize_tags_text(rows["tags"].tolist()),
                 "started_at": started_at,
                 "latest_start": latest_start,
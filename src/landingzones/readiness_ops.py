@@ -2,18 +2,22 @@
 # -*- coding: utf-8 -*-
 """Shared readiness, preflight, and deployment helpers."""
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
-import errno
 from io import StringIO
+import functools
 import os
 import re
 import shlex
 import shutil
 import socket
+import stat
 import subprocess
 import sys
+import tempfile
 
-from landingzones.config import config
+from landingzones.config import config, expand_path
 from landingzones.generate_cron_files import (
     configured_artifact_prefix,
     cron_file_name,
@@ -28,15 +32,64 @@ from landingzones.transfer_loading import (
 )
 
 
+# Hard limit for a single probe/crontab command, so one hung ssh cannot stall
+# the readiness check (ssh itself gives up connecting after ConnectTimeout=10).
+COMMAND_TIMEOUT_SECONDS = 15
+# TCP reachability probe run before ssh, so a dead host fails in seconds
+# instead of waiting out ssh's ConnectTimeout.
+SSH_PREFLIGHT_TIMEOUT_SECONDS = 2
+# Host names that always refer to this machine, checked before any DNS lookup.
+LOOPBACK_HOSTS = frozenset(('localhost', '127.0.0.1', '::1'))
+# Log file values meaning the transfer has no log file configured.
+NO_LOG_FILE_VALUES = frozenset((None, '', 'nan'))
+
+
+def stdout_supports_color():
+    """Return True when ANSI colors should be written to stdout.
+
+    Honours the NO_COLOR convention and leaves piped or redirected output
+    (cron mail, CI logs) as plain text.
+    """
+    if os.environ.get('NO_COLOR'):
+        return False
+    try:
+        return sys.stdout.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+# Decided once at import so status lines do not re-check the terminal
+USE_COLOR = stdout_supports_color()
+
+
 class Colors:
-    """ANSI color codes for console output."""
+    """ANSI color codes for console output, empty when color is disabled."""
+
+    GREEN = '\033[92m' if USE_COLOR else ''
+    RED = '\033[91m' if USE_COLOR else ''
+    YELLOW = '\033[93m' if USE_COLOR else ''
+    BLUE = '\033[94m' if USE_COLOR else ''
+    BOLD = '\033[1m' if USE_COLOR else ''
+    END = '\033[0m' if USE_COLOR else ''
+
+
+def run_command(cmd, input=None, timeout=COMMAND_TIMEOUT_SECONDS):
+    """Run a command and return ``(returncode, stdout, stderr)`` as text.
 
-    GREEN = '\033[92m'
-    RED = '\033[91m'
-    YELLOW = '\033[93m'
-    BLUE = '\033[94m'
-    BOLD = '\033[1m'
-    END = '\033[0m'
+    Commands that exceed ``timeout`` seconds are killed and reported as
+    ``(124, '', 'timeout')``, the exit status used by coreutils ``timeout``.
+    """
+    try:
+        proc = subprocess.run(
+            cmd,
+            input=input,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        return 124, '', 'timeout'
+    return proc.returncode, proc.stdout, proc.stderr
 
 
 def _load_identity_transfers(transfers_file, runtime_ids=None):
@@ -52,34 +105,45 @@ def _load_identity_transfers(transfers_file, runtime_ids=None):
 def normalize_directory_path(path):
     """Collapse redundant slashes in a filesystem path string."""
     value = str(path).strip() if path is not None else ''
-    if not value:
+    if '//' not in value:
+        # Most configured paths are already clean; skip the regex pass.
         return value
     return re.sub(r'/+', '/', value)
 
 
-def print_status(message, status, details=None):
-    """Print formatted status message."""
-    if status == "OK":
-        icon = "{0}✓{1}".format(Colors.GREEN, Colors.END)
-        status_text = "{0}OK{1}".format(Colors.GREEN, Colors.END)
-    elif status == "WARN":
-        icon = "{0}⚠{1}".format(Colors.YELLOW, Colors.END)
-        status_text = "{0}WARNING{1}".format(Colors.YELLOW, Colors.END)
-    elif status == "INFO" or status == "...":
-        icon = "{0}ℹ{1}".format(Colors.BLUE, Colors.END)
-        status_text = "{0}INFO{1}".format(Colors.BLUE, Colors.END)
-    else:
-        icon = "{0}✗{1}".format(Colors.RED, Colors.END)
-        status_text = "{0}ERROR{1}".format(Colors.RED, Colors.END)
+def _status_markers(color, symbol, label):
+    return (
+        "{0}{1}{2}".format(color, symbol, Colors.END),
+        "{0}{1}{2}".format(color, label, Colors.END),
+    )
+
+
+# Colored (icon, label) pairs per status, built once instead of per line
+STATUS_MARKERS = {
+    "OK": _status_markers(Colors.GREEN, "✓", "OK"),
+    "WARN": _status_markers(Colors.YELLOW, "⚠", "WARNING"),
+    "INFO": _status_markers(Colors.BLUE, "ℹ", "INFO"),
+    "...": _status_markers(Colors.BLUE, "ℹ", "INFO"),
+}
+ERROR_STATUS_MARKERS = _status_markers(Colors.RED, "✗", "ERROR")
 
-    print("{0} {1}: {2}".format(icon, message, status_text))
+
+def print_status(message, status, details=None, out=None):
+    """Print formatted status message to ``out`` (default: ``sys.stdout``)."""
+    icon, status_text = STATUS_MARKERS.get(status, ERROR_STATUS_MARKERS)
+    line = "{0} {1}: {2}\n".format(icon, message, status_text)
     if details:
-        print("   {0}".format(details))
+        line = "{0}   {1}\n".format(line, details)
+    (sys.stdout if out is None else out).write(line)
+
+
+# Section header layout with the color codes already filled in
+HEADER_TEMPLATE = "\n{0}{1}=== {{0}} ==={2}\n".format(Colors.BOLD, Colors.BLUE, Colors.END)
 
 
-def print_header(title):
-    """Print section header."""
-    print("\n{0}{1}=== {2} ==={3}".format(Colors.BOLD, Colors.BLUE, title, Colors.END))
+def print_header(title, out=None):
+    """Print section header to ``out`` (default: ``sys.stdout``)."""
+    (sys.stdout if out is None else out).write(HEADER_TEMPLATE.format(title))
 
 
 def check_required_tools():
@@ -91,10 +155,8 @@ def check_required_tools():
 
     for tool in tools:
         try:
-            proc = subprocess.Popen(['which', tool], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            stdout, _ = proc.communicate()
-            if proc.returncode == 0:
-                location = stdout.decode('utf-8').strip()
+            location = shutil.which(tool)
+            if location:
                 print_status("{0} available".format(tool), "OK", "Location: {0}".format(location))
             else:
                 print_status("{0} missing".format(tool), "ERROR", "Please install {0}".format(tool))
@@ -109,7 +171,7 @@ def check_required_tools():
 def check_flock_command(system):
     """Check whether the configured flock binary exists and is executable."""
     flock_path = config.get_flock_path(system)
-    expanded_path = os.path.expandvars(os.path.expanduser(flock_path))
+    expanded_path = expand_path(flock_path)
 
     if not os.path.exists(expanded_path):
         print_status("Flock binary", "ERROR", "Configured path does not exist: {0}".format(flock_path))
@@ -123,16 +185,20 @@ def check_flock_command(system):
     return True
 
 
-def inspect_local_directory(path, check_writable=True):
-    """Return structured status for a local directory check."""
-    expanded_path = os.path.expandvars(os.path.expanduser(str(path)))
+def _local_directory_target(path):
+    """Return ``(check_path, is_wildcard)`` for a configured local directory."""
+    expanded_path = expand_path(path)
     normalized_path = normalize_directory_path(expanded_path)
-    check_path = normalized_path.rstrip('/') or '/'
-    is_wildcard = False
-    if normalized_path.endswith('/*') or normalized_path.endswith('*'):
-        check_path = normalized_path.rstrip('*').rstrip('/') or '/'
-        is_wildcard = True
+    # A trailing wildcard is checked through its parent directory; nothing
+    # is globbed, since only the parent's existence and mode matter.
+    is_wildcard = normalized_path.endswith('*')
+    if is_wildcard:
+        normalized_path = normalized_path.rstrip('*')
+    return normalized_path.rstrip('/') or '/', is_wildcard
 
+
+def _local_directory_status(check_path, is_wildcard, exists, is_dir, check_writable):
+    """Build the structured local directory status from what is known."""
     result = {
         'ok': False,
         'status': 'missing',
@@ -141,12 +207,11 @@ def inspect_local_directory(path, check_writable=True):
         'is_wildcard': is_wildcard,
         'missing': False,
     }
-
-    if not os.path.exists(check_path):
+    if not exists:
         result['missing'] = True
         return result
 
-    if not os.path.isdir(check_path):
+    if not is_dir:
         result['status'] = 'not_directory'
         result['message'] = "Path exists but is not a directory: {0}".format(
             check_path
@@ -167,37 +232,142 @@ def inspect_local_directory(path, check_writable=True):
     return result
 
 
-def check_local_directory(path, description, check_writable=True):
-    """Check if a local directory exists and is writable."""
-    info = inspect_local_directory(path, check_writable=check_writable)
-    if info['is_wildcard'] and description == "Source directory":
-        description = "Source directory (wildcard pattern)"
+def _stat_directory(check_path):
+    """Return ``(exists, is_dir)`` for a path from a single stat."""
+    # One stat answers both "exists" and "is a directory"; on NFS or autofs
+    # mounts every extra stat is another network round trip.
+    try:
+        path_stat = os.stat(check_path)
+    except (OSError, ValueError):
+        return False, False
+    return True, stat.S_ISDIR(path_stat.st_mode)
 
-    print_status(
-        "{0}".format(description),
-        "OK" if info['ok'] else "ERROR",
-        info['message'],
+
+def inspect_local_directory(path, check_writable=True):
+    """Return structured status for a local directory check."""
+    check_path, is_wildcard = _local_directory_target(path)
+    exists, is_dir = _stat_directory(check_path)
+    return _local_directory_status(
+        check_path, is_wildcard, exists, is_dir, check_writable
     )
-    return info['ok']
+
+
+def inspect_local_directories(paths, check_writable=True, workers=1):
+    """Return ``inspect_local_directory`` results for several paths, in order.
+
+    Each path costs one stat, plus an access check when ``check_writable``.
+    With ``workers`` above one these run on a thread pool so their latency
+    overlaps on network filesystems.
+    """
+    targets = [_local_directory_target(path) for path in paths]
+
+    def inspect_target(target):
+        check_path, is_wildcard = target
+        exists, is_dir = _stat_directory(check_path)
+        return _local_directory_status(
+            check_path, is_wildcard, exists, is_dir, check_writable
+        )
+
+    workers = min(workers, len(targets))
+    if workers <= 1:
+        return [inspect_target(target) for target in targets]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(inspect_target, targets))
+
+
+def check_local_directories(paths, description, check_writable=True):
+    """Check several local directories, printing one status line each."""
+    results = []
+    for info in inspect_local_directories(paths, check_writable=check_writable):
+        label = description
+        if info['is_wildcard'] and description == "Source directory":
+            label = "Source directory (wildcard pattern)"
+        print_status(
+            "{0}".format(label),
+            "OK" if info['ok'] else "ERROR",
+            info['message'],
+        )
+        results.append(info['ok'])
+    return results
+
+
+def check_local_directory(path, description, check_writable=True):
+    """Check if a local directory exists and is writable."""
+    return check_local_directories([path], description, check_writable)[0]
 
 
 def parse_remote_destination(destination):
     """Parse a transfer endpoint into remote target components."""
     value = str(destination).strip() if destination is not None else ''
-    if ':' not in value:
-        return None, None, value
+    return _parse_remote_endpoint(value)
 
-    remote, path = value.split(':', 1)
-    if not remote or not path or '/' in remote:
-        return None, None, value
 
-    if '@' in remote:
-        user, host = remote.split('@', 1)
-        if user and host:
-            return user, host, path
+@functools.lru_cache(maxsize=1024)
+def _parse_remote_endpoint(value):
+    # Readiness checks parse the same few endpoints for every transfer row.
+    remote, separator, path = value.partition(':')
+    if not separator or not remote or not path or '/' in remote:
         return None, None, value
 
-    return None, remote, path
+    # The cache is keyed by the whole endpoint, so different paths on one
+    # host would otherwise each hold their own copy of the host name.
+    user, at_sign, host = remote.partition('@')
+    if not at_sign:
+        return None, sys.intern(remote), path
+    if user and host:
+        return sys.intern(user), sys.intern(host), path
+    return None, None, value
+
+
+@functools.lru_cache(maxsize=64)
+def is_local_host(host):
+    """Return True when host resolves to an address of this machine."""
+    host = str(host).strip().lower()
+    if host in LOOPBACK_HOSTS:
+        return True
+    try:
+        address = socket.gethostbyname(host)
+        local_addresses = socket.gethostbyname_ex(socket.gethostname())[2]
+    except OSError:
+        return False
+    return address.startswith('127.') or address in local_addresses
+
+
+def is_local_endpoint(user, host, port=None, path=None):
+    """Return True when an ssh endpoint can be checked on the local filesystem.
+
+    Only absolute paths for the current login user on the default ssh port
+    qualify; ssh resolves relative paths against the login home, and another
+    user or port may map to a different account or a forwarded host. The
+    effective user, hostname and port come from ``ssh -G`` so ssh config
+    entries for the host are honoured.
+    """
+    if path is not None and not os.path.isabs(path):
+        return False
+    if port not in (None, '22'):
+        return False
+    current_user = os.environ.get('USER', os.environ.get('USERNAME', ''))
+    if user and user != current_user:
+        return False
+    if not is_local_host(host):
+        return False
+    return _is_local_ssh_account(user, host, port, current_user)
+
+
+@functools.lru_cache(maxsize=64)
+def _is_local_ssh_account(user, host, port, current_user):
+    # Every transfer row asks again for the same few endpoints.
+    settings = ssh_effective_settings(user, host, port)
+    if settings is None:
+        return False
+    for proxy_option in ('proxyjump', 'proxycommand'):
+        if settings.get(proxy_option, 'none').lower() != 'none':
+            return False
+    if settings.get('user') != current_user:
+        return False
+    if settings.get('port', '22') != '22':
+        return False
+    return is_local_host(settings.get('hostname') or host)
 
 
 def build_ssh_target(user, host):
@@ -207,115 +377,290 @@ def build_ssh_target(user, host):
     return host
 
 
+def ssh_base_command(port=None, control_path=None):
+    """Return the non-interactive ssh argv prefix used by readiness probes."""
+    cmd = ['ssh', '-o', 'BatchMode=yes', '-o', 'ConnectTimeout=10']
+    if port:
+        cmd.extend(['-p', str(port)])
+    if control_path:
+        cmd.extend(['-o', 'ControlPath={0}'.format(control_path)])
+    return cmd
+
+
+@contextmanager
+def ssh_multiplex(user, host, port=None):
+    """Hold one authenticated ssh master connection open for a block of checks.
+
+    Yields the ControlPath socket to pass to ``check_ssh_connection`` and
+    ``inspect_remote_directory``, or None when the master could not be
+    started; the probes then fall back to their own connections and report
+    the failure themselves. The master is closed with ``ssh -O exit``.
+    """
+    socket_dir = tempfile.mkdtemp(prefix='lz-ssh-')
+    control_path = os.path.join(socket_dir, 'cm')
+    target = build_ssh_target(user, host)
+    master_cmd = ssh_base_command(port, control_path) + [
+        '-o', 'ControlMaster=yes',
+        '-o', 'ControlPersist=60',
+        '-N', '-f', target,
+    ]
+    started = False
+    try:
+        try:
+            # -f backgrounds the master after authentication; it must not
+            # inherit captured pipes or the call would block until it exits.
+            started = subprocess.run(
+                master_cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=COMMAND_TIMEOUT_SECONDS,
+            ).returncode == 0
+        except (OSError, subprocess.TimeoutExpired):
+            started = False
+        yield control_path if started else None
+    finally:
+        if started:
+            try:
+                run_command(
+                    ssh_base_command(port, control_path) + ['-O', 'exit', target]
+                )
+            except OSError:
+                pass
+        shutil.rmtree(socket_dir, ignore_errors=True)
+
+
+def remote_directory_script(normalized_path, check_writable=True):
+    """Return the remote sh snippet that reports a DIR_* status token."""
+    return (
+        'target_path={0}; '
+        'if [ ! -e "$target_path" ]; then '
+        'echo "DIR_MISSING"; '
+        'elif [ ! -d "$target_path" ]; then '
+        'echo "DIR_NOT_DIRECTORY"; '
+        'elif [ "{1}" = "1" ] && [ ! -w "$target_path" ]; then '
+        'echo "DIR_NOT_WRITABLE"; '
+        'else '
+        'echo "DIR_OK"; '
+        'fi'
+    ).format(
+        shell_path(normalized_path),
+        '1' if check_writable else '0',
+    )
+
+
+def remote_directory_result(
+    returncode,
+    result_stdout,
+    result_stderr,
+    normalized_path,
+    check_writable=True,
+):
+    """Translate remote probe output into a structured directory status."""
+    result = {
+        'ok': False,
+        'status': 'remote_error',
+        'path': normalized_path,
+        'message': "Remote check failed: {0}".format(result_stderr),
+        'missing': False,
+    }
+
+    if returncode != 0:
+        return result
+
+    if 'DIR_OK' in result_stdout:
+        result['ok'] = True
+        result['status'] = 'ok'
+        result['message'] = (
+            "Directory exists and is writable"
+            if check_writable else
+            "Directory exists"
+        )
+        return result
+
+    if 'DIR_MISSING' in result_stdout:
+        result['status'] = 'missing'
+        result['missing'] = True
+        result['message'] = "Directory does not exist: {0}".format(
+            normalized_path
+        )
+        return result
+
+    if 'DIR_NOT_DIRECTORY' in result_stdout:
+        result['status'] = 'not_directory'
+        result['message'] = "Path exists but is not a directory: {0}".format(
+            normalized_path
+        )
+        return result
+
+    if 'DIR_NOT_WRITABLE' in result_stdout:
+        result['status'] = 'not_writable'
+        result['message'] = "Directory is not writable: {0}".format(
+            normalized_path
+        )
+        return result
+
+    result['message'] = "Remote check returned unexpected output: {0}".format(
+        result_stdout or '(empty)'
+    )
+    return result
+
+
 def inspect_remote_directory(
     user,
     host,
     path,
     port=None,
     check_writable=True,
+    control_path=None,
 ):
     """Return structured status for a remote directory check."""
     normalized_path = normalize_directory_path(path).rstrip('/') or '/'
     try:
-        cmd = ['ssh', '-o', 'BatchMode=yes', '-o', 'ConnectTimeout=10']
-        if port:
-            cmd.extend(['-p', str(port)])
-        remote_path_expr = shell_path(normalized_path)
-        writable_flag = '1' if check_writable else '0'
-        remote_script = (
-            'target_path={0}; '
-            'if [ ! -e "$target_path" ]; then '
-            'echo "DIR_MISSING"; '
-            'elif [ ! -d "$target_path" ]; then '
-            'echo "DIR_NOT_DIRECTORY"; '
-            'elif [ "{1}" = "1" ] && [ ! -w "$target_path" ]; then '
-            'echo "DIR_NOT_WRITABLE"; '
-            'else '
-            'echo "DIR_OK"; '
-            'fi'
-        ).format(
-            remote_path_expr,
-            writable_flag,
-        )
+        cmd = ssh_base_command(port, control_path)
+        remote_script = remote_directory_script(normalized_path, check_writable)
         remote_command = "sh -c {0}".format(shlex.quote(remote_script))
         cmd.extend([build_ssh_target(user, host), remote_command])
 
-        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        stdout, stderr = proc.communicate()
-        result_stdout = stdout.decode('utf-8').strip()
-        result_stderr = stderr.decode('utf-8').strip()
-
-        result = {
+        returncode, stdout, stderr = run_command(cmd)
+        return remote_directory_result(
+            returncode,
+            stdout.strip(),
+            stderr.strip(),
+            normalized_path,
+            check_writable,
+        )
+    except Exception as exc:
+        return {
             'ok': False,
             'status': 'remote_error',
             'path': normalized_path,
-            'message': "Remote check failed: {0}".format(result_stderr),
+            'message': "Remote directory check error: {0}".format(str(exc)),
             'missing': False,
         }
 
-        if proc.returncode != 0:
-            return result
 
-        if 'DIR_OK' in result_stdout:
-            result['ok'] = True
-            result['status'] = 'ok'
-            result['message'] = (
-                "Directory exists and is writable"
-                if check_writable else
-                "Directory exists"
-            )
-            return result
+def check_remote_host_all(
+    user,
+    host,
+    path,
+    port=None,
+    check_writable=True,
+    control_path=None,
+):
+    """Check SSH access and a remote directory in a single ssh invocation.
 
-        if 'DIR_MISSING' in result_stdout:
-            result['status'] = 'missing'
-            result['missing'] = True
-            result['message'] = "Directory does not exist: {0}".format(
-                normalized_path
-            )
-            return result
+    Returns ``(ssh_ok, ssh_message, directory_info)``; ``directory_info`` is
+    the ``inspect_remote_directory`` dict, or None when ssh itself failed.
+    """
+    normalized_path = normalize_directory_path(path).rstrip('/') or '/'
+    if not control_path:
+        preflight_error = ssh_preflight_error(user, host, port)
+        if preflight_error:
+            return False, preflight_error, None
+    try:
+        cmd = ssh_base_command(port, control_path)
+        remote_script = 'echo SSH_TEST_OK; {0}'.format(
+            remote_directory_script(normalized_path, check_writable)
+        )
+        remote_command = "sh -c {0}".format(shlex.quote(remote_script))
+        cmd.extend([build_ssh_target(user, host), remote_command])
 
-        if 'DIR_NOT_DIRECTORY' in result_stdout:
-            result['status'] = 'not_directory'
-            result['message'] = "Path exists but is not a directory: {0}".format(
-                normalized_path
-            )
-            return result
+        returncode, result_stdout, result_stderr = run_command(cmd)
+        result_stdout = result_stdout.strip()
+        result_stderr = result_stderr.strip()
+    except Exception as exc:
+        return False, "SSH test error: {0}".format(str(exc)), None
+
+    if returncode != 0 or 'SSH_TEST_OK' not in result_stdout:
+        return (
+            False,
+            "SSH failed: {0}".format(result_stderr or 'Unknown error'),
+            None,
+        )
+    directory_stdout = result_stdout.replace('SSH_TEST_OK', '', 1).strip()
+    return True, "Connection successful", remote_directory_result(
+        returncode,
+        directory_stdout,
+        result_stderr,
+        normalized_path,
+        check_writable,
+    )
+
+
+def ssh_effective_settings(user, host, port=None):
+    """Return the lower-cased ``ssh -G`` settings for an endpoint.
+
+    Returns None when ssh config cannot be read.
+    """
+    cmd = ['ssh', '-G']
+    if port:
+        cmd.extend(['-p', str(port)])
+    cmd.append(build_ssh_target(user, host))
+    try:
+        returncode, stdout, _ = run_command(cmd, timeout=SSH_PREFLIGHT_TIMEOUT_SECONDS)
+    except OSError:
+        return None
+    if returncode != 0:
+        return None
+
+    settings = {}
+    for line in stdout.splitlines():
+        key, _, value = line.partition(' ')
+        settings.setdefault(key.lower(), value.strip())
+    return settings
 
-        if 'DIR_NOT_WRITABLE' in result_stdout:
-            result['status'] = 'not_writable'
-            result['message'] = "Directory is not writable: {0}".format(
-                normalized_path
-            )
-            return result
 
-        result['message'] = "Remote check returned unexpected output: {0}".format(
-            result_stdout or '(empty)'
+def ssh_preflight_error(user, host, port=None):
+    """Return an error message when the ssh endpoint refuses TCP, else None.
+
+    The effective hostname and port come from ``ssh -G`` so ssh config
+    aliases are honoured. The probe is skipped (None) when it would be
+    inconclusive: ssh config cannot be read, the host is reached through a
+    ProxyJump/ProxyCommand, or the name only resolves inside ssh.
+    """
+    settings = ssh_effective_settings(user, host, port)
+    if settings is None:
+        return None
+    for proxy_option in ('proxyjump', 'proxycommand'):
+        if settings.get(proxy_option, 'none').lower() != 'none':
+            return None
+    hostname = settings.get('hostname') or host
+    try:
+        ssh_port = int(settings.get('port') or port or 22)
+    except ValueError:
+        return None
+
+    try:
+        with socket.create_connection(
+            (hostname, ssh_port),
+            timeout=SSH_PREFLIGHT_TIMEOUT_SECONDS,
+        ):
+            pass
+    except socket.gaierror:
+        return None
+    except OSError as exc:
+        return "TCP preflight to {0}:{1} failed: {2}".format(
+            hostname,
+            ssh_port,
+            exc,
         )
-        return result
-    except Exception as exc:
-        return {
-            'ok': False,
-            'status': 'remote_error',
-            'path': normalized_path,
-            'message': "Remote directory check error: {0}".format(str(exc)),
-            'missing': False,
-        }
+    return None
 
 
-def check_ssh_connection(user, host, port=None):
+def check_ssh_connection(user, host, port=None, control_path=None):
     """Check SSH connection to remote host."""
+    if not control_path:
+        preflight_error = ssh_preflight_error(user, host, port)
+        if preflight_error:
+            return False, preflight_error
     try:
-        cmd = ['ssh', '-o', 'BatchMode=yes', '-o', 'ConnectTimeout=10']
-        if port:
-            cmd.extend(['-p', str(port)])
+        cmd = ssh_base_command(port, control_path)
         cmd.extend([build_ssh_target(user, host), 'echo', 'SSH_TEST_OK'])
 
-        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        stdout, stderr = proc.communicate()
-        result_stdout = stdout.decode('utf-8')
-        result_stderr = stderr.decode('utf-8')
+        returncode, result_stdout, result_stderr = run_command(cmd)
 
-        if proc.returncode == 0 and 'SSH_TEST_OK' in result_stdout:
+        if returncode == 0 and 'SSH_TEST_OK' in result_stdout:
             return True, "Connection successful"
         return False, "SSH failed: {0}".format(result_stderr.strip() if result_stderr else 'Unknown error')
     except Exception as exc:
@@ -334,24 +679,48 @@ def check_remote_directory(user, host, path, port=None, description="Remote dire
     return info['ok'], info['message']
 
 
+def ensure_directory(path):
+    """Create ``path`` if it is missing; return True when it was created.
+
+    A plain mkdir is tried first: it succeeds outright when the parent
+    exists and fails with EEXIST when the directory is already there, so
+    neither case needs the parent probes ``os.makedirs`` does up front.
+    Raises OSError when the path cannot be created or is not a directory.
+    """
+    try:
+        os.mkdir(path)
+        return True
+    except FileExistsError:
+        if os.path.isdir(path):
+            return False
+        raise
+    except FileNotFoundError:
+        os.makedirs(path, exist_ok=True)
+        return True
+
+
 def check_log_directory(log_file_path):
     """Check if log directory exists and create if necessary."""
-    if not log_file_path or log_file_path == 'nan':
+    if log_file_path in NO_LOG_FILE_VALUES:
         return True, "No log file specified"
 
-    expanded_path = os.path.expandvars(os.path.expanduser(log_file_path))
+    expanded_path = expand_path(log_file_path)
     log_dir = normalize_directory_path(os.path.dirname(expanded_path))
 
     if not log_dir:
         return True, "Log file in current directory"
 
-    if not os.path.exists(log_dir):
+    try:
+        log_dir_stat = os.stat(log_dir)
+    except (OSError, ValueError):
         try:
-            os.makedirs(log_dir)
-            return True, "Created log directory: {0}".format(log_dir)
+            ensure_directory(log_dir)
         except OSError as exc:
-            if exc.errno != errno.EEXIST or not os.path.isdir(log_dir):
-                return False, "Cannot create log directory {0}: {1}".format(log_dir, str(exc))
+            return False, "Cannot create log directory {0}: {1}".format(log_dir, str(exc))
+        return True, "Created log directory: {0}".format(log_dir)
+
+    if not stat.S_ISDIR(log_dir_stat.st_mode):
+        return False, "Log path is not a directory: {0}".format(log_dir)
 
     if not os.access(log_dir, os.W_OK):
         return False, "Log directory not writable: {0}".format(log_dir)
@@ -365,9 +734,14 @@ def check_lock_file_directory(lock_file=None):
         lock_file = config.default_lock_file
 
     lock_dir = os.path.dirname(lock_file) or '.'
-    if not os.path.exists(lock_dir):
+    try:
+        lock_dir_stat = os.stat(lock_dir)
+    except (OSError, ValueError):
         print_status("Lock file directory", "ERROR", "Directory does not exist: {0}".format(lock_dir))
         return False
+    if not stat.S_ISDIR(lock_dir_stat.st_mode):
+        print_status("Lock file directory", "ERROR", "Path is not a directory: {0}".format(lock_dir))
+        return False
     if not os.access(lock_dir, os.W_OK):
         print_status("Lock file directory", "ERROR", "Directory not writable: {0}".format(lock_dir))
         return False
@@ -418,15 +792,6 @@ def get_current_user(transfers_df=None, runtime_ids=None):
             return current_user
         if len(users) == 1:
             return users[0]
-    except Exception:
-        pass
-
-    try:
-        df = (
-            transfers_df if transfers_df is not None
-            else _load_identity_transfers(transfers_file, runtime_ids)
-        )
-        users = df['users'].unique()
         return _select_from_transfer_values("Current user", users, current_user)
     except Exception as exc:
         print("Could not read {0}: {1}".format(transfers_file, exc))
@@ -449,21 +814,25 @@ def get_current_system(transfers_df=None, runtime_ids=None):
                 return system
         if len(systems) == 1:
             return systems[0]
-    except Exception:
-        pass
-
-    try:
-        df = (
-            transfers_df if transfers_df is not None
-            else _load_identity_transfers(transfers_file, runtime_ids)
-        )
-        systems = df['system'].unique()
         return _select_from_transfer_values("Current hostname", systems, hostname)
     except Exception as exc:
         print("Could not read {0}: {1}".format(transfers_file, exc))
         return input("Please enter your system name: ").strip()
 
 
+def load_identity_transfers(runtime_ids=None):
+    """Load transfers once for system/user detection, or None if unreadable.
+
+    Callers pass the result to both ``get_current_system`` and
+    ``get_current_user`` so the transfer catalog is parsed a single time.
+    On failure they receive None and report the read error themselves.
+    """
+    try:
+        return _load_identity_transfers(config.transfers_file, runtime_ids)
+    except Exception:
+        return None
+
+
 def generate_cron_files(runtime_ids=None):
     """Generate cron files using the installed module."""
     if runtime_ids is None:
@@ -473,30 +842,16 @@ def generate_cron_files(runtime_ids=None):
         argv.extend(['--runtime-id', runtime_id])
     try:
         from landingzones import generate_cron_files as gcf
-        output_capture = None
-        old_stdout = None
-        if StringIO is not None:
-            output_capture = StringIO()
-            old_stdout = sys.stdout
-            sys.stdout = output_capture
-        try:
-            gcf.main(argv)
-        finally:
-            if old_stdout is not None:
-                sys.stdout = old_stdout
-        details = output_capture.getvalue() if output_capture is not None else "Generated cron files"
-        return True, details
+        output_capture = StringIO()
+        gcf.main(argv, out=output_capture)
+        return True, output_capture.getvalue() or "Generated cron files"
     except Exception:
         try:
-            proc = subprocess.Popen(
+            returncode, out, err = run_command(
                 [sys.executable, '-m', 'landingzones.generate_cron_files'] + argv,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                timeout=None,
             )
-            stdout, stderr = proc.communicate()
-            out = stdout.decode('utf-8') if stdout else ''
-            err = stderr.decode('utf-8') if stderr else ''
-            if proc.returncode == 0:
+            if returncode == 0:
                 return True, out or 'Generated cron files'
             return False, "Generation failed: {0}".format(err or out)
         except Exception as exc:
@@ -505,19 +860,17 @@ def generate_cron_files(runtime_ids=None):
 
 def setup_crontab_directory():
     """Ensure ~/crontab.d directory exists."""
-    crontab_dir = os.path.expandvars(os.path.expanduser("~/crontab.d"))
+    crontab_dir = staged_crontab_directory()
     try:
-        os.makedirs(crontab_dir)
-        return True, "Directory ready: {0}".format(crontab_dir)
+        ensure_directory(crontab_dir)
     except OSError as exc:
-        if exc.errno == errno.EEXIST and os.path.isdir(crontab_dir):
-            return True, "Directory ready: {0}".format(crontab_dir)
         return False, "Cannot create directory {0}: {1}".format(crontab_dir, str(exc))
+    return True, "Directory ready: {0}".format(crontab_dir)
 
 
 def staged_crontab_directory():
     """Return the operator's staged cron fragment directory."""
-    return os.path.expandvars(os.path.expanduser("~/crontab.d"))
+    return expand_path("~/crontab.d")
 
 
 def cron_runtime_id_from_filename(filename):
@@ -539,11 +892,15 @@ def staged_cron_fragments(crontab_dir):
     """Return sorted staged .cron fragment paths."""
     if not os.path.isdir(crontab_dir):
         return []
-    return [
-        os.path.join(crontab_dir, entry)
-        for entry in sorted(os.listdir(crontab_dir))
-        if entry.endswith('.cron') and os.path.isfile(os.path.join(crontab_dir, entry))
-    ]
+    # scandir reports the file type from the directory listing itself, so
+    # filtering needs no extra stat() per entry.
+    with os.scandir(crontab_dir) as entries:
+        names = [
+            entry.name
+            for entry in entries
+            if entry.name.endswith('.cron') and entry.is_file()
+        ]
+    return [os.path.join(crontab_dir, name) for name in sorted(names)]
 
 
 def classify_cron_fragments(cron_files):
@@ -854,6 +1211,15 @@ def cron_activation_confirmed(
 
 def activate_cron_fragments(cron_files):
     """Replace the active crontab with the provided cron fragment contents."""
+    if not cron_files:
+        # Piping nothing into `crontab -` would silently clear every job.
+        print_status(
+            "Crontab activation",
+            "ERROR",
+            "No cron fragments to activate; leaving the active crontab unchanged.",
+        )
+        return False
+
     content_parts = []
     for cron_file in cron_files:
         with open(cron_file, 'r') as handle:
@@ -861,18 +1227,11 @@ def activate_cron_fragments(cron_files):
         content_parts.append(content)
         if content and not content.endswith('\n'):
             content_parts.append('\n')
-    active_content = ''.join(content_parts).encode('utf-8')
+    active_content = ''.join(content_parts)
 
-    proc = subprocess.Popen(
-        ['crontab', '-'],
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-    )
-    _, stderr = proc.communicate(input=active_content)
-    result_stderr = stderr.decode('utf-8')
+    returncode, _, result_stderr = run_command(['crontab', '-'], input=active_content)
 
-    if proc.returncode != 0:
+    if returncode != 0:
         print_status(
             "Crontab activation",
             "ERROR",
@@ -885,14 +1244,9 @@ def activate_cron_fragments(cron_files):
         "OK",
         "Activated {0} cron files".format(len(cron_files)),
     )
-    verify_proc = subprocess.Popen(
-        ['crontab', '-l'],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-    )
-    verify_stdout, _ = verify_proc.communicate()
-    if verify_proc.returncode == 0:
-        lines = verify_stdout.decode('utf-8').split('\n')
+    verify_returncode, verify_stdout, _ = run_command(['crontab', '-l'])
+    if verify_returncode == 0:
+        lines = verify_stdout.split('\n')
         active_jobs = len([
             line for line in lines
             if line.strip() and not line.startswith('#')
@@ -130,6 +130,7 @@ class _Loc:
 
     def __setitem__(self, key, value):
         row_key, column = key
+        self._table._own_rows()
         self._table._rows[row_key][column] = value
         if column not in self._table.columns:
             self._table.columns.append(column)
@@ -138,18 +139,30 @@ class _Loc:
 class _GroupBy:
     def __init__(self, table, by):
         self._groups = OrderedDict()
-        self.groups = OrderedDict()
-        keys = [by] if isinstance(by, str) else list(by)
-        for index, row in enumerate(table._rows):
-            key_values = tuple(row.get(key, "") for key in keys)
-            group_key = key_values[0] if len(key_values) == 1 else key_values
-            self._groups.setdefault(group_key, []).append(row)
-            self.groups.setdefault(group_key, []).append(index)
+        self._keys = [by] if isinstance(by, str) else list(by)
+        self._rows = table._rows
+        for row in self._rows:
+            self._groups.setdefault(self._group_key(row), []).append(row)
         self._columns = list(table.columns)
 
+    def _group_key(self, row):
+        key_values = tuple(row.get(key, "") for key in self._keys)
+        return key_values[0] if len(key_values) == 1 else key_values
+
+    @property
+    def groups(self):
+        # Row positions per key; callers iterate groups far more often than
+        # they ask for positions, so these are only built on request.
+        groups = OrderedDict()
+        for index, row in enumerate(self._rows):
+            groups.setdefault(self._group_key(row), []).append(index)
+        return groups
+
     def __iter__(self):
+        # Group frames share the parent's row dicts instead of copying every
+        # column of each row; they copy them on their first assignment.
         for key, rows in self._groups.items():
-            yield key, TransferTable(rows, columns=self._columns)
+            yield key, TransferTable._shared_view(rows, self._columns)
 
     def __len__(self):
         return len(self._groups)
@@ -162,6 +175,35 @@ class TransferTable:
         self._rows = [dict(row) for row in (rows or [])]
         self.columns = list(columns or self._infer_columns(self._rows))
         self.attrs = dict(attrs or {})
+        self._rows_shared = False
+
+    @classmethod
+    def from_records(cls, rows, columns=None, attrs=None):
+        """Build a table that adopts ``rows`` instead of copying each dict.
+
+        Only for freshly built rows the caller no longer uses elsewhere.
+        """
+        table = cls(columns=columns or cls._infer_columns(rows), attrs=attrs)
+        table._rows = rows
+        return table
+
+    @classmethod
+    def _shared_view(cls, rows, columns):
+        """Build a table over another table's row dicts, copied on write.
+
+        Reads see the shared dicts. Column assignment through ``[]`` or
+        ``loc`` first gives the view its own row copies, so the source table
+        is never changed through it.
+        """
+        table = cls(columns=columns)
+        table._rows = list(rows)
+        table._rows_shared = True
+        return table
+
+    def _own_rows(self):
+        if self._rows_shared:
+            self._rows = [dict(row) for row in self._rows]
+            self._rows_shared = False
 
     @staticmethod
     def _infer_columns(rows):
@@ -191,6 +233,7 @@ class TransferTable:
         raise TypeError("Unsupported table key: {0!r}".format(key))
 
     def __setitem__(self, key, values):
+        self._own_rows()
         if key not in self.columns:
             self.columns.append(key)
         if isinstance(values, Series):
@@ -224,6 +267,11 @@ class TransferTable:
             yield index, row
 
     def groupby(self, by, dropna=True):
+        """Group rows by one or more columns.
+
+        Group frames share this table's row dicts until they are assigned
+        to; rows yielded by their ``iterrows`` are those shared dicts.
+        """
         return _GroupBy(self, by)
 
     def to_rows(self):
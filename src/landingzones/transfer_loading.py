@@ -7,6 +7,7 @@ import os
 from landingzones.config import config
 from landingzones import generate_cron_files as gcf
 from landingzones import transfer_catalog
+from landingzones.table import TransferTable
 from landingzones.transfer_definitions import (
     definitions_from_dataframe,
     tags_match_any,
@@ -167,6 +168,18 @@ def load_reporting_transfer_definitions(
 
 def filter_transfers_by_system_user(transfers_df, system, user):
     """Return only transfers matching a system/user pair."""
+    if isinstance(transfers_df, TransferTable):
+        # Filter the records directly; building two column Series and a mask
+        # is wasted work for the small tables the CLI handles.
+        return TransferTable(
+            [
+                row
+                for _, row in transfers_df.iterrows()
+                if row.get('system', '') == system and row.get('users', '') == user
+            ],
+            columns=transfers_df.columns,
+            attrs=dict(transfers_df.attrs),
+        )
     return transfers_df[
         (transfers_df['system'] == system) &
         (transfers_df['users'] == user)
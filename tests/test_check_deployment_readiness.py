@@ -2,10 +2,14 @@
 # -*- coding: utf-8 -*-
 """Test suite for check_deployment_readiness.py"""
 
+from contextlib import ExitStack, contextmanager
 import os
 import shutil
 import stat
+import subprocess
 import tempfile
+import threading
+import time
 from pathlib import Path
 import pytest
 import pandas as pd
@@ -16,6 +20,23 @@ from landingzones import transfer_catalog
 from landingzones.table import TransferTable
 
 
+def run_with_process(process_class):
+    """Adapt a Popen-style test double to the subprocess.run interface."""
+    def fake_run(args, input=None, capture_output=False, text=False, timeout=None, **kwargs):
+        proc = process_class(args)
+        if input is not None:
+            stdout, stderr = proc.communicate(
+                input=input.encode('utf-8') if text else input
+            )
+        else:
+            stdout, stderr = proc.communicate()
+        if text:
+            stdout, stderr = stdout.decode('utf-8'), stderr.decode('utf-8')
+        return subprocess.CompletedProcess(args, proc.returncode, stdout, stderr)
+
+    return fake_run
+
+
 class TestParseRemoteDestination:
     """Test the parse_remote_destination function"""
     
@@ -59,6 +80,27 @@ class TestParseRemoteDestination:
         assert host == 'remotealias'
         assert path == '$HOME/Landing_Zone/'
 
+    def test_repeated_endpoint_is_parsed_once(self):
+        """Endpoints repeated across transfer rows should hit the parse cache."""
+        cdr.parse_remote_destination('cacheuser@cachehost:/repeat/')
+        before = ro._parse_remote_endpoint.cache_info().hits
+
+        result = cdr.parse_remote_destination('  cacheuser@cachehost:/repeat/ ')
+
+        assert result == ('cacheuser', 'cachehost', '/repeat/')
+        assert ro._parse_remote_endpoint.cache_info().hits == before + 1
+
+    def test_endpoints_on_one_host_share_host_string(self):
+        """Different paths on the same host should reuse one host string."""
+        value_one = ''.join(['shareuser@', 'sharehost', ':/one/'])
+        value_two = ''.join(['shareuser@', 'sharehost', ':/two/'])
+
+        user_one, host_one, _ = cdr.parse_remote_destination(value_one)
+        user_two, host_two, _ = cdr.parse_remote_destination(value_two)
+
+        assert host_one is host_two
+        assert user_one is user_two
+
 
 class TestRunRemoteShell:
     """Test remote shell invocation details."""
@@ -110,6 +152,15 @@ class TestCronDeploymentPrompt:
 
         assert result is True
 
+    def test_activate_cron_fragments_refuses_empty_selection(self, monkeypatch):
+        """An empty fragment list must not replace the crontab with nothing."""
+        def fail_run(*args, **kwargs):
+            raise AssertionError("crontab should not be invoked")
+
+        monkeypatch.setattr(ro.subprocess, 'run', fail_run)
+
+        assert ro.activate_cron_fragments([]) is False
+
     def test_build_cron_activation_plan_classifies_execution_context_fragments(
         self, tmp_path
     ):
@@ -238,7 +289,7 @@ class TestCronDeploymentPrompt:
                 },
             ]),
         )
-        monkeypatch.setattr(ro.subprocess, 'Popen', DummyProcess)
+        monkeypatch.setattr(ro.subprocess, 'run', run_with_process(DummyProcess))
         monkeypatch.setattr(ro, 'is_interactive_terminal', lambda: True, raising=False)
         monkeypatch.setattr(
             cdr,
@@ -338,7 +389,7 @@ class TestCronDeploymentPrompt:
                 },
             ]),
         )
-        monkeypatch.setattr(ro.subprocess, 'Popen', DummyProcess)
+        monkeypatch.setattr(ro.subprocess, 'run', run_with_process(DummyProcess))
         monkeypatch.setattr(ro, 'is_interactive_terminal', lambda: False, raising=False)
         monkeypatch.setattr(
             cdr,
@@ -433,7 +484,7 @@ class TestCronDeploymentPrompt:
                 }
             ]),
         )
-        monkeypatch.setattr(ro.subprocess, 'Popen', DummyProcess)
+        monkeypatch.setattr(ro.subprocess, 'run', run_with_process(DummyProcess))
         monkeypatch.setattr(ro, 'is_interactive_terminal', lambda: False, raising=False)
         monkeypatch.setattr(
             cdr,
@@ -531,7 +582,7 @@ class TestCronDeploymentPrompt:
                 },
             ]),
         )
-        monkeypatch.setattr(ro.subprocess, 'Popen', DummyProcess)
+        monkeypatch.setattr(ro.subprocess, 'run', run_with_process(DummyProcess))
         monkeypatch.setattr(ro, 'is_interactive_terminal', lambda: False, raising=False)
         monkeypatch.setattr(
             cdr,
@@ -635,7 +686,7 @@ class TestCronDeploymentPrompt:
                 },
             ]),
         )
-        monkeypatch.setattr(ro.subprocess, 'Popen', DummyProcess)
+        monkeypatch.setattr(ro.subprocess, 'run', run_with_process(DummyProcess))
         monkeypatch.setattr(ro, 'is_interactive_terminal', lambda: False, raising=False)
         monkeypatch.setattr(
             cdr,
@@ -741,7 +792,7 @@ class TestCronDeploymentPrompt:
                 },
             ]),
         )
-        monkeypatch.setattr(ro.subprocess, 'Popen', DummyProcess)
+        monkeypatch.setattr(ro.subprocess, 'run', run_with_process(DummyProcess))
         monkeypatch.setattr(ro, 'is_interactive_terminal', lambda: True, raising=False)
         monkeypatch.setattr(cdr, 'ask_yes_no', confirm)
         monkeypatch.setattr(
@@ -833,7 +884,7 @@ class TestCronDeploymentPrompt:
                 },
             ]),
         )
-        monkeypatch.setattr(ro.subprocess, 'Popen', DummyProcess)
+        monkeypatch.setattr(ro.subprocess, 'run', run_with_process(DummyProcess))
         monkeypatch.setattr(ro, 'is_interactive_terminal', lambda: False, raising=False)
         monkeypatch.setattr(
             cdr,
@@ -893,7 +944,7 @@ class TestCronDeploymentPrompt:
         snapshot = cdr.config.snapshot_state()
         monkeypatch.setenv('HOME', str(home_dir))
         monkeypatch.setattr(ro, 'generate_cron_files', lambda runtime_ids=None: (True, "generated"))
-        monkeypatch.setattr(ro.subprocess, 'Popen', DummyProcess)
+        monkeypatch.setattr(ro.subprocess, 'run', run_with_process(DummyProcess))
         monkeypatch.setattr(ro, 'is_interactive_terminal', lambda: False, raising=False)
         monkeypatch.setattr(
             cdr,
@@ -973,7 +1024,7 @@ class TestCronDeploymentPrompt:
         snapshot = cdr.config.snapshot_state()
         monkeypatch.setenv('HOME', str(home_dir))
         monkeypatch.setattr(ro, 'generate_cron_files', lambda runtime_ids=None: (True, "generated"))
-        monkeypatch.setattr(ro.subprocess, 'Popen', DummyProcess)
+        monkeypatch.setattr(ro.subprocess, 'run', run_with_process(DummyProcess))
         monkeypatch.setattr(ro, 'is_interactive_terminal', lambda: False, raising=False)
         monkeypatch.setattr(
             cdr,
@@ -1031,7 +1082,7 @@ class TestCronDeploymentPrompt:
         snapshot = cdr.config.snapshot_state()
         monkeypatch.setenv('HOME', str(home_dir))
         monkeypatch.setattr(ro, 'generate_cron_files', lambda runtime_ids=None: (True, "generated"))
-        monkeypatch.setattr(ro.subprocess, 'Popen', DummyProcess)
+        monkeypatch.setattr(ro.subprocess, 'run', run_with_process(DummyProcess))
         monkeypatch.setattr(ro, 'is_interactive_terminal', lambda: False, raising=False)
         monkeypatch.setattr(
             cdr,
@@ -1097,6 +1148,34 @@ class TestRuntimeIdentityDetection:
         finally:
             ro.config.restore_state(config_snapshot)
 
+    def test_identity_prompt_reads_transfers_once(self, monkeypatch):
+        """Prompting for a system or user should not reload the transfers."""
+        df = pd.DataFrame([
+            {'system': 'server1', 'users': 'alice'},
+            {'system': 'server2', 'users': 'bob'},
+        ])
+        loads = []
+        config_snapshot = ro.config.snapshot_state()
+
+        def fake_load_runtime_transfers(transfers_file=None, runtime_ids=None):
+            loads.append(transfers_file)
+            return df
+
+        monkeypatch.setattr(ro.socket, 'gethostname', lambda: 'developer-mac.local')
+        monkeypatch.setenv('USER', 'nobody')
+        monkeypatch.setattr(ro, 'load_runtime_transfers', fake_load_runtime_transfers)
+        monkeypatch.setattr('builtins.input', lambda prompt='': '2')
+
+        try:
+            ro.config.load_config(transfers_file='input/transfers.tsv')
+            identity_df = ro.load_identity_transfers()
+            assert ro.get_current_system(transfers_df=identity_df) == 'server2'
+            assert ro.get_current_user(transfers_df=identity_df) == 'bob'
+        finally:
+            ro.config.restore_state(config_snapshot)
+
+        assert loads == ['input/transfers.tsv']
+
     def test_validate_deployment_uses_build_runtime_metadata(
         self, tmp_path, monkeypatch
     ):
@@ -1343,6 +1422,28 @@ class TestCheckLocalDirectory:
         
         assert result is True
     
+    def test_writable_check_asks_the_kernel_without_writing(self, tmp_path, monkeypatch):
+        """Writability should come from os.access, never a probe file."""
+        test_dir = tmp_path / "writable_dir"
+        test_dir.mkdir()
+        access_calls = []
+
+        def recording_access(path, mode):
+            access_calls.append((path, mode))
+            return False
+
+        def fail_mkstemp(*args, **kwargs):
+            raise AssertionError("writability should not be probed with a file")
+
+        monkeypatch.setattr(ro.os, 'access', recording_access)
+        monkeypatch.setattr(ro.tempfile, 'mkstemp', fail_mkstemp)
+
+        info = cdr.inspect_local_directory(str(test_dir), check_writable=True)
+
+        assert info['status'] == 'not_writable'
+        assert access_calls == [(str(test_dir), os.W_OK)]
+        assert list(test_dir.iterdir()) == []
+
     def test_home_expansion(self, tmp_path, monkeypatch):
         """Test that ~ is expanded to home directory"""
         # Set HOME to tmp_path for testing
@@ -1406,6 +1507,23 @@ class TestCheckLocalDirectory:
         
         assert result is True
 
+    def test_wildcard_parent_is_not_listed(self, tmp_path, monkeypatch):
+        """A wildcard source should be checked by stat alone, never by listing."""
+        test_dir = tmp_path / "wildcard_stat"
+        test_dir.mkdir()
+
+        def fail_listing(*args, **kwargs):
+            raise AssertionError("wildcard checks should not list the parent")
+
+        monkeypatch.setattr(ro.os, 'scandir', fail_listing)
+        monkeypatch.setattr(ro.os, 'listdir', fail_listing)
+
+        info = cdr.inspect_local_directory(str(test_dir) + "//*", check_writable=False)
+
+        assert info['ok'] is True
+        assert info['is_wildcard'] is True
+        assert info['path'] == str(test_dir)
+
     def test_inspect_local_directory_normalizes_redundant_slashes(self, tmp_path):
         """Repeated slashes should collapse to a single normalized path."""
         test_dir = tmp_path / "double" / "slashes"
@@ -1418,6 +1536,79 @@ class TestCheckLocalDirectory:
         assert info['path'] == str(test_dir)
         assert '//' not in info['path']
 
+    def test_batched_checks_match_single_path_checks(self, tmp_path, monkeypatch):
+        """Batched checks should agree with inspect_local_directory path by path."""
+        zone = tmp_path / "zone_a" / "Incoming"
+        zone.mkdir(parents=True)
+        (tmp_path / "zone_b").mkdir()
+        (tmp_path / "plain_file").write_text("")
+        (tmp_path / "link").symlink_to(tmp_path / "zone_b")
+        paths = [
+            str(zone / ".."),
+            str(zone / "."),
+            str(zone),
+            str(tmp_path / "zone_a" / "incoming"),
+            str(tmp_path / "zone_b") + "/*",
+            str(tmp_path / "plain_file"),
+            str(tmp_path / "missing"),
+            str(tmp_path / "link"),
+        ]
+        expected = [
+            cdr.inspect_local_directory(path, check_writable=False)
+            for path in paths
+        ]
+
+        def fail_listing(*args, **kwargs):
+            raise AssertionError("batched checks should stat, not list parents")
+
+        monkeypatch.setattr(ro.os, 'scandir', fail_listing)
+
+        results = cdr.inspect_local_directories(paths, check_writable=False)
+
+        assert results == expected
+        assert [info['status'] for info in results[:3]] == ['ok', 'ok', 'ok']
+
+    def test_prefetch_covers_local_endpoints_only(self, tmp_path, monkeypatch):
+        """The readiness prefetch should key local endpoints for _check_transfer."""
+        monkeypatch.setenv('USER', 'runner')
+        (tmp_path / "src").mkdir()
+        rows = [{
+            'source': 'runner@localhost:{0}'.format(tmp_path / "src"),
+            'source_port': '',
+            'destination': 'other@remote.example:/srv/in/',
+            'destination_port': '',
+        }, {
+            'source': str(tmp_path / "src"),
+            'source_port': '',
+            'destination': str(tmp_path / "dest"),
+            'destination_port': '',
+        }]
+
+        local_directories = cdr.prefetch_local_directories(rows)
+
+        assert sorted(local_directories) == [
+            (str(tmp_path / "dest"), True),
+            (str(tmp_path / "src"), False),
+        ]
+        assert local_directories[(str(tmp_path / "src"), False)]['ok'] is True
+        assert local_directories[(str(tmp_path / "dest"), True)]['missing'] is True
+
+    def test_parallel_inspection_keeps_input_order(self, tmp_path):
+        """Checks run on a thread pool should still line up with their paths."""
+        paths = []
+        for index in range(6):
+            zone = tmp_path / "parent_{0}".format(index) / "zone"
+            if index % 2 == 0:
+                zone.mkdir(parents=True)
+            paths.append(str(zone))
+
+        serial = cdr.inspect_local_directories(paths, check_writable=True)
+        parallel = cdr.inspect_local_directories(paths, check_writable=True, workers=4)
+
+        assert parallel == serial
+        assert [info['path'] for info in parallel] == paths
+        assert [info['status'] for info in parallel] == ['ok', 'missing'] * 3
+
 
 class TestCheckLogDirectory:
     """Test the check_log_directory function"""
@@ -1435,6 +1626,13 @@ class TestCheckLogDirectory:
         
         assert ok is True
         assert 'No log file specified' in msg
+
+    def test_missing_log_path(self):
+        """A missing log column value should count as no log file."""
+        ok, msg = cdr.check_log_directory(None)
+
+        assert ok is True
+        assert 'No log file specified' in msg
     
     def test_existing_log_directory(self, tmp_path):
         """Test with existing log directory"""
@@ -1458,6 +1656,16 @@ class TestCheckLogDirectory:
         assert log_dir.exists()
         assert 'Created' in msg
     
+    def test_log_path_parent_is_a_file(self, tmp_path):
+        """A regular file where the log directory should be is an error"""
+        blocker = tmp_path / "logs"
+        blocker.write_text("")
+
+        ok, msg = cdr.check_log_directory(str(blocker / "test.log"))
+
+        assert ok is False
+        assert 'not a directory' in msg
+
     def test_relative_path(self):
         """Test with relative path (log file in current directory)"""
         ok, msg = cdr.check_log_directory('test.log')
@@ -1465,6 +1673,16 @@ class TestCheckLogDirectory:
         assert ok is True
         assert 'current directory' in msg
 
+    def test_expanded_paths_follow_environment_changes(self, tmp_path, monkeypatch):
+        """Memoized path expansion should still see updated variables."""
+        monkeypatch.setenv('LZ_TEST_LOG_ROOT', str(tmp_path / 'first'))
+        assert ro.expand_path('$LZ_TEST_LOG_ROOT/app.log') == str(tmp_path / 'first' / 'app.log')
+
+        monkeypatch.setenv('LZ_TEST_LOG_ROOT', str(tmp_path / 'second'))
+        monkeypatch.setenv('HOME', str(tmp_path / 'home'))
+        assert ro.expand_path('$LZ_TEST_LOG_ROOT/app.log') == str(tmp_path / 'second' / 'app.log')
+        assert ro.expand_path('~/crontab.d') == str(tmp_path / 'home' / 'crontab.d')
+
 
 class TestCheckFlockCommand:
     """Test the check_flock_command function"""
@@ -1486,6 +1704,29 @@ class TestCheckFlockCommand:
         assert result is False
 
 
+class TestCheckRequiredTools:
+    """Test the check_required_tools function"""
+
+    def test_tools_resolved_in_process(self, monkeypatch, capsys):
+        """Tool lookup should use shutil.which rather than spawning `which`."""
+        def fail_popen(*args, **kwargs):
+            raise AssertionError("check_required_tools should not spawn processes")
+
+        monkeypatch.setattr(ro.subprocess, 'Popen', fail_popen)
+        monkeypatch.setattr(
+            ro.shutil,
+            'which',
+            lambda tool: None if tool == 'rsync' else '/usr/bin/{0}'.format(tool),
+        )
+
+        result = cdr.check_required_tools()
+        captured = capsys.readouterr()
+
+        assert result is False
+        assert "rsync missing" in captured.out
+        assert "Location: /usr/bin/ssh" in captured.out
+
+
 class TestCheckRemoteDirectory:
     """Test the remote directory inspection helper."""
 
@@ -1501,7 +1742,7 @@ class TestCheckRemoteDirectory:
             def communicate(self):
                 return b'DIR_OK\n', b''
 
-        monkeypatch.setattr(cdr.subprocess, 'Popen', DummyProcess)
+        monkeypatch.setattr(cdr.subprocess, 'run', run_with_process(DummyProcess))
 
         info = cdr.inspect_remote_directory(
             'user',
@@ -1523,6 +1764,255 @@ class TestCheckRemoteDirectory:
         assert '$1' not in remote_command
         assert 'syntax error near unexpected token' not in remote_command
 
+    def test_check_remote_host_all_uses_one_ssh_call(self, monkeypatch):
+        """Connection and directory status should come from a single probe."""
+        calls = []
+
+        class DummyProcess:
+            def __init__(self, args, stdout=None, stderr=None):
+                calls.append(args)
+                self.returncode = 0
+
+            def communicate(self):
+                return b'SSH_TEST_OK\nDIR_MISSING\n', b''
+
+        monkeypatch.setattr(ro.subprocess, 'run', run_with_process(DummyProcess))
+        monkeypatch.setattr(ro, 'ssh_preflight_error', lambda *args: None)
+
+        ssh_ok, ssh_msg, info = cdr.check_remote_host_all(
+            'user', 'host', '/srv/landing/', port='2222'
+        )
+
+        assert len(calls) == 1
+        assert "echo SSH_TEST_OK" in calls[0][-1]
+        assert ssh_ok is True
+        assert ssh_msg == "Connection successful"
+        assert info['missing'] is True
+        assert info['path'] == '/srv/landing'
+
+    def test_check_remote_host_all_reports_ssh_failure(self, monkeypatch):
+        """An ssh failure should not be reported as a directory result."""
+        class DummyProcess:
+            def __init__(self, args, stdout=None, stderr=None):
+                self.returncode = 255
+
+            def communicate(self):
+                return b'', b'Permission denied (publickey).\n'
+
+        monkeypatch.setattr(ro.subprocess, 'run', run_with_process(DummyProcess))
+        monkeypatch.setattr(ro, 'ssh_preflight_error', lambda *args: None)
+
+        ssh_ok, ssh_msg, info = cdr.check_remote_host_all('user', 'host', '/srv')
+
+        assert ssh_ok is False
+        assert ssh_msg == "SSH failed: Permission denied (publickey)."
+        assert info is None
+
+    def test_ssh_multiplex_starts_and_stops_master(self, monkeypatch):
+        """Checks inside ssh_multiplex should share one ControlPath master."""
+        calls = []
+
+        def fake_run(args, **kwargs):
+            calls.append(args)
+            return subprocess.CompletedProcess(args, 0, 'SSH_TEST_OK\n', '')
+
+        monkeypatch.setattr(ro.subprocess, 'run', fake_run)
+
+        with ro.ssh_multiplex('user', 'host', '2222') as control_path:
+            ok, _ = ro.check_ssh_connection(
+                'user', 'host', '2222', control_path=control_path
+            )
+
+        assert ok is True
+        assert control_path and not os.path.exists(os.path.dirname(control_path))
+        master, probe, close = calls
+        control_option = 'ControlPath={0}'.format(control_path)
+        assert 'ControlMaster=yes' in master
+        assert control_option in master
+        assert control_option in probe
+        assert 'ControlMaster=yes' not in probe
+        assert close[-3:] == ['-O', 'exit', 'user@host']
+
+    def test_ssh_multiplex_yields_none_when_master_fails(self, monkeypatch):
+        """A failed master should leave probes on their own connections."""
+        calls = []
+
+        def fake_run(args, **kwargs):
+            calls.append(args)
+            return subprocess.CompletedProcess(args, 255)
+
+        monkeypatch.setattr(ro.subprocess, 'run', fake_run)
+
+        with ro.ssh_multiplex('user', 'host') as control_path:
+            assert control_path is None
+
+        assert len(calls) == 1
+
+    def test_run_command_reports_timeouts(self, monkeypatch):
+        """A hung command should surface as exit status 124, not block."""
+        def fake_run(args, **kwargs):
+            raise subprocess.TimeoutExpired(args, kwargs['timeout'])
+
+        monkeypatch.setattr(ro.subprocess, 'run', fake_run)
+        monkeypatch.setattr(ro, 'ssh_preflight_error', lambda *args: None)
+
+        assert ro.run_command(['ssh', 'host', 'true']) == (124, '', 'timeout')
+        ok, message = ro.check_ssh_connection('user', 'host')
+        assert ok is False
+        assert message == "SSH failed: timeout"
+
+    def test_ssh_preflight_fails_fast_on_refused_port(self, monkeypatch):
+        """An unreachable ssh port should fail before spawning ssh."""
+        calls = []
+
+        def fake_run(args, **kwargs):
+            calls.append(args)
+            return subprocess.CompletedProcess(
+                args, 0, 'hostname 10.0.0.5\nport 2222\nproxyjump none\n', ''
+            )
+
+        def refuse(address, timeout=None):
+            raise ConnectionRefusedError(111, 'Connection refused')
+
+        monkeypatch.setattr(ro.subprocess, 'run', fake_run)
+        monkeypatch.setattr(ro.socket, 'create_connection', refuse)
+
+        ok, message = ro.check_ssh_connection('user', 'alias')
+
+        assert ok is False
+        assert message.startswith("TCP preflight to 10.0.0.5:2222 failed")
+        assert calls == [['ssh', '-G', 'user@alias']]
+
+    def test_localhost_endpoint_is_checked_without_ssh(self, tmp_path, monkeypatch):
+        """user@localhost endpoints should use the local directory checks."""
+        source = tmp_path / 'source'
+        source.mkdir()
+        monkeypatch.setenv('USER', 'runner')
+        self._fake_ssh_config(monkeypatch, 'user runner\nhostname localhost\nport 22\n')
+
+        result = cdr._check_transfer({
+            'source': 'runner@localhost:{0}'.format(source),
+            'source_port': '',
+            'destination': str(tmp_path / 'dest'),
+            'destination_port': '',
+            'log_file': '',
+            'flock_file': '',
+        })
+
+        statuses = [event[1:3] for event in result['events'] if event[0] == 'status']
+        assert ('Source directory', 'OK') in statuses
+        assert cdr.remote_endpoint_keys([{
+            'source': 'runner@localhost:/srv',
+            'source_port': '',
+            'destination': '/local',
+            'destination_port': '',
+        }]) == []
+
+    def test_shared_local_directories_are_inspected_once_per_pass(self, tmp_path, monkeypatch):
+        """Transfers sharing a local directory should reuse its status."""
+        source = tmp_path / 'source'
+        dest = tmp_path / 'dest'
+        source.mkdir()
+        dest.mkdir()
+        calls = []
+        real_inspect = cdr.inspect_local_directory
+
+        def counting_inspect(path, check_writable=True):
+            calls.append((path, check_writable))
+            return real_inspect(path, check_writable=check_writable)
+
+        monkeypatch.setattr(cdr, 'inspect_local_directory', counting_inspect)
+        transfer = {
+            'source': str(source),
+            'source_port': '',
+            'destination': str(dest),
+            'destination_port': '',
+            'log_file': '',
+            'flock_file': '',
+        }
+        local_directories = {}
+
+        first = cdr._check_transfer(transfer, local_directories=local_directories)
+        second = cdr._check_transfer(transfer, local_directories=local_directories)
+
+        assert first['events'] == second['events']
+        assert calls == [(str(source), False), (str(dest), True)]
+
+    @staticmethod
+    def _fake_ssh_config(monkeypatch, ssh_config_output):
+        """Answer ``ssh -G`` with fixed settings and fail on any real ssh call."""
+        ro._is_local_ssh_account.cache_clear()
+        calls = []
+
+        def fake_run(args, **kwargs):
+            if args[:2] != ['ssh', '-G']:
+                raise AssertionError("localhost endpoints should not spawn ssh")
+            calls.append(args)
+            return subprocess.CompletedProcess(args, 0, ssh_config_output, '')
+
+        monkeypatch.setattr(ro.subprocess, 'run', fake_run)
+        return calls
+
+    def test_local_endpoint_requires_same_user_and_default_port(self, monkeypatch):
+        """Other accounts or forwarded ports on localhost still go through ssh."""
+        monkeypatch.setenv('USER', 'runner')
+        self._fake_ssh_config(monkeypatch, 'user runner\nhostname localhost\nport 22\n')
+
+        assert ro.is_local_endpoint('runner', 'localhost') is True
+        assert ro.is_local_endpoint(None, '127.0.0.1', '22') is True
+        assert ro.is_local_endpoint('other', 'localhost') is False
+        assert ro.is_local_endpoint('runner', 'localhost', '2222') is False
+
+    def test_relative_local_endpoint_path_goes_through_ssh(self, monkeypatch):
+        """ssh resolves relative paths against the login home, not our cwd."""
+        monkeypatch.setenv('USER', 'runner')
+        calls = self._fake_ssh_config(monkeypatch, 'user runner\nhostname localhost\nport 22\n')
+
+        assert ro.is_local_endpoint('runner', 'localhost', path='Landing_Zone/in') is False
+        assert ro.is_local_endpoint(None, 'localhost', path='~/Landing_Zone/in') is False
+        assert ro.is_local_endpoint(None, 'localhost', path='/srv/in') is True
+        assert cdr.remote_endpoint_keys([{
+            'source': 'localhost:Landing_Zone/in',
+            'source_port': '',
+            'destination': '/local',
+            'destination_port': '',
+        }]) == [(None, 'localhost', None)]
+        assert calls == [['ssh', '-G', 'localhost']]
+
+    def test_ssh_config_alias_for_other_account_goes_through_ssh(self, monkeypatch):
+        """ssh config User, Port or HostName for the host should disable the bypass."""
+        monkeypatch.setenv('USER', 'runner')
+
+        self._fake_ssh_config(monkeypatch, 'user deploy\nhostname localhost\nport 22\n')
+        assert ro.is_local_endpoint(None, 'localhost', path='/srv/in') is False
+
+        self._fake_ssh_config(monkeypatch, 'user runner\nhostname localhost\nport 2222\n')
+        assert ro.is_local_endpoint(None, 'localhost', path='/srv/in') is False
+
+        self._fake_ssh_config(monkeypatch, 'user runner\nhostname 10.0.0.5\nport 22\n')
+        assert ro.is_local_endpoint(None, 'localhost', path='/srv/in') is False
+
+        self._fake_ssh_config(
+            monkeypatch,
+            'user runner\nhostname localhost\nport 22\nproxyjump bastion\n',
+        )
+        assert ro.is_local_endpoint(None, 'localhost', path='/srv/in') is False
+
+    def test_ssh_preflight_skips_proxied_hosts(self, monkeypatch):
+        """Hosts behind ProxyJump cannot be probed directly, so ssh decides."""
+        def fake_run(args, **kwargs):
+            return subprocess.CompletedProcess(
+                args, 0, 'hostname internal\nport 22\nproxyjump bastion\n', ''
+            )
+
+        def fail_connect(address, timeout=None):
+            raise AssertionError("proxied hosts should not be probed")
+
+        monkeypatch.setattr(ro.subprocess, 'run', fake_run)
+        monkeypatch.setattr(ro.socket, 'create_connection', fail_connect)
+
+        assert ro.ssh_preflight_error('user', 'internal') is None
+
 
 class TestColors:
     """Test the Colors class"""
@@ -1542,6 +2032,26 @@ class TestColors:
         assert isinstance(cdr.Colors.RED, str)
         assert isinstance(cdr.Colors.END, str)
 
+    def test_color_follows_terminal_and_no_color(self, monkeypatch):
+        """Colors should only be used on a terminal without NO_COLOR set."""
+        class FakeStdout:
+            def __init__(self, tty):
+                self.tty = tty
+
+            def isatty(self):
+                return self.tty
+
+        monkeypatch.delenv('NO_COLOR', raising=False)
+        monkeypatch.setattr(ro.sys, 'stdout', FakeStdout(True))
+        assert ro.stdout_supports_color() is True
+
+        monkeypatch.setenv('NO_COLOR', '1')
+        assert ro.stdout_supports_color() is False
+
+        monkeypatch.delenv('NO_COLOR')
+        monkeypatch.setattr(ro.sys, 'stdout', FakeStdout(False))
+        assert ro.stdout_supports_color() is False
+
 
 class TestPrintStatus:
     """Test the print_status function"""
@@ -1578,6 +2088,47 @@ class TestPrintStatus:
         assert "Test message" in captured.out
         assert "Additional details" in captured.out
 
+    def test_print_status_exact_layout(self, capsys):
+        """Precomputed markers should render the same colored layout."""
+        cdr.print_status("Probe", "INFO", "detail line")
+        cdr.print_status("Probe", "unexpected")
+        captured = capsys.readouterr()
+
+        assert captured.out == (
+            "{0}ℹ{1} Probe: {0}INFO{1}\n   detail line\n"
+            "{2}✗{1} Probe: {2}ERROR{1}\n".format(
+                cdr.Colors.BLUE, cdr.Colors.END, cdr.Colors.RED
+            )
+        )
+
+    def test_transfer_block_is_written_once(self, monkeypatch):
+        """A transfer's header and status lines should reach stdout in one write."""
+        writes = []
+
+        class RecordingStdout:
+            def write(self, text):
+                writes.append(text)
+                return len(text)
+
+            def flush(self):
+                pass
+
+        monkeypatch.setattr(cdr.sys, 'stdout', RecordingStdout())
+
+        cdr.print_transfer_check({
+            'title': 'Transfer: a → b',
+            'events': [
+                ('status', 'Source directory', 'OK', 'Path: a'),
+                ('text', '  Using port: 2222'),
+                ('status', 'Destination directory', 'ERROR', None),
+            ],
+        })
+
+        assert len(writes) == 1
+        assert 'Transfer: a → b' in writes[0]
+        assert 'Path: a' in writes[0]
+        assert writes[0].index('Source directory') < writes[0].index('Using port')
+
 
 class TestPrintHeader:
     """Test the print_header function"""
@@ -1590,6 +2141,14 @@ class TestPrintHeader:
         assert "Test Section" in captured.out
         assert "===" in captured.out
 
+    def test_print_header_layout(self, capsys):
+        """Headers should keep their blank lead line and colored banner."""
+        cdr.print_header("Test Section")
+
+        assert capsys.readouterr().out == "\n{0}{1}=== Test Section ==={2}\n".format(
+            cdr.Colors.BOLD, cdr.Colors.BLUE, cdr.Colors.END,
+        )
+
 
 class TestSetupCrontabDirectory:
     """Test the setup_crontab_directory function"""
@@ -1615,6 +2174,48 @@ class TestSetupCrontabDirectory:
         assert ok is True
         assert crontab_dir.exists()
 
+    def test_crontab_path_that_is_a_file_is_reported(self, tmp_path, monkeypatch):
+        """A regular file at ~/crontab.d should fail instead of passing."""
+        monkeypatch.setenv('HOME', str(tmp_path))
+        (tmp_path / "crontab.d").write_text("")
+
+        ok, msg = cdr.setup_crontab_directory()
+
+        assert ok is False
+        assert msg.startswith("Cannot create directory")
+
+    def test_removed_directory_is_recreated(self, tmp_path, monkeypatch):
+        """A crontab.d removed after an earlier setup should be created again."""
+        monkeypatch.setenv('HOME', str(tmp_path))
+        assert cdr.setup_crontab_directory()[0] is True
+        (tmp_path / "crontab.d").rmdir()
+
+        ok, msg = cdr.setup_crontab_directory()
+
+        assert ok is True
+        assert msg == "Directory ready: {0}".format(tmp_path / "crontab.d")
+        assert (tmp_path / "crontab.d").is_dir()
+
+    def test_ensure_directory_reports_creation(self, tmp_path):
+        """ensure_directory should create nested paths and report existing ones."""
+        nested = tmp_path / "a" / "b"
+
+        assert ro.ensure_directory(str(nested)) is True
+        assert ro.ensure_directory(str(nested)) is False
+        assert nested.is_dir()
+
+    def test_staged_cron_fragments_lists_sorted_cron_files(self, tmp_path):
+        """Only regular .cron files should be returned, in name order."""
+        (tmp_path / "b.Landing_Zone.cron").write_text("")
+        (tmp_path / "a.Landing_Zone.cron").write_text("")
+        (tmp_path / "notes.txt").write_text("")
+        (tmp_path / "dir.cron").mkdir()
+
+        assert ro.staged_cron_fragments(str(tmp_path)) == [
+            str(tmp_path / "a.Landing_Zone.cron"),
+            str(tmp_path / "b.Landing_Zone.cron"),
+        ]
+
 
 class TestGetCurrentSystem:
     """Test system detection"""
@@ -1667,6 +2268,209 @@ class TestIntegration:
         assert source_ok is True
         assert dest_ok is True
 
+    def test_concurrent_transfer_checks_print_in_input_order(
+        self, tmp_path, monkeypatch, capsys
+    ):
+        """Slow early checks should not reorder the per-transfer output."""
+        transfers_file = tmp_path / 'transfers.tsv'
+        transfers_file.write_text("placeholder\n")
+        rows = []
+        for name, delay in (('first', 0.2), ('second', 0.0), ('third', 0.1)):
+            endpoint = tmp_path / name
+            endpoint.mkdir()
+            rows.append({
+                'runtime_id': 'local_dev.local',
+                'system': 'local_dev',
+                'users': 'local',
+                'source': str(endpoint),
+                'source_port': '',
+                'destination': str(endpoint),
+                'destination_port': '',
+                'log_file': '',
+                'flock_file': '',
+                'delay': delay,
+            })
+        delays = {row['source']: row['delay'] for row in rows}
+        df = pd.DataFrame(rows)
+        real_inspect = cdr.inspect_local_directory
+
+        def slow_inspect(path, check_writable=False):
+            time.sleep(delays.get(path, 0.0))
+            return real_inspect(path, check_writable=check_writable)
+
+        monkeypatch.setattr(cdr, 'inspect_local_directory', slow_inspect)
+        monkeypatch.setattr(cdr, 'check_required_tools', lambda: True)
+        monkeypatch.setattr(cdr, 'check_flock_command', lambda system: True)
+        monkeypatch.setattr(
+            cdr,
+            'load_runtime_transfers',
+            lambda transfers_file=None, runtime_ids=None: df,
+        )
+
+        config_snapshot = cdr.config.snapshot_state()
+        try:
+            cdr.config._runtime_config = {}
+            result = cdr.main(['--transfers', str(transfers_file)])
+        finally:
+            cdr.config.restore_state(config_snapshot)
+
+        output = capsys.readouterr().out
+        positions = [
+            output.index("Transfer: {0}".format(tmp_path / name))
+            for name in ('first', 'second', 'third')
+        ]
+        assert result is True
+        assert positions == sorted(positions)
+
+    def test_shared_remote_host_is_checked_once(self, tmp_path, monkeypatch, capsys):
+        """Transfers to one (user, host, port) should share one ssh session."""
+        transfers_file = tmp_path / 'transfers.tsv'
+        transfers_file.write_text("placeholder\n")
+        rows = []
+        for name in ('first', 'second', 'third'):
+            source = tmp_path / name
+            source.mkdir()
+            rows.append({
+                'runtime_id': 'local_dev.local',
+                'system': 'local_dev',
+                'users': 'local',
+                'source': str(source),
+                'source_port': '',
+                'destination': 'sshdat@server2:/srv/{0}/'.format(name),
+                'destination_port': '2222',
+                'log_file': '',
+                'flock_file': '',
+            })
+        df = pd.DataFrame(rows)
+        sessions = []
+        ssh_checks = []
+        probes = []
+
+        @contextmanager
+        def fake_multiplex(user, host, port=None):
+            sessions.append(('open', user, host, port))
+            yield '/tmp/lz-test-cm'
+            sessions.append(('close', user, host, port))
+
+        def fake_ssh_check(user, host, port=None, control_path=None):
+            ssh_checks.append((user, host, port, control_path))
+            return True, "Connection successful"
+
+        def fake_inspect(user, host, path, port=None, check_writable=True, control_path=None):
+            probes.append((path, control_path))
+            return {'ok': True, 'missing': False, 'path': path, 'message': 'ok'}
+
+        def fail_host_all(*args, **kwargs):
+            raise AssertionError("shared sessions should replace per-transfer ssh checks")
+
+        monkeypatch.setattr(cdr, 'ssh_preflight_error', lambda *args: None)
+        monkeypatch.setattr(cdr, 'ssh_multiplex', fake_multiplex)
+        monkeypatch.setattr(cdr, 'check_ssh_connection', fake_ssh_check)
+        monkeypatch.setattr(cdr, 'inspect_remote_directory', fake_inspect)
+        monkeypatch.setattr(cdr, 'check_remote_host_all', fail_host_all)
+        monkeypatch.setattr(cdr, 'check_required_tools', lambda: True)
+        monkeypatch.setattr(cdr, 'check_flock_command', lambda system: True)
+        monkeypatch.setattr(
+            cdr,
+            'load_runtime_transfers',
+            lambda transfers_file=None, runtime_ids=None: df,
+        )
+
+        config_snapshot = cdr.config.snapshot_state()
+        try:
+            cdr.config._runtime_config = {}
+            result = cdr.main(['--transfers', str(transfers_file)])
+        finally:
+            cdr.config.restore_state(config_snapshot)
+
+        assert result is True
+        assert ssh_checks == [('sshdat', 'server2', '2222', '/tmp/lz-test-cm')]
+        assert sessions == [
+            ('open', 'sshdat', 'server2', '2222'),
+            ('close', 'sshdat', 'server2', '2222'),
+        ]
+        assert sorted(probes) == [
+            ('/srv/first/', '/tmp/lz-test-cm'),
+            ('/srv/second/', '/tmp/lz-test-cm'),
+            ('/srv/third/', '/tmp/lz-test-cm'),
+        ]
+
+    def test_refused_remote_host_starts_no_master(self, monkeypatch):
+        """A host failing the TCP preflight should not wait on an ssh master."""
+        def fail_multiplex(*args, **kwargs):
+            raise AssertionError("no master should be started for a dead host")
+
+        def fail_ssh_check(*args, **kwargs):
+            raise AssertionError("a dead host should not be probed again")
+
+        monkeypatch.setattr(
+            cdr,
+            'ssh_preflight_error',
+            lambda user, host, port=None: "TCP preflight to {0}:22 failed: refused".format(host),
+        )
+        monkeypatch.setattr(cdr, 'ssh_multiplex', fail_multiplex)
+        monkeypatch.setattr(cdr, 'check_ssh_connection', fail_ssh_check)
+
+        with ExitStack() as stack:
+            sessions = cdr.open_remote_sessions(stack, [{
+                'source': '/local/in',
+                'source_port': '',
+                'destination': 'user@deadhost:/srv/out',
+                'destination_port': '',
+            }])
+
+        assert sessions == {
+            ('user', 'deadhost', None): {
+                'control_path': None,
+                'ssh_ok': False,
+                'ssh_msg': "TCP preflight to deadhost:22 failed: refused",
+            },
+        }
+
+    def test_started_masters_are_closed_when_another_endpoint_fails(self, monkeypatch):
+        """Masters opened by other workers should not leak when one check raises."""
+        events = []
+        events_lock = threading.Lock()
+
+        @contextmanager
+        def fake_multiplex(user, host, port=None):
+            with events_lock:
+                events.append(('open', host))
+            try:
+                yield '/tmp/lz-test-{0}'.format(host)
+            finally:
+                with events_lock:
+                    events.append(('close', host))
+
+        def fake_ssh_check(user, host, port=None, control_path=None):
+            if host == 'broken':
+                raise RuntimeError("probe crashed")
+            return True, "Connection successful"
+
+        monkeypatch.setattr(cdr, 'ssh_preflight_error', lambda *args: None)
+        monkeypatch.setattr(cdr, 'ssh_multiplex', fake_multiplex)
+        monkeypatch.setattr(cdr, 'check_ssh_connection', fake_ssh_check)
+        rows = [
+            {
+                'source': '/local/in',
+                'source_port': '',
+                'destination': 'user@{0}:/srv/out'.format(host),
+                'destination_port': '',
+            }
+            for host in ('healthy', 'broken')
+        ]
+
+        with pytest.raises(RuntimeError):
+            with ExitStack() as stack:
+                cdr.open_remote_sessions(stack, rows)
+
+        assert sorted(events) == [
+            ('close', 'broken'),
+            ('close', 'healthy'),
+            ('open', 'broken'),
+            ('open', 'healthy'),
+        ]
+
 
 class TestTestWithData:
     """End-to-end coverage for the real-transfer test-with-data mode."""
@@ -2139,6 +2943,81 @@ class TestTestWithData:
         ]
         assert (final_root / '.staging').is_dir()
 
+    def test_generate_test_scripts_streams_cron_file_with_owner_marker(
+        self, tmp_path, monkeypatch
+    ):
+        """Test-run cron files should match the generator's marked output."""
+        from landingzones import generate_cron_files as gcf
+
+        snapshot = cdr.config.snapshot_state()
+        cdr.config.load_config(artifact_owner_id="deploy:app")
+        monkeypatch.setattr(gcf, 'write_validation_scripts', lambda *args: None)
+        monkeypatch.setattr(gcf, 'generate_script_content', lambda transfer: '#!/bin/sh\n')
+        transfers_df = TransferTable([{
+            'identifiers': 'flow_one',
+            'system': 'testbox',
+            'users': 'runner',
+            'system_user': 'testbox.runner',
+            'source': '/srv/in/',
+            'destination': '/srv/out/',
+            'script_name': 'flow_one.sh',
+            'frequency': '',
+        }])
+        crontab_dir = tmp_path / 'crontab.d'
+        scripts_dir = tmp_path / 'scripts'
+
+        try:
+            cdr.generate_test_scripts(
+                transfers_df,
+                str(scripts_dir),
+                str(crontab_dir),
+                str(tmp_path / 'validation'),
+            )
+            expected = gcf.add_owner_marker(
+                gcf.generate_cron_file('testbox.runner', transfers_df, str(scripts_dir))
+            )
+        finally:
+            cdr.config.restore_state(snapshot)
+
+        cron_path = crontab_dir / gcf.cron_file_name('testbox.runner')
+        assert cron_path.read_text() == expected
+        assert 'deploy:app' in expected
+
+    def test_generate_test_scripts_failure_leaves_no_cron_file(
+        self, tmp_path, monkeypatch
+    ):
+        """A cron generation error should not leave a partial test-run cron file."""
+        from landingzones import generate_cron_files as gcf
+
+        monkeypatch.setattr(gcf, 'write_validation_scripts', lambda *args: None)
+        monkeypatch.setattr(gcf, 'generate_script_content', lambda transfer: '#!/bin/sh\n')
+
+        def fail_entry(*args, **kwargs):
+            raise RuntimeError("generation failed")
+
+        monkeypatch.setattr(gcf, 'generate_cron_entry', fail_entry)
+        transfers_df = TransferTable([{
+            'identifiers': 'flow_one',
+            'system': 'testbox',
+            'users': 'runner',
+            'system_user': 'testbox.runner',
+            'source': '/srv/in/',
+            'destination': '/srv/out/',
+            'script_name': 'flow_one.sh',
+            'frequency': '',
+        }])
+        crontab_dir = tmp_path / 'crontab.d'
+
+        with pytest.raises(RuntimeError):
+            cdr.generate_test_scripts(
+                transfers_df,
+                str(tmp_path / 'scripts'),
+                str(crontab_dir),
+                str(tmp_path / 'validation'),
+            )
+
+        assert os.listdir(str(crontab_dir)) == []
+
     @pytest.mark.skipif(
         shutil.which('rsync') is None,
         reason='rsync is required for local script-test execution',
@@ -2420,6 +3299,47 @@ class TestTestWithData:
         assert existing_state[0]['blockers'] == []
         assert existing_state[0]['managed_entries'] == ['.staging']
 
+    def test_local_staging_state_classifies_from_one_lstat(self, tmp_path):
+        """Local staging roots should classify links, files and directories."""
+        endpoint = {'value': str(tmp_path) + '/'}
+        staging_path = tmp_path / '.staging'
+
+        assert cdr.inspect_endpoint_staging_state(endpoint) == 'absent'
+
+        staging_path.mkdir()
+        assert cdr.inspect_endpoint_staging_state(endpoint) == 'empty-directory'
+
+        (staging_path / 'partial').write_text('x')
+        assert cdr.inspect_endpoint_staging_state(endpoint) == 'non-empty-directory'
+
+        (staging_path / 'partial').unlink()
+        staging_path.rmdir()
+        (tmp_path / 'elsewhere').mkdir()
+        staging_path.symlink_to(tmp_path / 'elsewhere')
+        assert cdr.inspect_endpoint_staging_state(endpoint) == 'non-directory'
+
+        staging_path.unlink()
+        staging_path.write_text('not a directory')
+        assert cdr.inspect_endpoint_staging_state(endpoint) == 'non-directory'
+
+    def test_list_visible_directories_uses_listing_types(self, tmp_path, monkeypatch):
+        """Directory listings should not stat each entry separately."""
+        (tmp_path / 'flow_two').mkdir()
+        (tmp_path / 'flow_one').mkdir()
+        (tmp_path / '.hidden').mkdir()
+        (tmp_path / 'notes.txt').write_text('x')
+
+        def fail_isdir(path):
+            raise AssertionError("entries should not be stat'ed one by one")
+
+        monkeypatch.setattr(cdr.os.path, 'isdir', fail_isdir)
+
+        assert cdr.list_visible_directories(str(tmp_path)) == ['flow_one', 'flow_two']
+        assert cdr.list_visible_entries(str(tmp_path)) == [
+            'flow_one', 'flow_two', 'notes.txt',
+        ]
+        assert cdr.list_visible_directories(str(tmp_path / 'missing')) == []
+
     def test_remote_non_empty_staging_root_is_blocking(self, monkeypatch):
         """Remote stale staging inspection should match local endpoint behavior."""
         def fake_run_remote_shell(user, host, command, port=''):
@@ -3,9 +3,12 @@
 """Test suite for config.py"""
 
 import os
+import subprocess
+import sys
 import tempfile
 import pytest
 
+from landingzones import _yaml_cache
 from landingzones import config
 
 
@@ -28,6 +31,21 @@ class TestLoadYamlConfig:
         
         assert result == {}
     
+    def test_explicit_config_file_skips_exists_probe(self, tmp_path, monkeypatch):
+        """An explicit config file should be opened without a separate exists()."""
+        config_file = tmp_path / "custom_config.yaml"
+        config_file.write_text("log_dir: custom_log\n")
+        not_a_dir = tmp_path / "plain_file"
+        not_a_dir.write_text("")
+
+        def fail_exists(path):
+            raise AssertionError("exists() should not be probed")
+
+        monkeypatch.setattr(config.os.path, 'exists', fail_exists)
+
+        assert config._load_yaml_config(str(config_file)) == {'log_dir': 'custom_log'}
+        assert config._load_yaml_config(str(not_a_dir / "config.yaml")) == {}
+
     def test_search_config_in_cwd(self, tmp_path, monkeypatch):
         """Test finding config.yaml in current working directory"""
         config_file = tmp_path / "config.yaml"
@@ -88,6 +106,53 @@ class TestLoadYamlConfig:
         
         assert result['log_dir'] == 'found_yml'
     
+    def test_search_keeps_name_priority_and_skips_directories(self, tmp_path, monkeypatch):
+        """Test that config.yaml beats later names and directories are ignored"""
+        (tmp_path / "landingzones.yaml").write_text("log_dir: from_landingzones\n")
+        (tmp_path / "config.yml").write_text("log_dir: from_config_yml\n")
+        (tmp_path / "config.yaml").mkdir()
+        
+        monkeypatch.chdir(tmp_path)
+        result = config._load_yaml_config()
+        
+        assert result['log_dir'] == 'from_config_yml'
+    
+    def test_unchanged_search_dirs_are_not_rescanned(self, tmp_path, monkeypatch):
+        """Repeated discovery in the same directory should skip the scandir."""
+        (tmp_path / "config.yaml").write_text("log_dir: from_yaml\n")
+        monkeypatch.chdir(tmp_path)
+        assert config._load_yaml_config() == {'log_dir': 'from_yaml'}
+
+        def fail_scandir(path):
+            raise AssertionError("search dirs should not be rescanned")
+
+        monkeypatch.setattr(config.os, 'scandir', fail_scandir)
+
+        assert config._load_yaml_config() == {'log_dir': 'from_yaml'}
+
+    def test_config_created_after_negative_lookup_is_found_after_reset(self, tmp_path, monkeypatch):
+        """Resetting the discovery memo should pick up a config written later."""
+        monkeypatch.chdir(tmp_path)
+        assert config._load_yaml_config() == {}
+
+        (tmp_path / "config").mkdir()
+        (tmp_path / "config" / "config.yaml").write_text("log_dir: created_later\n")
+        config._find_default_config_file.cache_clear()
+
+        assert config._load_yaml_config() == {'log_dir': 'created_later'}
+
+    def test_removed_config_file_is_searched_again(self, tmp_path, monkeypatch):
+        """A remembered config file that was deleted should not break loading."""
+        (tmp_path / "config.yaml").write_text("log_dir: from_cwd\n")
+        (tmp_path / "config").mkdir()
+        (tmp_path / "config" / "config.yaml").write_text("log_dir: from_subdir\n")
+        monkeypatch.chdir(tmp_path)
+        assert config._load_yaml_config() == {'log_dir': 'from_cwd'}
+
+        (tmp_path / "config.yaml").unlink()
+
+        assert config._load_yaml_config() == {'log_dir': 'from_subdir'}
+
     def test_no_config_found(self, tmp_path, monkeypatch):
         """Test returns empty dict when no config file found"""
         monkeypatch.chdir(tmp_path)
@@ -115,6 +180,44 @@ class TestLoadYamlConfig:
         
         assert result == {}
 
+    def test_yaml_not_imported_without_config_file(self, tmp_path):
+        """PyYAML should only be imported once a config file is found"""
+        env = dict(os.environ)
+        env.pop('LZ_CONFIG_FILE', None)
+        env['PYTHONPATH'] = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src')
+        proc = subprocess.run(
+            [
+                sys.executable,
+                '-c',
+                "import sys; import landingzones.config; print('yaml' in sys.modules)",
+            ],
+            cwd=str(tmp_path),
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+
+        assert proc.returncode == 0, proc.stderr
+        assert proc.stdout.strip() == 'False'
+
+    def test_prefers_libyaml_safe_loader(self, tmp_path, monkeypatch):
+        """Config parsing should use CSafeLoader when libyaml is available"""
+        config_file = tmp_path / "loader_config.yaml"
+        config_file.write_text("log_dir: from_yaml\n")
+        loaders = []
+        real_load = _yaml_cache.yaml.load
+
+        def recording_load(stream, Loader):
+            loaders.append(Loader)
+            return real_load(stream, Loader=Loader)
+
+        monkeypatch.setattr(_yaml_cache.yaml, 'load', recording_load)
+
+        assert config._load_yaml_config(str(config_file)) == {'log_dir': 'from_yaml'}
+        assert loaders == [
+            getattr(_yaml_cache.yaml, 'CSafeLoader', _yaml_cache.yaml.SafeLoader)
+        ]
+
 
 class TestExpandPath:
     """Test the _expand_path function"""
@@ -134,6 +237,51 @@ class TestExpandPath:
         
         assert result == "/test/value/subdir"
     
+    def test_expansion_cache_follows_environment(self, monkeypatch):
+        """Memoized expansion should pick up changed variables and $HOME"""
+        monkeypatch.setenv("TEST_VAR", "/first")
+        assert config._expand_path("$TEST_VAR/subdir") == "/first/subdir"
+
+        monkeypatch.setenv("TEST_VAR", "/second")
+        monkeypatch.setenv("HOME", "/home/other")
+        assert config._expand_path("$TEST_VAR/subdir") == "/second/subdir"
+        assert config._expand_path("~/subdir") == "/home/other/subdir"
+
+    def test_repeated_expansion_is_served_from_cache(self, monkeypatch):
+        """An unchanged path and environment should not be re-expanded"""
+        monkeypatch.setenv("TEST_VAR", "/cached")
+        monkeypatch.setenv("HOME", "/home/cached")
+        assert config._expand_path("~/$TEST_VAR") == "/home/cached//cached"
+
+        def fail_expand(path):
+            raise AssertionError("cached expansions should not be recomputed")
+
+        monkeypatch.setattr(config.os.path, 'expandvars', fail_expand)
+        monkeypatch.setattr(config.os.path, 'expanduser', fail_expand)
+
+        assert config._expand_path("~/$TEST_VAR") == "/home/cached//cached"
+
+    def test_plain_path_skips_expansion(self, monkeypatch):
+        """Test that paths without ~ or $ are returned without expanding"""
+        def fail_expand(path):
+            raise AssertionError("plain paths should not be expanded")
+
+        monkeypatch.setattr(config.os.path, 'expandvars', fail_expand)
+        monkeypatch.setattr(config.os.path, 'expanduser', fail_expand)
+
+        assert config._expand_path("log/plain_path") == "log/plain_path"
+
+    def test_home_only_path_skips_expandvars(self, monkeypatch):
+        """Paths with ~ but no $ should only be expanded for the home dir"""
+        monkeypatch.setenv("HOME", "/home/tilde_only")
+
+        def fail_expand(path):
+            raise AssertionError("paths without $ should not scan for variables")
+
+        monkeypatch.setattr(config.os.path, 'expandvars', fail_expand)
+
+        assert config._expand_path("~/tilde_only") == "/home/tilde_only/tilde_only"
+
     def test_none_path(self):
         """Test that None path returns None"""
         result = config._expand_path(None)
@@ -164,6 +312,8 @@ class TestConfigClass:
         assert cfg.output_dir == 'output'
         assert cfg.input_dir == 'input'
         assert cfg.validation_scripts_dir == os.path.join('output', 'validation_scripts')
+        assert cfg.default_cron_frequency == '*/15 * * * *'
+        assert cfg.default_cron_frequency is config.DEFAULT_CRON_FREQUENCY
     
     def test_config_from_yaml(self, tmp_path, monkeypatch):
         """Test that Config loads values from config.yaml"""
@@ -278,6 +428,20 @@ class TestConfigClass:
         assert cfg.path_variables['RUNTIME_ONLY'] == '/runtime/root'
         assert cfg.path_variables['SHARED_ROOT'] == '/runtime/shared'
 
+    def test_path_variables_read_environment_live(self, tmp_path, monkeypatch):
+        """Environment placeholders should follow later env changes."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("LATE_ROOT", raising=False)
+        cfg = config.Config()
+        cfg.load_config(path_variables={'CONFIGURED': '/configured'})
+        variables = cfg.path_variables
+
+        monkeypatch.setenv("LATE_ROOT", "/late")
+
+        assert variables['LATE_ROOT'] == '/late'
+        assert variables['CONFIGURED'] == '/configured'
+        assert cfg.to_dict()['path_variables']['LATE_ROOT'] == '/late'
+
     def test_rit_managed_paths_expand_configured_paths(self, tmp_path, monkeypatch):
         """Test that rit_managed config values expand shell-style paths."""
         config_file = tmp_path / "config.yaml"
@@ -320,6 +484,75 @@ class TestConfigClass:
 
         assert cfg.resolve_managed_file_path('server1', '$HOME/test.log', 'log') == '$HOME/test.log'
 
+    def test_values_resolve_live_after_construction(self, tmp_path, monkeypatch):
+        """Env and runtime changes after loading should be seen on next access."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("LZ_LOG_DIR", raising=False)
+        monkeypatch.delenv("LZ_CRONTAB_DIR", raising=False)
+        cfg = config.Config()
+        assert cfg.log_dir == 'log'
+
+        monkeypatch.setenv("LZ_LOG_DIR", "from_env")
+        assert cfg.log_dir == 'from_env'
+
+        cfg._runtime_config['output_dir'] = 'runtime_output'
+        assert cfg.crontab_dir == os.path.join('runtime_output', 'crontab.d')
+
+    def test_explicit_crontab_dir_skips_output_dir_default(self, tmp_path, monkeypatch):
+        """The output_dir-based default should only be built when needed."""
+        monkeypatch.chdir(tmp_path)
+        cfg = config.Config()
+        cfg.load_config(crontab_dir='/srv/crontab.d')
+
+        def fail_output_dir(self):
+            raise AssertionError("output_dir should not be resolved")
+
+        monkeypatch.setattr(config.Config, 'output_dir', property(fail_output_dir))
+
+        assert cfg.crontab_dir == '/srv/crontab.d'
+
+    def test_yaml_is_loaded_on_first_use(self, tmp_path, monkeypatch):
+        """Constructing Config should not search for config files yet."""
+        (tmp_path / "config.yaml").write_text("log_dir: from_yaml\n")
+        monkeypatch.chdir(tmp_path)
+        calls = []
+        real_load = config._load_yaml_config
+
+        def counting_load(config_file=None):
+            calls.append(config_file)
+            return real_load(config_file)
+
+        monkeypatch.setattr(config, '_load_yaml_config', counting_load)
+
+        cfg = config.Config()
+        assert calls == []
+
+        assert cfg.log_dir == 'from_yaml'
+        assert cfg.output_dir == 'output'
+        assert calls == [None]
+
+    def test_explicit_config_file_skips_default_discovery(self, tmp_path, monkeypatch):
+        """load_config(config_file=...) should not first parse a default file."""
+        (tmp_path / "config.yaml").write_text("log_dir: from_default\n")
+        explicit = tmp_path / "explicit.yaml"
+        explicit.write_text("log_dir: from_explicit\n")
+        monkeypatch.chdir(tmp_path)
+        calls = []
+        real_load = config._load_yaml_config
+
+        def counting_load(config_file=None):
+            calls.append(config_file)
+            return real_load(config_file)
+
+        monkeypatch.setattr(config, '_load_yaml_config', counting_load)
+
+        cfg = config.Config()
+        cfg.load_config(config_file=str(explicit))
+
+        assert cfg.log_dir == 'from_explicit'
+        assert cfg.config_file == str(explicit)
+        assert calls == [str(explicit)]
+
     def test_get_flock_path_default_and_override(self, tmp_path, monkeypatch):
         """Test per-system flock path override with default fallback."""
         config_file = tmp_path / "config.yaml"
@@ -2,17 +2,21 @@
 # -*- coding: utf-8 -*-
 """Test suite for generate_cron_files.py"""
 
+import io
 import os
+import re
 import stat
 import sys
-import tempfile
 import shutil
 import subprocess
 import pytest
 
 from landingzones import generate_cron_files as gcf
+from landingzones.table import TransferTable
 
 
+# Any ssh invocation given an explicit port, quoted inside -e or not
+SSH_PORT_PATTERN = re.compile(r'ssh\s+-p\s')
 HAS_RSYNC = shutil.which("rsync") is not None
 HAS_FLOCK = shutil.which("flock") is not None
 HAS_TAR = shutil.which("tar") is not None
@@ -40,6 +44,18 @@ localhost_main\tlocalhost\ttest\t/src/\t/dest/\t\t\t\t/tmp/test.log\t/tmp/test.l
         assert df.iloc[0]['identifiers'] == 'server1_main'
         assert df.iloc[1]['system'] == 'localhost'
 
+    def test_parse_strips_spreadsheet_float_port_suffix(self, tmp_path):
+        """Ports exported as 22.0 should be normalized back to 22"""
+        tsv_content = """identifiers\tsystem\tusers\tsource\tdestination\tdestination_port\tlog_file\tflock_file
+float_port\tserver1\tuser1\t/srv/src/\tuser@host:/dest/\t2222.0\t/tmp/log.txt\t/tmp/lock.txt
+"""
+        test_file = tmp_path / "test_transfers.tsv"
+        test_file.write_text(tsv_content)
+
+        df = gcf.parse_transfers_file(str(test_file))
+
+        assert df.iloc[0]['destination_port'] == '2222'
+
     def test_parse_uses_stored_runtime_id(self, tmp_path):
         """runtime_id is the stored runtime/artifact identity."""
         tsv_content = """identifiers\truntime_id\tsystem\tusers\tsource\tdestination\tdestination_port\trsync_options\tio_nice\tlog_file\tflock_file
@@ -184,6 +200,102 @@ localhost_main\tlocalhost\ttest\t/src/\t/dest/\t\t\t\t/tmp/test.log\t/tmp/test.l
         assert len(df) == 2
         assert 'commented' not in df['system'].values
     
+    def test_read_tsv_rows_matches_dictreader_layout(self):
+        """Blank lines, short rows and extra values should behave like DictReader."""
+        handle = io.StringIO("a\tb\tc\n 1 \tnan\t3\n\nshort\nx\ty\tz\textra\n")
+
+        rows, columns = gcf.read_tsv_rows(handle)
+
+        assert columns == ['a', 'b', 'c']
+        assert rows == [
+            {'a': '1', 'b': '', 'c': '3'},
+            {'a': 'short', 'b': '', 'c': ''},
+            {'a': 'x', 'b': 'y', 'c': 'z'},
+        ]
+        assert gcf.read_tsv_rows(io.StringIO("")) == ([], [])
+
+    def test_read_tsv_rows_interns_column_names(self):
+        """Row keys should be the interned column names shared by every row."""
+        handle = io.StringIO("".join(["sou", "rce\tdestination\n", "/a/\t/b/\n"]))
+
+        rows, columns = gcf.read_tsv_rows(handle)
+
+        assert columns[0] is sys.intern('source')
+        assert next(iter(rows[0])) is columns[0]
+
+    def test_from_records_adopts_rows_without_copying(self):
+        """from_records should own the given rows; the constructor copies them."""
+        rows = [{'system': 'server1', 'users': 'user1'}]
+
+        adopted = TransferTable.from_records(rows)
+        copied = TransferTable(rows)
+
+        assert adopted.columns == ['system', 'users']
+        assert adopted.iloc[0] is rows[0]
+        assert copied.iloc[0] is not rows[0]
+        assert copied.iloc[0] == rows[0]
+
+    def test_parse_accepts_text_stream(self, tmp_path):
+        """A file-like object should parse the same as the file on disk."""
+        tsv_content = """identifiers\tsystem\tusers\tsource\tdestination\tdestination_port\trsync_options\tio_nice\tlog_file\tflock_file
+server1_main\tserver1\tuser1\t/srv/data/src/\tuser@host:/dest/\t\t\t\t/tmp/log.txt\t/tmp/lock.txt
+"""
+        test_file = tmp_path / "test_transfers.tsv"
+        test_file.write_text(tsv_content)
+
+        from_stream = gcf.parse_transfers_file(io.StringIO(tsv_content))
+        from_path = gcf.parse_transfers_file(str(test_file))
+
+        assert from_stream.columns == from_path.columns
+        assert from_stream.to_rows() == from_path.to_rows()
+
+    def test_parse_does_not_import_pandas(self, tmp_path):
+        """Parsing a small TSV should stay on the stdlib csv path."""
+        tsv_content = """identifiers\tsystem\tusers\tsource\tdestination\tdestination_port\trsync_options\tio_nice\tlog_file\tflock_file
+server1_main\tserver1\tuser1\t/srv/data/src/\tuser@host:/dest/\t\t\t\t/tmp/log.txt\t/tmp/lock.txt
+"""
+        test_file = tmp_path / "test_transfers.tsv"
+        test_file.write_text(tsv_content)
+        code = (
+            "import sys\n"
+            "sys.modules['pandas'] = None\n"
+            "from landingzones import generate_cron_files as gcf\n"
+            "df = gcf.parse_transfers_file(sys.argv[1])\n"
+            "print(type(df).__name__, len(df))\n"
+        )
+        env = dict(os.environ)
+        src_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src')
+        env['PYTHONPATH'] = os.pathsep.join(
+            part for part in (src_dir, env.get('PYTHONPATH', '')) if part
+        )
+
+        proc = subprocess.run(
+            [sys.executable, '-c', code, str(test_file)],
+            capture_output=True,
+            text=True,
+            check=False,
+            cwd=str(tmp_path),
+            env=env,
+        )
+
+        assert proc.returncode == 0, proc.stderr
+        assert proc.stdout.strip() == 'TransferTable 1'
+
+    def test_parse_renames_legacy_user_column(self, tmp_path):
+        """A legacy 'user' column should be exposed as 'users'."""
+        tsv_content = """identifiers\tsystem\tuser\tsource\tdestination\tdestination_port\trsync_options\tio_nice\tlog_file\tflock_file
+legacy_main\tserver1\tuser1\t/srv/data/src/\tuser@host:/dest/\t\t\t\t/tmp/log.txt\t/tmp/lock.txt
+"""
+        test_file = tmp_path / "test_transfers.tsv"
+        test_file.write_text(tsv_content)
+
+        df = gcf.parse_transfers_file(str(test_file))
+
+        assert 'users' in df.columns
+        assert 'user' not in df.columns
+        assert df['users'].tolist() == ['user1']
+        assert df['runtime_id'].tolist() == ['server1.user1']
+
     def test_parse_filters_disabled_rows(self, tmp_path):
         """Test that rows with enabled != TRUE are filtered out"""
         tsv_content = """identifiers\tenabled\tsystem\tusers\tsource\tdestination\tdestination_port\trsync_options\tio_nice\tlog_file\tflock_file
@@ -218,6 +330,20 @@ server3_main\tFALSE\tserver3\tuser3\t/src/\t/dest/\t\t\t\t/tmp/test.log\t/tmp/te
         assert 'server2' in df['system'].values
         assert 'server3' not in df['system'].values
     
+    def test_parse_filters_comments_and_disabled_rows_together(self, tmp_path):
+        """Commented rows should be dropped even when marked enabled."""
+        tsv_content = """identifiers\tenabled\tsystem\tusers\tsource\tdestination\tdestination_port\trsync_options\tio_nice\tlog_file\tflock_file
+server1_main\tTRUE\tserver1\tuser1\t/srv/data/src/\tuser@host:/dest/\t\t\t\t/tmp/log.txt\t/tmp/lock.txt
+commented\tTRUE\t#server2\tuser2\t/src/\t/dest/\t\t\t\t/tmp/log2.txt\t/tmp/lock2.txt
+server3_main\tfalse\tserver3\tuser3\t/src/\t/dest/\t\t\t\t/tmp/test.log\t/tmp/test.lock
+"""
+        test_file = tmp_path / "test_transfers.tsv"
+        test_file.write_text(tsv_content)
+
+        df = gcf.parse_transfers_file(str(test_file))
+
+        assert df['system'].tolist() == ['server1']
+
     def test_parse_without_enabled_column(self, tmp_path):
         """Test that parsing works when enabled column is absent (backward compatibility)"""
         tsv_content = """system\tusers\tsource\tdestination\tdestination_port\trsync_options\tio_nice\tlog_file\tflock_file
@@ -428,6 +554,31 @@ server1_main\tserver1\tuser1\t${SRC_ROOT}/input/\t${DST_ROOT}/output/\t\t\t\t/tm
         assert df.iloc[0]['source'] == '/srv/dev/source/input/'
         assert df.iloc[0]['destination'] == '/srv/dev/destination/output/'
 
+    def test_parse_reads_path_variables_once(self, tmp_path, monkeypatch):
+        """Path variables copy os.environ, so they should be built once per parse."""
+        rows = "".join(
+            "t{0}\tserver1\tuser1\t/srv/src{0}/\t/srv/dst{0}/\t\t\t\t/tmp/log{0}.txt\t/tmp/lock{0}.txt\n".format(index)
+            for index in range(3)
+        )
+        test_file = tmp_path / "test_transfers.tsv"
+        test_file.write_text(
+            "identifiers\tsystem\tusers\tsource\tdestination\tdestination_port\trsync_options\tio_nice\tlog_file\tflock_file\n"
+            + rows
+        )
+        calls = []
+        real_property = type(gcf.config).path_variables
+
+        def counting_path_variables(self):
+            calls.append(1)
+            return real_property.fget(self)
+
+        monkeypatch.setattr(type(gcf.config), 'path_variables', property(counting_path_variables))
+
+        df = gcf.parse_transfers_file(str(test_file))
+
+        assert len(df) == 3
+        assert len(calls) == 1
+
     def test_parse_expands_remote_path_variables_without_touching_remote_shell_vars(self, tmp_path):
         """Only the filesystem path segment of remote endpoints should expand."""
         tsv_content = """identifiers\tsystem\tusers\tsource\tdestination\tdestination_port\trsync_options\tio_nice\tlog_file\tflock_file
@@ -726,6 +877,33 @@ class TestGenerateRsyncCommand:
         assert 'user@remote:/source/' in cmd
         assert '/local/dest/.staging/transfer/' in cmd
 
+    def test_rsync_options_are_shared_by_command_and_script(self):
+        """Commands and scripts should assemble rsync options the same way."""
+        options = gcf.build_rsync_options(' 2222 ', '2200', ' --checksum ')
+
+        assert options == "-av --remove-source-files -e 'ssh -p 2222' --checksum"
+        assert gcf.build_rsync_options(None, 'x', 'nan') == '-av --remove-source-files'
+        assert gcf.build_rsync_options('', '2200', ' nan ') == (
+            "-av --remove-source-files -e 'ssh -p 2200'"
+        )
+
+        transfer = {
+            'identifiers': 'sample',
+            'system': 'server1',
+            'source': 'user@remote:/source/',
+            'source_port': '2222',
+            'destination': '/local/dest/',
+            'destination_port': '',
+            'rsync_options': '--checksum',
+            'io_nice': '-c3',
+            'log_file': '/tmp/test.log',
+            'flock_file': '/tmp/test.lock',
+        }
+        expected = "ionice -c3 rsync -av --remove-source-files -e 'ssh -p 2222' --checksum"
+
+        assert gcf.generate_rsync_command(transfer).count(expected) == 1
+        assert expected in gcf.generate_script_content(transfer)
+
     def test_remote_source_cleanup_preserves_home_expansion(self):
         """Remote cleanup commands should keep $HOME for the remote shell."""
         transfer = {
@@ -962,6 +1140,15 @@ class TestGenerateRsyncCommand:
         assert 'ionice' not in cmd
         assert 'rsync -av --remove-source-files /source/ /dest/.staging/transfer/' in cmd
 
+    def test_missing_tsv_values_share_one_sentinel_set(self):
+        """Only blank text and 'nan' count as missing; other spellings are kept."""
+        for missing in (None, '', '  ', 'nan', ' nan '):
+            assert gcf.normalize_io_nice(missing) == ''
+            assert gcf.sanitize_identifier(missing) == ''
+
+        assert gcf.normalize_io_nice('-c3') == 'ionice -c3'
+        assert gcf.sanitize_identifier('None') == 'None'
+
     def test_rsync_uses_remote_staging_and_remote_promote(self):
         """Test that remote destinations are staged and promoted remotely."""
         transfer = {
@@ -1086,6 +1273,31 @@ class TestGenerateRsyncCommand:
 
         assert cmd == '*/15 * * * * /bin/sh /tmp/scripts/sample.sh'
 
+    def test_generate_cron_entry_uses_caller_resolved_default(self, monkeypatch):
+        """A default frequency passed by the caller should skip the config lookup."""
+        transfer = {'frequency': ''}
+        monkeypatch.setenv('LZ_CRON_FREQUENCY', '0 * * * *')
+
+        cmd = gcf.generate_cron_entry(
+            transfer,
+            '/tmp/scripts/sample.sh',
+            default_frequency='*/5 * * * *',
+        )
+
+        assert cmd == '*/5 * * * * /bin/sh /tmp/scripts/sample.sh'
+
+    def test_cached_schedule_still_follows_configured_default(self, monkeypatch):
+        """Only the row's schedule text is memoized, not the default it falls back to."""
+        monkeypatch.setenv('LZ_CRON_FREQUENCY', '0 * * * *')
+        first = gcf.generate_cron_entry({'frequency': ' nan '}, '/tmp/a.sh')
+        monkeypatch.setenv('LZ_CRON_FREQUENCY', '30 2 * * *')
+        second = gcf.generate_cron_entry({'frequency': ' nan '}, '/tmp/a.sh')
+
+        assert first == '0 * * * * /bin/sh /tmp/a.sh'
+        assert second == '30 2 * * * /bin/sh /tmp/a.sh'
+        assert gcf.cron_schedule_text(' 0 0 * * * ') == '0 0 * * *'
+        assert gcf.cron_schedule_text(None) == ''
+
     def test_generate_script_content(self):
         """Test shell script content generation now uses iterative transfers."""
         transfer = {
@@ -2341,6 +2553,62 @@ class TestGroupTransfersBySystemUser:
         assert ('server1', 'user1') in grouped.groups
         assert ('server2', 'user2') in grouped.groups
 
+    def test_transfer_table_groups_in_one_pass(self):
+        """TransferTable groups should keep first-seen order and row positions."""
+        table = TransferTable([
+            {'system': 'server2', 'users': 'user2', 'identifiers': 'first'},
+            {'system': 'server1', 'users': 'user1', 'identifiers': 'second'},
+            {'system': 'server2', 'users': 'user2', 'identifiers': 'third'},
+        ])
+
+        grouped = table.groupby(['system', 'users'])
+
+        assert len(grouped) == 2
+        assert [
+            (key, group['identifiers'].tolist()) for key, group in grouped
+        ] == [
+            (('server2', 'user2'), ['first', 'third']),
+            (('server1', 'user1'), ['second']),
+        ]
+        assert dict(grouped.groups) == {
+            ('server2', 'user2'): [0, 2],
+            ('server1', 'user1'): [1],
+        }
+
+    def test_transfer_table_groups_share_parent_rows(self):
+        """Iterating groups should not copy each row dict."""
+        rows = [
+            {'system': 'server1', 'users': 'user1', 'identifiers': 'first'},
+            {'system': 'server1', 'users': 'user1', 'identifiers': 'second'},
+        ]
+        table = TransferTable.from_records(rows)
+
+        (_, group), = table.groupby(['system', 'users'])
+
+        assert group.columns == table.columns
+        assert group.columns is not table.columns
+        assert [row for _, row in group.iterrows()] == rows
+        assert all(
+            row is original for (_, row), original in zip(group.iterrows(), rows)
+        )
+
+    def test_assigning_to_group_frame_leaves_parent_unchanged(self):
+        """Group frames should copy their rows before the first assignment."""
+        table = TransferTable.from_records([
+            {'system': 'server1', 'users': 'user1', 'identifiers': 'first'},
+            {'system': 'server1', 'users': 'user1', 'identifiers': 'second'},
+        ])
+
+        (_, group), = table.groupby(['system', 'users'])
+        group['script_name'] = ['first.sh', 'second.sh']
+        group.loc[0, 'identifiers'] = 'renamed'
+
+        assert group['identifiers'].tolist() == ['renamed', 'second']
+        assert group['script_name'].tolist() == ['first.sh', 'second.sh']
+        assert table['identifiers'].tolist() == ['first', 'second']
+        assert 'script_name' not in table.columns
+        assert all('script_name' not in row for _, row in table.iterrows())
+
 
 class TestCronFileGeneration:
     """Integration tests for full cron file generation"""
@@ -2454,6 +2722,177 @@ second\tlocalhost.testuser\tlocalhost\ttestuser\t/tmp/src2/\t\t/tmp/dest2/\t\t\t
         assert 'first (frequency=*/2 * * * *)' in captured.out
         assert 'second (frequency=*/5 * * * *)' in captured.out
 
+    def test_main_writes_progress_to_given_stream(self, tmp_path, capsys):
+        """Callers can collect generation output without touching stdout."""
+        transfers_file = tmp_path / "test_transfers.tsv"
+        transfers_file.write_text(
+            """identifiers\tsystem\tusers\tsource\tsource_port\tdestination\tdestination_port\trsync_options\tio_nice\tlog_file\tflock_file
+first\tlocalhost\ttestuser\t/tmp/src1/\t\t/tmp/dest1/\t\t\t\t/tmp/first.log\t/tmp/first.lock
+"""
+        )
+        out = io.StringIO()
+
+        rc = gcf.main(
+            [
+                '--transfers', str(transfers_file),
+                '--output-dir', str(tmp_path / "crontab.d"),
+                '--log-dir', str(tmp_path / "log"),
+                '--scripts-dir', str(tmp_path / "scripts"),
+                '--validation-scripts-dir', str(tmp_path / "validation_scripts"),
+            ],
+            out=out,
+        )
+
+        assert rc == 0
+        assert 'Total transfers: 1' in out.getvalue()
+        assert capsys.readouterr().out == ''
+
+    def test_main_generates_cron_file_without_users_column(self, tmp_path):
+        """The users column is optional when runtime_id names the runtime."""
+        transfers_file = tmp_path / "test_transfers.tsv"
+        output_dir = tmp_path / "crontab.d"
+        transfers_file.write_text(
+            """identifiers\truntime_id\tsystem\tsource\tdestination\tlog_file\tflock_file
+first\tsrv.app\tsrv\t/tmp/src1/\t/tmp/dest1/\t/tmp/first.log\t/tmp/first.lock
+"""
+        )
+
+        rc = gcf.main(
+            [
+                '--transfers', str(transfers_file),
+                '--output-dir', str(output_dir),
+                '--log-dir', str(tmp_path / "log"),
+                '--scripts-dir', str(tmp_path / "scripts"),
+                '--validation-scripts-dir', str(tmp_path / "validation_scripts"),
+            ],
+            out=io.StringIO(),
+        )
+
+        assert rc == 0
+        cron_content = (output_dir / gcf.cron_file_name('srv.app')).read_text()
+        assert '# [first] Transfer from /tmp/src1/ to /tmp/dest1/' in cron_content
+
+    def test_main_groups_runtime_ids_once(self, tmp_path, monkeypatch):
+        """Cron files should come from one grouping pass, not a mask per pair."""
+        transfers_file = tmp_path / "test_transfers.tsv"
+        transfers_file.write_text(
+            """identifiers\tsystem\tusers\tsource\tsource_port\tdestination\tdestination_port\trsync_options\tio_nice\tlog_file\tflock_file
+first\tlocalhost\ttestuser\t/tmp/src1/\t\t/tmp/dest1/\t\t\t\t/tmp/first.log\t/tmp/first.lock
+second\tlocalhost\totheruser\t/tmp/src2/\t\t/tmp/dest2/\t\t\t\t/tmp/second.log\t/tmp/second.lock
+third\tlocalhost\ttestuser\t/tmp/src3/\t\t/tmp/dest3/\t\t\t\t/tmp/third.log\t/tmp/third.lock
+"""
+        )
+        groupby_keys = []
+        written = []
+        real_groupby = TransferTable.groupby
+        real_write_cron_file = gcf.write_cron_file
+
+        def counting_groupby(self, by, dropna=True):
+            groupby_keys.append(by)
+            return real_groupby(self, by, dropna=dropna)
+
+        def recording_write_cron_file(path, runtime_id, transfers, *args, **kwargs):
+            written.append((runtime_id, transfers['identifiers'].tolist()))
+            return real_write_cron_file(path, runtime_id, transfers, *args, **kwargs)
+
+        monkeypatch.setattr(TransferTable, 'groupby', counting_groupby)
+        monkeypatch.setattr(gcf, 'write_cron_file', recording_write_cron_file)
+
+        rc = gcf.main(
+            [
+                '--transfers', str(transfers_file),
+                '--output-dir', str(tmp_path / "crontab.d"),
+                '--log-dir', str(tmp_path / "log"),
+                '--scripts-dir', str(tmp_path / "scripts"),
+                '--validation-scripts-dir', str(tmp_path / "validation_scripts"),
+            ],
+            out=io.StringIO(),
+        )
+
+        assert rc == 0
+        assert groupby_keys.count('runtime_id') == 1
+        assert sorted(written) == [
+            ('localhost.otheruser', ['second']),
+            ('localhost.testuser', ['first', 'third']),
+        ]
+
+    def test_failed_cron_file_write_keeps_previous_file(self, tmp_path, monkeypatch):
+        """An error while generating should leave the installed file untouched."""
+        test_file = tmp_path / "test_transfers.tsv"
+        test_file.write_text(
+            """identifiers\tsystem\tusers\tsource\tsource_port\tdestination\tdestination_port\trsync_options\tio_nice\tlog_file\tflock_file
+first\tlocalhost\ttestuser\t/tmp/src1/\t\t/tmp/dest1/\t\t\t\t/tmp/first.log\t/tmp/first.lock
+"""
+        )
+        df = gcf.parse_transfers_file(str(test_file))
+        output_path = tmp_path / "lz_localhost.testuser"
+        output_path.write_text("previous cron content\n")
+
+        def fail_entry(*args, **kwargs):
+            raise RuntimeError("generation failed")
+
+        monkeypatch.setattr(gcf, 'generate_cron_entry', fail_entry)
+
+        with pytest.raises(RuntimeError):
+            gcf.write_cron_file(str(output_path), 'localhost.testuser', df, '/tmp/scripts')
+
+        assert output_path.read_text() == "previous cron content\n"
+        assert sorted(os.listdir(str(tmp_path))) == [
+            "lz_localhost.testuser",
+            "test_transfers.tsv",
+        ]
+
+    def test_write_cron_file_matches_generated_content(self, tmp_path):
+        """Streaming a cron file should write the marked generated content."""
+        test_file = tmp_path / "test_transfers.tsv"
+        test_file.write_text(
+            """identifiers\tsystem\tusers\tsource\tsource_port\tdestination\tdestination_port\trsync_options\tio_nice\tlog_file\tflock_file
+first\tlocalhost\ttestuser\t/tmp/src1/\t\t/tmp/dest1/\t\t\t\t/tmp/first.log\t/tmp/first.lock
+second\tlocalhost\ttestuser\t/tmp/src2/\t\t/tmp/dest2/\t\t\t\t/tmp/second.log\t/tmp/second.lock
+"""
+        )
+        df = gcf.parse_transfers_file(str(test_file))
+        output_path = tmp_path / "lz_localhost.testuser"
+
+        snapshot = gcf.config.snapshot_state()
+        gcf.config.load_config(artifact_owner_id="deploy:app")
+        try:
+            gcf.write_cron_file(str(output_path), 'localhost.testuser', df, '/tmp/scripts')
+            expected = gcf.add_owner_marker(
+                gcf.generate_cron_file('localhost.testuser', df, '/tmp/scripts')
+            )
+        finally:
+            gcf.config.restore_state(snapshot)
+
+        assert expected.startswith('# landingzones-owner: deploy:app\n')
+        assert output_path.read_text() == expected
+
+    def test_unique_log_files_keeps_first_seen_order(self):
+        """Log summaries should drop blanks and repeats without reordering."""
+        table = TransferTable(
+            [
+                {'log_file': '/tmp/b.log'},
+                {'log_file': '  '},
+                {'log_file': '/tmp/a.log'},
+                {'log_file': '/tmp/b.log'},
+                {'log_file': ''},
+            ],
+            columns=['log_file'],
+        )
+
+        assert gcf.unique_log_files(table) == ['/tmp/b.log', '/tmp/a.log']
+
+    def test_owner_marker_follows_shebang(self):
+        """The owner marker should be inserted after a leading shebang."""
+        snapshot = gcf.config.snapshot_state()
+        gcf.config.load_config(artifact_owner_id="deploy:app")
+        try:
+            marked = gcf.add_owner_marker("#!/bin/sh\necho hi\n")
+        finally:
+            gcf.config.restore_state(snapshot)
+
+        assert marked == "#!/bin/sh\n# landingzones-owner: deploy:app\necho hi\n"
+
 
 class TestEnvironmentVariableExpansion:
     """Test that environment variables are handled correctly"""
@@ -2503,8 +2942,8 @@ class TestEdgeCases:
         
         cmd = gcf.generate_rsync_command(transfer)
         
-        # Should not have port specification
-        assert '-p ' not in cmd.split('ssh')[1].split('"')[0] if 'ssh' in cmd else True
+        # Should not have port specification on any ssh invocation
+        assert SSH_PORT_PATTERN.search(cmd) is None
     
     def test_nan_port_handled(self):
         """Test that NaN port values are handled"""
@@ -2527,6 +2966,22 @@ class TestEdgeCases:
         assert cmd is not None
         assert 'nan' not in cmd.lower()
 
+    def test_source_find_target_strips_trailing_wildcards(self):
+        """Cleanup find should target the directory behind a wildcard source."""
+        assert gcf.source_find_target('/data/in/*') == '/data/in'
+        assert gcf.source_find_target('/data/in/run*') == '/data/in/run'
+        assert gcf.source_find_target('/data/in/**') == '/data/in'
+        assert gcf.source_find_target('host:/data/in/') == 'host:/data/in/'
+
+    def test_command_field_text_passes_clean_strings_through(self):
+        """Parsed string fields should be reused as-is; missing values become ''."""
+        value = ' -z '
+
+        assert gcf.command_field_text(value) is value
+        assert gcf.command_field_text(None) == ''
+        assert gcf.command_field_text(float('nan')) == ''
+        assert gcf.command_field_text(2222) == '2222'
+
 
 class TestOverlappingSourceDetection:
     """Test detection of overlapping source paths"""
@@ -2582,6 +3037,31 @@ class TestOverlappingSourceDetection:
         
         assert len(warnings) == 0
     
+    def test_reports_every_nested_pair_in_row_order(self):
+        """Non-adjacent ancestors and name-prefix siblings should be handled."""
+        paths = ['/data/a/c', '/data/a-b', '/data/a', '/data/a/c/d', '/data/a']
+
+        assert gcf.overlapping_source_pairs(paths) == [
+            (0, 2), (0, 3), (0, 4), (2, 3), (3, 4),
+        ]
+
+        # Large catalogs: every child is paired with exactly its one parent
+        wide = ['/zone{0}/run{1}'.format(i % 20, i) for i in range(2000)]
+        wide += ['/zone{0}'.format(i) for i in range(20)]
+        wide_pairs = gcf.overlapping_source_pairs(wide)
+        assert len(wide_pairs) == 2000
+        assert all(wide[i].startswith(wide[j] + '/') for i, j in wide_pairs)
+
+        df = TransferTable([
+            {'system': 'server1', 'users': 'user1', 'source': '/data/a/c/*'},
+            {'system': 'server1', 'users': 'user1', 'source': '/data/a-b/'},
+            {'system': 'server1', 'users': 'user1', 'source': '/data/a/'},
+        ])
+        warnings = gcf.check_overlapping_sources(df)
+
+        assert len(warnings) == 1
+        assert "Parent: /data/a/\n  Child:  /data/a/c/*" in warnings[0]
+
     def test_normalize_source_path(self):
         """Test path normalization for comparison"""
         assert gcf.normalize_source_path('/path/to/dir/*') == '/path/to/dir'
@@ -2589,6 +3069,22 @@ class TestOverlappingSourceDetection:
         assert gcf.normalize_source_path('/path/to/dir') == '/path/to/dir'
         assert gcf.normalize_source_path('/path/to/dir* ') == '/path/to/dir'
 
+    def test_fixture_container_candidates_from_test_local_path(self):
+        """The first directory under tests/test_local should lead the candidates."""
+        source = os.path.join(os.sep, 'repo', 'tests', 'test_local', 'illumina', 'runs', '*')
+
+        assert gcf.get_validation_fixture_container_candidates(source) == ['illumina', 'runs']
+        assert gcf.get_validation_fixture_container_candidates('/srv/in/') == ['in']
+
+    def test_normalize_source_path_keeps_single_suffix_trim(self):
+        """Only one trailing wildcard is stripped, and repeats hit the cache."""
+        assert gcf.normalize_source_path('/path/to/dir**') == '/path/to/dir*'
+        assert gcf.normalize_source_path('/path/*/') == '/path/*'
+        before = gcf.normalize_source_path.cache_info().hits
+
+        assert gcf.normalize_source_path('/path/to/dir**') == '/path/to/dir*'
+        assert gcf.normalize_source_path.cache_info().hits == before + 1
+
     def test_detects_directory_iteration_sources(self):
         """Test wildcard source detection for per-directory transfer scripts."""
         script = gcf.generate_script_content({
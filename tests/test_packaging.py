@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the static package list in pyproject.toml."""
+
+import os
+import re
+
+import pytest
+
+import landingzones
+
+tomllib = pytest.importorskip("tomllib")
+
+
+APP_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def discover_source_packages(src_dir):
+    """Return every importable package directory below src/."""
+    packages = []
+    for root, dirs, files in os.walk(src_dir):
+        dirs[:] = [name for name in dirs if name != "__pycache__"]
+        if "__init__.py" in files:
+            packages.append(os.path.relpath(root, APP_ROOT).replace(os.sep, "/"))
+    return sorted(packages)
+
+
+def test_wheel_package_list_covers_source_tree():
+    """The static wheel package list should not drift from src/."""
+    with open(os.path.join(APP_ROOT, "pyproject.toml"), "rb") as f:
+        pyproject = tomllib.load(f)
+    listed = pyproject["tool"]["hatch"]["build"]["targets"]["wheel"]["packages"]
+
+    for package in discover_source_packages(os.path.join(APP_ROOT, "src")):
+        assert any(
+            package == entry or package.startswith(entry + "/")
+            for entry in listed
+        ), "{0} is not shipped by the wheel target".format(package)
+
+
+def test_package_metadata_is_readable_without_executing_init():
+    """Build tools read package metadata by regex, never by exec/import."""
+    with open(os.path.join(APP_ROOT, "src", "landingzones", "__init__.py")) as f:
+        source = f.read()
+
+    for key in ("version", "author", "description"):
+        match = re.search(
+            r"^__{0}__\s*=\s*['\"]([^'\"]+)['\"]".format(key),
+            source,
+            re.M,
+        )
+        assert match is not None, "__{0}__ must stay a string literal".format(key)
+        assert match.group(1) == getattr(landingzones, "__{0}__".format(key))
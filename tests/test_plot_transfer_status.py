@@ -53,6 +53,7 @@ def test_normalize_directory_suffix_handles_paths_and_remote_prefixes():
     assert pts.normalize_directory_suffix("Illumina_TransferTest") == "Illumina_TransferTest"
     assert pts.normalize_directory_suffix("/tmp/a/b/Nanopore_TransferTest/") == "Nanopore_TransferTest"
     assert pts.normalize_directory_suffix("server1host:/home/kimn/Landing_Zone/Illumina_TransferTest") == "Illumina_TransferTest"
+    assert pts.normalize_directory_suffix("/data/run:1/sample/") == "sample"
 
 
 def test_main_skips_report_without_pandas(monkeypatch, capsys):
@@ -67,6 +68,14 @@ def test_main_skips_report_without_pandas(monkeypatch, capsys):
     assert "landingzones[report]" in captured.err
 
 
+def test_pandas_is_loaded_on_first_use(monkeypatch):
+    """The deferred pandas placeholder should resolve to the real module."""
+    monkeypatch.setattr(pts, "pd", pts._DeferredPandas())
+
+    assert pts.pd.Timedelta is pd.Timedelta
+    assert pts.pd is pd
+
+
 def test_main_skips_report_when_input_is_missing(tmp_path, capsys):
     """Missing report input should be an operator message, not argparse usage."""
     config_file = tmp_path / "config.yaml"
@@ -411,6 +420,21 @@ def test_aggregate_runs_assigns_expected_health_states():
     assert by_run.loc["beta", "tags"] == "lab,side-flow"
 
 
+def test_aggregate_runs_reads_first_and_latest_initiated_times():
+    log_df = make_log_df()
+    runs_df = pts.aggregate_runs(
+        log_df,
+        terminal_identifiers=["pullback"],
+        anchor_time=log_df["datetime"].max(),
+        warning_hours=2,
+    )
+
+    by_run = runs_df.set_index("run")
+    assert by_run.loc["alpha", "started_at"] == pd.Timestamp("2026-04-09 09:00:00+0200")
+    assert by_run.loc["alpha", "latest_start"] == pd.Timestamp("2026-04-09 09:30:00+0200")
+    assert by_run.loc["beta", "started_at"] == by_run.loc["beta", "latest_start"]
+
+
 def test_filter_runs_by_tags_matches_any_requested_tag():
     log_df = make_log_df()
     runs_df = pts.aggregate_runs(
@@ -4,6 +4,7 @@
 
 import os
 import subprocess
+import sys
 import yaml
 
 
@@ -66,6 +67,7 @@ def test_python_standalone_build_script_contains_launcher_and_bundle_steps():
     assert "WHEELHOUSE" in script_text
     assert '"--target"' in script_text
     assert 'exec "$PYTHON_BIN" -m landingzones.cli' in script_text
+    assert '"-m", "compileall"' in script_text
     assert 'tarfile.open(archive_path, "w:gz")' in script_text
 
 
@@ -89,6 +91,33 @@ def test_base_package_does_not_require_pandas():
     assert "report = [" in pyproject_text
 
 
+def test_cron_generation_path_does_not_import_pandas(tmp_path):
+    """Parsing transfers.tsv for cron generation should stay pandas-free."""
+    transfers_file = tmp_path / "transfers.tsv"
+    transfers_file.write_text(
+        "identifiers\tsystem\tusers\tsource\tdestination\tlog_file\tflock_file\n"
+        "sample\tserver1\trunner\t/srv/src/\t/srv/dst/\t/tmp/sample.log\t/tmp/sample.lock\n"
+    )
+    script = (
+        "import sys\n"
+        "from landingzones import generate_cron_files as gcf\n"
+        "gcf.parse_transfers_file(sys.argv[1])\n"
+        "print('pandas' in sys.modules)\n"
+    )
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.path.join(APP_ROOT, "src")
+    proc = subprocess.run(
+        [sys.executable, "-c", script, str(transfers_file)],
+        cwd=str(tmp_path),
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip() == "False"
+
+
 def test_github_action_builds_and_uploads_standalone_bundle():
     """The GitHub workflow should publish the standalone tarball as an artifact."""
     workflow_path = os.path.join(
@@ -13,6 +13,7 @@ from landingzones.transfer_catalog import (
     load_runtime_transfer_catalog,
     load_runtime_transfer_definitions,
 )
+from landingzones.transfer_loading import filter_transfers_by_system_user
 
 
 def test_runtime_catalog_preserves_build_loading_invariants(tmp_path):
@@ -482,3 +483,37 @@ def test_reporting_catalog_exposes_normalized_definitions_and_keeps_dataframe_co
     assert catalog.iloc[0]["notify_on_error"] == "FALSE"
     assert catalog.iloc[0]["tags"] == "heartbeat,lab"
     assert catalog.iloc[0]["destination_port"] == "2200"
+
+
+def test_system_user_filter_keeps_table_type_and_attrs():
+    """Filtering a TransferTable by system/user returns a TransferTable."""
+    rows = [
+        {"system": "server1", "users": "runner", "runtime_id": "one"},
+        {"system": "server1", "users": "other", "runtime_id": "two"},
+        {"system": "server2", "users": "runner", "runtime_id": "three"},
+    ]
+    table = TransferTable(rows, columns=["system", "users", "runtime_id"])
+    table.attrs["shared_file_pair_warnings"] = ["kept"]
+
+    filtered = filter_transfers_by_system_user(table, "server1", "runner")
+
+    assert isinstance(filtered, TransferTable)
+    assert filtered["runtime_id"].tolist() == ["one"]
+    assert filtered.columns == ["system", "users", "runtime_id"]
+    assert filtered.attrs == {"shared_file_pair_warnings": ["kept"]}
+
+
+def test_system_user_filter_treats_missing_users_as_blank():
+    """Rows without a users value match '' like the column lookup does."""
+    table = TransferTable(
+        [
+            {"system": "server1", "runtime_id": "one"},
+            {"system": "server1", "users": "runner", "runtime_id": "two"},
+        ],
+        columns=["system", "users", "runtime_id"],
+    )
+
+    filtered = filter_transfers_by_system_user(table, "server1", "")
+
+    assert filtered["runtime_id"].tolist() == ["one"]
+    assert filtered["users"].tolist() == [""]
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Test suite for _yaml_cache.py"""
+
+import json
+import os
+
+from landingzones import _yaml_cache
+
+
+class TestLoadYamlFile:
+    """Test the JSON sidecar cache around YAML parsing"""
+
+    def test_writes_versioned_sidecar(self, tmp_path):
+        """Parsing a YAML file should leave a JSON sidecar next to it."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("log_dir: from_yaml\n")
+
+        result = _yaml_cache.load_yaml_file(str(config_file))
+
+        sidecar = _yaml_cache.sidecar_path(str(config_file))
+        assert result == {'log_dir': 'from_yaml'}
+        assert sidecar.endswith('.{0}.json'.format(_yaml_cache.__version__))
+        with open(sidecar) as f:
+            assert json.load(f)['data'] == {'log_dir': 'from_yaml'}
+
+    def test_reads_current_sidecar_without_parsing_yaml(self, tmp_path, monkeypatch):
+        """A sidecar matching the YAML mtime and size should skip YAML parsing."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("log_dir: from_yaml\n")
+        _yaml_cache.load_yaml_file(str(config_file))
+
+        def fail_load(*args, **kwargs):
+            raise AssertionError("YAML should not be parsed")
+
+        monkeypatch.setattr(_yaml_cache.yaml, 'load', fail_load)
+
+        assert _yaml_cache.load_yaml_file(str(config_file)) == {'log_dir': 'from_yaml'}
+
+    def test_changed_yaml_invalidates_sidecar(self, tmp_path):
+        """Editing the YAML file should be picked up on the next load."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("log_dir: old\n")
+        _yaml_cache.load_yaml_file(str(config_file))
+
+        config_file.write_text("log_dir: updated\n")
+        stat = os.stat(str(config_file))
+        os.utime(str(config_file), ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+
+        assert _yaml_cache.load_yaml_file(str(config_file)) == {'log_dir': 'updated'}
+
+    def test_utf8_yaml_is_read_as_text_values(self, tmp_path):
+        """Non-ASCII YAML read as bytes should still produce str values."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_bytes("log_dir: /srv/l\u00f8g\n".encode('utf-8'))
+
+        assert _yaml_cache.load_yaml_file(str(config_file)) == {'log_dir': '/srv/l\u00f8g'}
+
+    def test_comment_only_file_skips_yaml_parser(self, tmp_path, monkeypatch):
+        """Blank and comment-only files should load as None without parsing."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("# only a comment\n\n   # indented comment\n")
+
+        def fail_load(*args, **kwargs):
+            raise AssertionError("YAML should not be parsed")
+
+        monkeypatch.setattr(_yaml_cache.yaml, 'load', fail_load)
+
+        assert _yaml_cache.load_yaml_file(str(config_file)) is None
+        assert _yaml_cache.ParserCache().parse_string("\n# note\n") is None
+        assert not os.path.exists(_yaml_cache.sidecar_path(str(config_file)))
+
+    def test_non_json_values_are_not_cached(self, tmp_path):
+        """YAML values that JSON cannot represent should bypass the sidecar."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("started: 2024-01-02\n")
+
+        result = _yaml_cache.load_yaml_file(str(config_file))
+
+        assert str(result['started']) == '2024-01-02'
+        assert not os.path.exists(_yaml_cache.sidecar_path(str(config_file)))
+
+    def test_unwritable_directory_still_loads(self, tmp_path, monkeypatch):
+        """Failing to write the sidecar should not fail the config load."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("log_dir: from_yaml\n")
+
+        def fail_mkstemp(*args, **kwargs):
+            raise OSError("read-only")
+
+        monkeypatch.setattr(_yaml_cache.tempfile, 'mkstemp', fail_mkstemp)
+
+        assert _yaml_cache.load_yaml_file(str(config_file)) == {'log_dir': 'from_yaml'}
+        assert not os.path.exists(_yaml_cache.sidecar_path(str(config_file)))
+
+
+class TestParserCache:
+    """Test the in-process parser cache"""
+
+    def test_repeat_file_loads_skip_parsing(self, tmp_path, monkeypatch):
+        """An unchanged file should be parsed once per cache."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("log_dir: from_yaml\n")
+        cache = _yaml_cache.ParserCache()
+        calls = []
+        real_load = _yaml_cache._load_yaml_file
+
+        def counting_load(path, source_stat):
+            calls.append(path)
+            return real_load(path, source_stat)
+
+        monkeypatch.setattr(_yaml_cache, '_load_yaml_file', counting_load)
+
+        assert cache.parse_file(str(config_file)) == {'log_dir': 'from_yaml'}
+        assert cache.parse_file(str(config_file)) == {'log_dir': 'from_yaml'}
+        assert len(calls) == 1
+
+    def test_results_are_isolated_from_cache(self):
+        """Mutating a returned document should not change later results."""
+        cache = _yaml_cache.ParserCache()
+        first = cache.parse_string("runtime_ids:\n  - one.local\n")
+        first['runtime_ids'].append('mutated.local')
+
+        assert cache.parse_string("runtime_ids:\n  - one.local\n") == {
+            'runtime_ids': ['one.local'],
+        }
+
+    def test_evicts_least_recently_used(self):
+        """The cache should stay bounded by maxsize."""
+        cache = _yaml_cache.ParserCache(maxsize=2)
+        cache.parse_string("a: 1\n")
+        cache.parse_string("b: 2\n")
+        cache.parse_string("a: 1\n")
+        cache.parse_string("c: 3\n")
+
+        assert len(cache._entries) == 2
+        assert cache.parse_string("a: 1\n") == {'a': 1}